@@ -13,7 +13,7 @@ import os
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse, StreamingResponse
 
 from backend.api.error_handler import api_error_handler, validate_json_blocks
@@ -34,7 +34,14 @@ from backend.services.language_detect import (
     detect_document_languages,
     resolve_source_language,
 )
+from backend.services.translate_cancel import (
+    TranslationCancelled,
+    iter_job_events,
+    register_job,
+    unregister_job,
+)
 from backend.services.translate_llm import translate_blocks_async
+from backend.services.translate_selector import apply_skip_target_override
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,7 +56,7 @@ async def docx_extract(file: UploadFile = File(...)) -> dict:
 
     docx_bytes = await file.read()  # File read handled by decorator
 
-    data = extract_docx_blocks(docx_bytes)
+    data = await asyncio.to_thread(extract_docx_blocks, docx_bytes)
     blocks = data["blocks"]
     return {
         "blocks": blocks,
@@ -169,6 +176,7 @@ async def docx_delete_history(filename: str):
 
 @router.post("/translate-stream")
 async def docx_translate_stream(  # noqa: C901
+    request: Request,
     blocks: str = Form(...),
     source_language: str | None = Form(None),
     target_language: str | None = Form(None),
@@ -185,6 +193,7 @@ async def docx_translate_stream(  # noqa: C901
     refresh: bool = Form(False),
     completed_ids: str | None = Form(None),
     similarity_threshold: float = Form(0.75),
+    skip_target_language: bool | None = Form(None),
 ) -> StreamingResponse:
     """Translate text blocks and stream progress via SSE."""
     try:
@@ -199,7 +208,10 @@ async def docx_translate_stream(  # noqa: C901
         blocks_data,
         source_language,
     )
-    param_overrides = {"refresh": refresh}
+    # slide_index holds the paragraph index, so VI/ZH paragraph pairs
+    # would never share a "slide".
+    param_overrides = {"refresh": refresh, "align_within_slide": False}
+    apply_skip_target_override(param_overrides, mode, skip_target_language)
 
     # 解析已完成的 ID 列表
     completed_id_set = set()
@@ -222,6 +234,8 @@ async def docx_translate_stream(  # noqa: C901
     ) -> list[dict]:
         return prepare_blocks_for_correction(items, target_lang)
 
+    job = register_job()
+
     async def event_generator():
         queue = asyncio.Queue()
 
@@ -233,6 +247,7 @@ async def docx_translate_stream(  # noqa: C901
         try:
             # yield initial progress
             initial_payload = {
+                "job_id": job.job_id,
                 "chunk_index": 0,
                 "completed_indices": [],
                 "chunk_size": 0,
@@ -264,46 +279,35 @@ async def docx_translate_stream(  # noqa: C901
                     smart_layout=smart_layout,
                     param_overrides=param_overrides,
                     on_progress=progress_cb,
+                    cancel_token=job.token,
                 )
             )
 
-            while True:
-                get_queue_task = asyncio.create_task(queue.get())
-                done, pending = await asyncio.wait(
-                    [get_queue_task, task], return_when=asyncio.FIRST_COMPLETED
+            async for event in iter_job_events(request, job, task, queue):
+                yield event
+
+            if not task.done() or task.cancelled():
+                return
+
+            result = await task
+            if mode == "correction":
+                translated_texts = [
+                    b.get("translated_text", "")
+                    for b in result.get("blocks", [])
+                ]
+                result["blocks"] = apply_correction_mode(
+                    effective_blocks,
+                    translated_texts,
+                    target_language,
+                    similarity_threshold=similarity_threshold,
                 )
-
-                if get_queue_task in done:
-                    event = get_queue_task.result()
-                    yield (
-                        f"event: {event['event']}\n"
-                        f"data: {event['data']}\n\n"
-                    )
-                else:
-                    get_queue_task.cancel()
-
-                if task in done:
-                    while not queue.empty():
-                        event = queue.get_nowait()
-                        yield (
-                            f"event: {event['event']}\n"
-                            f"data: {event['data']}\n\n"
-                        )
-                    result = await task
-                    if mode == "correction":
-                        translated_texts = [
-                            b.get("translated_text", "")
-                            for b in result.get("blocks", [])
-                        ]
-                        result["blocks"] = apply_correction_mode(
-                            effective_blocks,
-                            translated_texts,
-                            target_language,
-                            similarity_threshold=similarity_threshold,
-                        )
-                    yield f"event: complete\ndata: {json.dumps(result)}\n\n"
-                    break
+            yield f"event: complete\ndata: {json.dumps(result)}\n\n"
+        except TranslationCancelled:
+            detail = json.dumps({"job_id": job.job_id, "detail": "cancelled"})
+            yield f"event: cancelled\ndata: {detail}\n\n"
         except Exception as exc:
             yield f"event: error\ndata: {json.dumps({'detail': str(exc)})}\n\n"
+        finally:
+            unregister_job(job.job_id)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Form, HTTPException
 
+from backend.services.llm_autotune import get_autotune_profiles
+from backend.services.llm_circuit import get_circuit_states
 from backend.services.llm_errors import (
     build_connection_refused_message,
     is_connection_refused,
@@ -11,6 +13,7 @@ from backend.services.llm_models import (
     list_ollama_models,
     list_openai_models,
 )
+from backend.services.llm_schema import get_structured_output_stats
 
 router = APIRouter(prefix="/api/llm")
 
@@ -58,3 +61,21 @@ async def llm_models(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return {"models": models}
+
+
+@router.get("/circuits")
+async def llm_circuits() -> dict:
+    """Return the circuit breaker state of every LLM endpoint seen so far."""
+    return {"circuits": get_circuit_states()}
+
+
+@router.get("/structured-output")
+async def llm_structured_output() -> dict:
+    """Return the schema success rate per provider/model."""
+    return {"models": get_structured_output_stats()}
+
+
+@router.get("/autotune")
+async def llm_autotune() -> dict:
+    """Return the tuned chunk size/concurrency and telemetry per model."""
+    return {"profiles": get_autotune_profiles()}
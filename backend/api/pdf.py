@@ -1,9 +1,10 @@
+import asyncio
 import json
 import os
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse
 
 from backend.api.pptx_naming import generate_semantic_filename_with_ext
@@ -32,7 +33,7 @@ async def pdf_extract(file: UploadFile = File(...)) -> dict:
         input_path = os.path.join(temp_dir, "input.pdf")
         with open(input_path, "wb") as h:
             h.write(pdf_bytes)
-        data = extract_pdf_blocks(input_path)
+        data = await asyncio.to_thread(extract_pdf_blocks, input_path)
         blocks = data["blocks"]
 
     return {
@@ -128,6 +129,7 @@ async def pdf_download(filename: str):
 
 @router.post("/translate-stream")
 async def pdf_translate_stream(
+    request: Request,
     blocks: str = Form(...),
     source_language: str | None = Form(None),
     target_language: str | None = Form(None),
@@ -144,9 +146,12 @@ async def pdf_translate_stream(
     refresh: bool = Form(False),
     completed_ids: str | None = Form(None),
     similarity_threshold: float = Form(0.75),
+    priority: str | None = Form(None),
+    skip_target_language: bool | None = Form(None),
 ):
     """Reuse the core PPTX streaming translation logic for PDF."""
     return await pptx_translate_stream(
+        request=request,
         blocks=blocks,
         source_language=source_language,
         target_language=target_language,
@@ -163,4 +168,6 @@ async def pdf_translate_stream(
         refresh=refresh,
         completed_ids=completed_ids,
         similarity_threshold=similarity_threshold,
+        priority=priority,
+        skip_target_language=skip_target_language,
     )
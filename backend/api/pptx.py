@@ -6,6 +6,7 @@ application of translated content, and language detection.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import tempfile
@@ -39,7 +40,8 @@ async def pptx_extract(file: UploadFile = File(...)) -> dict:
         input_path = os.path.join(temp_dir, "input.pptx")
         with open(input_path, "wb") as h:
             h.write(pptx_bytes)
-        data = extract_pptx_blocks(input_path)
+        # Off the event loop; large decks fan out to extraction workers.
+        data = await asyncio.to_thread(extract_pptx_blocks, input_path)
         blocks = data["blocks"]
         sw = data["slide_width"]
         sh = data["slide_height"]
@@ -61,7 +63,7 @@ async def pptx_languages(file: UploadFile = File(...)) -> dict:
         input_path = os.path.join(temp_dir, "input.pptx")
         with open(input_path, "wb") as h:
             h.write(pptx_bytes)
-        blocks = extract_pptx_blocks(input_path)["blocks"]
+        blocks = (await asyncio.to_thread(extract_pptx_blocks, input_path))["blocks"]
     return {"language_summary": detect_document_languages(blocks)}
 
 
@@ -12,7 +12,7 @@ import re
 import time
 from pathlib import Path
 
-from fastapi import APIRouter, Form, HTTPException
+from fastapi import APIRouter, Form, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from backend.config import settings
@@ -26,9 +26,22 @@ from backend.services.llm_errors import (
     build_connection_refused_message,
     is_connection_refused,
 )
+from backend.services.translate_cancel import (
+    TranslationCancelled,
+    cancel_job,
+    get_job,
+    iter_job_events,
+    register_job,
+    unregister_job,
+)
 from backend.services.translate_llm import (
     translate_blocks_async as translate_pptx_blocks_async,
 )
+from backend.services.translate_priority import (
+    parse_priority_hint,
+    update_priority_hint,
+)
+from backend.services.translate_selector import apply_skip_target_override
 
 LOGGER = logging.getLogger(__name__)
 VI_REGEX = re.compile(
@@ -50,6 +63,39 @@ def _prepare_blocks_for_correction(
     return prepare_blocks_for_correction(items, target_language)
 
 
+@router.post("/translate-cancel")
+async def pptx_translate_cancel(job_id: str = Form(...)) -> dict:
+    """Cancel a running streaming translation job."""
+    if not cancel_job(job_id):
+        raise HTTPException(status_code=404, detail="找不到翻譯工作")
+    return {"status": "cancelled", "job_id": job_id}
+
+
+@router.post("/translate-reprioritize")
+async def pptx_translate_reprioritize(
+    job_id: str = Form(...),
+    priority: str = Form(...),
+) -> dict:
+    """Update the priority hint of a running streaming job.
+
+    Chunks that have not started yet are re-ranked; running chunks are
+    left alone.
+    """
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="找不到翻譯工作")
+    if job.priority is None:
+        raise HTTPException(
+            status_code=409,
+            detail="此翻譯工作未啟用優先順序，請在開始翻譯時提供 priority",
+        )
+    try:
+        update_priority_hint(job.priority, priority)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"status": "reprioritized", "job_id": job_id}
+
+
 @router.post("/translate")
 async def pptx_translate(
     blocks: str = Form(...),
@@ -68,6 +114,7 @@ async def pptx_translate(
     smart_layout: bool = Form(True),
     refresh: bool = Form(False),
     similarity_threshold: float = Form(0.75),
+    skip_target_language: bool | None = Form(None),
 ) -> dict:
     """Translate text blocks using LLM."""
     llm_mode = settings.translate_llm_mode
@@ -98,6 +145,7 @@ async def pptx_translate(
                 "chunk_delay": 0.0,
             }
         )
+    apply_skip_target_override(param_overrides, mode, skip_target_language)
 
     try:
         translated = await translate_pptx_blocks_async(
@@ -162,6 +210,7 @@ async def pptx_translate(
 
 @router.post("/translate-stream")
 async def pptx_translate_stream(  # noqa: C901
+    request: Request,
     blocks: str = Form(...),
     source_language: str | None = Form(None),
     target_language: str | None = Form(None),
@@ -178,8 +227,19 @@ async def pptx_translate_stream(  # noqa: C901
     refresh: bool = Form(False),
     completed_ids: str | None = Form(None),
     similarity_threshold: float = Form(0.75),
+    priority: str | None = Form(None),
+    skip_target_language: bool | None = Form(None),
 ) -> StreamingResponse:
-    """Translate text blocks and stream progress via SSE."""
+    """Translate text blocks and stream progress via SSE.
+
+    ``priority`` (``{"slides": [start, end], "client_ids": [...]}``) makes
+    the matching blocks translate first; it can be changed mid-job via
+    ``/translate-reprioritize``.
+
+    With ``skip_target_language`` (or ``LLM_SKIP_TARGET_LANGUAGE``) blocks
+    already in the target language are passed through; the first progress
+    event for them carries ``skipped_target_language``.
+    """
     # 解析已完成的 ID 列表
     completed_id_set = set()
     if completed_ids:
@@ -202,6 +262,11 @@ async def pptx_translate_stream(  # noqa: C901
     if not target_language:
         raise HTTPException(status_code=400, detail="target_language 為必填")
 
+    try:
+        priority_hint = parse_priority_hint(priority)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     resolved_source_language = resolve_source_language(
         blocks_data,
         source_language,
@@ -216,6 +281,7 @@ async def pptx_translate_stream(  # noqa: C901
                 "chunk_delay": 0.0,
             }
         )
+    apply_skip_target_override(param_overrides, mode, skip_target_language)
 
     # 執行過濾：跳過已翻譯且不在 refresh 模式下的區塊
     effective_blocks = []
@@ -242,6 +308,9 @@ async def pptx_translate_stream(  # noqa: C901
             skipped_count,
         )
 
+    job = register_job()
+    job.priority = priority_hint
+
     async def event_generator():
         queue = asyncio.Queue()
 
@@ -256,6 +325,7 @@ async def pptx_translate_stream(  # noqa: C901
             # initialization.
             initial_data = json.dumps(
                 {
+                    "job_id": job.job_id,
                     "chunk_index": 0,
                     "completed_indices": [],
                     "chunk_size": 0,
@@ -286,68 +356,56 @@ async def pptx_translate_stream(  # noqa: C901
                     param_overrides={**param_overrides, "refresh": refresh},
                     on_progress=progress_cb,
                     mode=mode,
+                    cancel_token=job.token,
+                    priority=job.priority,
                 )
             )
 
-            while True:
-                get_queue_task = asyncio.create_task(queue.get())
-                done, pending = await asyncio.wait(
-                    [get_queue_task, task], return_when=asyncio.FIRST_COMPLETED
+            async for event in iter_job_events(request, job, task, queue):
+                yield event
+
+            if not task.done() or task.cancelled():
+                # Client went away; nothing left to report.
+                return
+
+            result = await task
+            if mode == "correction":
+                translated_texts = [
+                    b.get("translated_text", "")
+                    for b in result.get("blocks", [])
+                ]
+                result["blocks"] = apply_correction_mode(
+                    effective_blocks,
+                    translated_texts,
+                    target_language,
+                    similarity_threshold=similarity_threshold,
                 )
-
-                if get_queue_task in done:
-                    event = get_queue_task.result()
-                    yield (
-                        f"event: {event['event']}\n"
-                        f"data: {event['data']}\n\n"
-                    )
-                else:
-                    get_queue_task.cancel()
-
-                if task in done:
-                    # Flush any remaining items in queue regardless of
-                    # task status.
-                    while not queue.empty():
-                        event = queue.get_nowait()
-                        yield (
-                            f"event: {event['event']}\n"
-                            f"data: {event['data']}\n\n"
-                        )
-
-                    result = await task
-                    if mode == "correction":
-                        translated_texts = [
-                            b.get("translated_text", "")
-                            for b in result.get("blocks", [])
-                        ]
-                        result["blocks"] = apply_correction_mode(
-                            effective_blocks,
-                            translated_texts,
-                            target_language,
-                            similarity_threshold=similarity_threshold,
-                        )
-                    yield f"event: complete\ndata: {json.dumps(result)}\n\n"
-
-                    # Auto-save to history (JSON only) for immediate visibility
-                    try:
-                        export_dir = Path("data/exports")
-                        export_dir.mkdir(parents=True, exist_ok=True)
-                        ts = time.strftime("%Y%m%d-%H%M%S")
-                        filename = f"autosave-{mode}-{ts}.json"
-                        with open(
-                            export_dir / filename,
-                            "w",
-                            encoding="utf-8",
-                        ) as f:
-                            json.dump(result, f, ensure_ascii=False, indent=2)
-                        LOGGER.info("Auto-saved history to %s", filename)
-                    except Exception as err:
-                        LOGGER.error("Failed to auto-save history: %s", err)
-
-                    break
-
+            yield f"event: complete\ndata: {json.dumps(result)}\n\n"
+
+            # Auto-save to history (JSON only) for immediate visibility
+            try:
+                export_dir = Path("data/exports")
+                export_dir.mkdir(parents=True, exist_ok=True)
+                ts = time.strftime("%Y%m%d-%H%M%S")
+                filename = f"autosave-{mode}-{ts}.json"
+                with open(
+                    export_dir / filename,
+                    "w",
+                    encoding="utf-8",
+                ) as f:
+                    json.dump(result, f, ensure_ascii=False, indent=2)
+                LOGGER.info("Auto-saved history to %s", filename)
+            except Exception as err:
+                LOGGER.error("Failed to auto-save history: %s", err)
+
+        except TranslationCancelled:
+            LOGGER.info("Translation stream %s cancelled", job.job_id)
+            detail = json.dumps({"job_id": job.job_id, "detail": "cancelled"})
+            yield f"event: cancelled\ndata: {detail}\n\n"
         except Exception as exc:
             LOGGER.exception("Translation stream error")
             yield f"event: error\ndata: {json.dumps({'detail': str(exc)})}\n\n"
+        finally:
+            unregister_job(job.job_id)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
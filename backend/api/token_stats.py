@@ -6,11 +6,14 @@ Endpoints for retrieving token usage statistics.
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
 
+from backend.services.token_estimator import get_token_estimator
 from backend.services.token_tracker import (
     estimate_tokens,
     get_all_time_stats,
+    get_prompt_compaction_stats,
     get_session_stats,
     record_usage,
 )
@@ -21,7 +24,11 @@ router = APIRouter(prefix="/api/token-stats")
 @router.get("")
 async def get_token_stats() -> dict:
     """Get token usage statistics."""
-    return {"session": get_session_stats(), "all_time": get_all_time_stats()}
+    return {
+        "session": get_session_stats(),
+        "all_time": get_all_time_stats(),
+        "prompt_compaction": get_prompt_compaction_stats(),
+    }
 
 
 @router.post("/record")
@@ -31,6 +38,7 @@ async def record_token_usage(
     prompt_tokens: int,
     completion_tokens: int,
     operation: str = "translate",
+    cached_tokens: int = 0,
 ) -> dict:
     """Manually record token usage (for testing or external tracking)."""
     usage = record_usage(
@@ -39,6 +47,7 @@ async def record_token_usage(
         prompt_tokens,
         completion_tokens,
         operation,
+        cached_tokens=cached_tokens,
     )
     return {
         "recorded": True,
@@ -49,8 +58,42 @@ async def record_token_usage(
     }
 
 
+class EstimateRequest(BaseModel):
+    texts: list[str]
+    model: str | None = None
+
+
 @router.post("/estimate")
-async def estimate_token_count(text: str, provider: str = "openai") -> dict:
-    """Estimate token count for given text."""
-    count = estimate_tokens(text, provider)
-    return {"estimated_tokens": count, "text_length": len(text)}
+async def estimate_token_count(
+    text: str | None = None,
+    provider: str = "openai",
+    model: str | None = None,
+    request: EstimateRequest | None = None,
+) -> dict:
+    """Estimate token count for a text or, in the JSON body, a block list.
+
+    Counts come from the estimator calibrated for ``model``; the flat
+    chars/4 estimate is returned alongside for comparison.
+    """
+    estimator = get_token_estimator()
+    if request is not None:
+        counts = estimator.estimate(request.texts, request.model).tolist()
+        return {
+            "estimated_tokens": counts,
+            "total_tokens": sum(counts),
+            "model": request.model,
+        }
+    if text is None:
+        raise HTTPException(status_code=400, detail="text 或 texts 為必填")
+    return {
+        "estimated_tokens": estimator.estimate_text(text, model),
+        "flat_estimate": estimate_tokens(text, provider),
+        "text_length": len(text),
+        "model": model,
+    }
+
+
+@router.get("/calibration")
+async def get_token_calibration() -> dict:
+    """Calibrated tokens-per-character rates per model."""
+    return {"models": get_token_estimator().snapshot()}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse
 
 from backend.api.error_handler import api_error_handler, validate_json_blocks
@@ -27,7 +28,7 @@ async def xlsx_extract(file: UploadFile = File(...)) -> dict:
         input_path = os.path.join(temp_dir, "input.xlsx")
         with open(input_path, "wb") as h:
             h.write(xlsx_bytes)
-        data = extract_xlsx_blocks(input_path)
+        data = await asyncio.to_thread(extract_xlsx_blocks, input_path)
         blocks = data["blocks"]
 
     return {
@@ -124,6 +125,7 @@ async def xlsx_download(filename: str):
 
 @router.post("/translate-stream")
 async def xlsx_translate_stream(
+    request: Request,
     blocks: str = Form(...),
     source_language: str | None = Form(None),
     target_language: str | None = Form(None),
@@ -140,9 +142,12 @@ async def xlsx_translate_stream(
     refresh: bool = Form(False),
     completed_ids: str | None = Form(None),
     similarity_threshold: float = Form(0.75),
+    priority: str | None = Form(None),
+    skip_target_language: bool | None = Form(None),
 ):
     """Reuse the core PPTX streaming translation logic for XLSX."""
     return await pptx_translate_stream(
+        request=request,
         blocks=blocks,
         source_language=source_language,
         target_language=target_language,
@@ -159,4 +164,6 @@ async def xlsx_translate_stream(
         refresh=refresh,
         completed_ids=completed_ids,
         similarity_threshold=similarity_threshold,
+        priority=priority,
+        skip_target_language=skip_target_language,
     )
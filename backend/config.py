@@ -10,6 +10,7 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
 
     # Ollama Configuration
+    # Comma-separated list for multiple hosts
     ollama_base_url: str = "http://ollama:11434"
     ollama_model: str = "qwen2.5:7b"
     ollama_timeout: int = 180
@@ -18,6 +19,11 @@ class Settings(BaseSettings):
     ollama_num_ctx: int | None = None
     ollama_num_thread: int | None = None
     ollama_force_gpu: bool = False
+    # "30m", "-1" (forever) or "0" (unload); empty leaves the server default
+    ollama_keep_alive: str = "30m"
+    ollama_warmup_enabled: bool = True
+    ollama_warmup_interval: float = 600.0
+    ollama_health_interval: float = 30.0
 
     # Gemini Configuration
     gemini_api_key: str | None = None
@@ -33,17 +39,73 @@ class Settings(BaseSettings):
 
     # Translation Settings
     source_language: str = "auto"
+    # Memory budget of the language detection cache
+    language_detect_cache_bytes: int = 8 * 1024 * 1024
     llm_context_strategy: str = "none"
+    llm_context_max_tokens: int = 512
+    # Deck summary for the "summary" strategy: extractive or llm
+    llm_context_summary_method: str = "extractive"
+    llm_context_summary_tokens: int = 160
     llm_glossary_path: str | None = None
     llm_fallback_on_error: bool = False
+    # Secondary providers tried after retries, e.g. "ollama:120,openai:60"
+    llm_failover_chain: str = ""
+    llm_hedge_enabled: bool = False
+    llm_hedge_min_samples: int = 20
+    llm_circuit_enabled: bool = True
+    llm_circuit_failure_threshold: int = 5
+    llm_circuit_reset_seconds: float = 30.0
+    llm_prompt_compact: bool = False
+    # JSON Schema output (Ollama format / Gemini responseSchema)
+    llm_structured_output: bool = False
+    # Pass through blocks already in the target language (direct/bilingual;
+    # opt-in, or per request via skip_target_language)
+    llm_skip_target_language: bool = False
+    # Minimum share of target-script letters for a block to pass through
+    llm_skip_target_confidence: float = 0.9
+    # Translate strings differing only in numbers/dates/amounts once (opt-in)
+    llm_numeric_templates: bool = False
+    # Only pair bilingual [source, target] blocks on the same slide/region
+    # (opt-in; off pairs any adjacent blocks as before)
+    llm_align_within_slide: bool = False
+    # Strict language retry only when this share of non-neutral blocks is off
+    llm_language_retry_min_ratio: float = 0.2
 
     # Performance / Rate Limiting
     llm_single_request: bool = True
     llm_chunk_size: int = 40
+    # Also close a chunk at this many estimated source tokens (0 = off)
+    llm_chunk_max_tokens: int = 0
     llm_max_retries: int = 2
     llm_retry_backoff: float = 0.8
     llm_retry_max_backoff: float = 8.0
     llm_chunk_delay: float = 0.0
+    # Parallel chunks for prioritized streaming jobs (Ollama is capped at 2)
+    llm_stream_concurrency: int = 4
+    # Tune chunk size/concurrency per provider+model from recorded latency
+    llm_autotune_enabled: bool = False
+    # Keep predicted chunk latency under this fraction of the provider timeout
+    llm_autotune_timeout_risk: float = 0.5
+    llm_autotune_max_chunk_size: int = 120
+    llm_autotune_max_concurrency: int = 8
+
+    # Extraction
+    # PPTX extraction engine: "python-pptx" or "stream" (opt-in, lxml over
+    # the zip; also emits complex_graphic blocks for charts/SmartArt)
+    pptx_extract_engine: str = "python-pptx"
+    # XLSX extraction engine: "openpyxl" (one block per cell) or "stream"
+    # (opt-in: one block per distinct text with a ``cells`` list)
+    xlsx_extract_engine: str = "openpyxl"
+    # Processes for per-slide/sheet/page extraction (0 = CPU count, 1 = off)
+    extract_workers: int = 0
+    # Documents with fewer slides/sheets/pages are extracted in-process
+    extract_parallel_min_units: int = 16
+
+    # HTTP Connection Pool (shared by all LLM clients, caps are per host)
+    llm_http_max_connections: int = 20
+    llm_http_max_keepalive: int = 10
+    llm_http_keepalive_expiry: float = 30.0
+    llm_http2: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -2,7 +2,14 @@ from backend.contracts.pptx import (
     PPTXBlock,
     PPTXExtractResponse,
     coerce_blocks,
+    is_pass_through,
     make_block,
 )
 
-__all__ = ["PPTXBlock", "PPTXExtractResponse", "coerce_blocks", "make_block"]
+__all__ = [
+    "PPTXBlock",
+    "PPTXExtractResponse",
+    "coerce_blocks",
+    "is_pass_through",
+    "make_block",
+]
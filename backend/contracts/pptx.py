@@ -83,3 +83,12 @@ def coerce_blocks(blocks: Iterable[dict]) -> list[dict]:
         model = _model_validate(PPTXBlock, block)
         validated.append(_model_dump(model))
     return validated
+
+
+def is_pass_through(block: dict) -> bool:
+    """True if the block's translation is its source text (already in the
+    target language), so bilingual output must not repeat it."""
+    if block.get("pass_through"):
+        return True
+    translated = (block.get("translated_text") or "").strip()
+    return bool(translated) and translated == (block.get("source_text") or "").strip()
@@ -22,6 +22,14 @@ from backend.api import (
     token_stats_router,
     xlsx_router,
 )
+from backend.services.language_detect import warm_up_language_detector
+from backend.services.llm_circuit import OPEN, get_circuit_states
+from backend.services.llm_http import close_http_clients, init_http_clients
+from backend.services.ollama_pool import (
+    get_host_states,
+    start_maintenance,
+    stop_maintenance,
+)
 from backend.tools.logging_middleware import StructuredLoggingMiddleware
 
 app = FastAPI()
@@ -90,12 +98,35 @@ async def startup_event():
     Path("data/exports").mkdir(parents=True, exist_ok=True)
     # Start cleanup task
     asyncio.create_task(cleanup_exports_task())
+    # Shared keep-alive pools for LLM providers
+    init_http_clients()
+    # Load langdetect profiles before the first request needs them
+    asyncio.create_task(asyncio.to_thread(warm_up_language_detector))
+    # Health-check the Ollama hosts; the configured model is kept loaded
+    # when Ollama is the provider.
+    start_maintenance()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stop_maintenance()
+    await close_http_clients()
 
 
 @app.get("/health")
 def health_check():
-    """Health check endpoint for Docker/Kubernetes."""
-    return {"status": "ok"}
+    """Health check endpoint for Docker/Kubernetes.
+
+    LLM circuit states are reported for visibility; an open circuit marks
+    the service as degraded but does not fail the check.
+    """
+    circuits = get_circuit_states()
+    degraded = any(c["state"] == OPEN for c in circuits)
+    return {
+        "status": "degraded" if degraded else "ok",
+        "circuits": circuits,
+        "ollama_hosts": get_host_states(),
+    }
 
 
 if __name__ == "__main__":
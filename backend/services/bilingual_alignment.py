@@ -1,17 +1,49 @@
 import logging
-import uuid
 
-from backend.services.language_detect import detect_language
+from backend.services.block_analysis import block_languages
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _same_region(source: dict, target: dict) -> bool:
+    """True when two blocks sit on the same slide, stacked or side by side.
+
+    Geometry is only compared when both blocks carry a box; XLSX cells
+    have none and only need the same sheet. Only meaningful where
+    ``slide_index`` is a slide, page or sheet: DOCX stores the paragraph
+    index there, so the DOCX API turns the check off
+    (``align_within_slide``).
+    """
+    if source.get("slide_index") != target.get("slide_index"):
+        return False
+    if not (
+        source.get("width") and source.get("height")
+        and target.get("width") and target.get("height")
+    ):
+        return True
+    return _overlaps(source, target, "x", "width") or _overlaps(
+        source, target, "y", "height"
+    )
+
+
+def _overlaps(source: dict, target: dict, start: str, size: str) -> bool:
+    a, b = source.get(start, 0.0), target.get(start, 0.0)
+    return min(a + source[size], b + target[size]) > max(a, b)
+
+
 def align_bilingual_blocks(
     blocks: list[dict],
     source_lang: str,
     target_lang: str,
+    languages: list[str | None] | None = None,
+    within_slide: bool = False,
 ) -> list[dict]:
-    """Analyze blocks and mark [Source, Target] pairs for alignment."""
+    """Analyze blocks and mark [Source, Target] pairs for alignment.
+
+    ``languages`` holds the detected language per block; when omitted it
+    comes from the cached block analysis. With ``within_slide`` a pair
+    never spans two slides or two unrelated boxes.
+    """
     if (
         not source_lang
         or not target_lang
@@ -20,68 +52,56 @@ def align_bilingual_blocks(
     ):
         return blocks
 
+    langs = block_languages(blocks) if languages is None else languages
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
     processed = []
+    pairs = 0
     i = 0
     n = len(blocks)
 
     while i < n:
         curr = blocks[i]
-        curr_text = curr.get("source_text", "").strip()
-        if not curr_text:
-            processed.append(curr)
-            i += 1
-            continue
-
-        curr_lang = detect_language(curr_text)
-        LOGGER.info(
-            "[ALIGN] Block %d: lang=%s, text_prefix=%s",
-            i,
-            curr_lang,
-            curr_text[:20],
-        )
-
+        curr_lang = langs[i]
         # Check for pair: current is source_lang (or VI misdetected),
         # next is target_lang.
-        if i + 1 < n:
-            next_block = blocks[i + 1]
-            next_text = next_block.get("source_text", "").strip()
-            next_lang = detect_language(next_text)
-
-            # Robust pair detection:
-            # 1. source_lang followed by target_lang
-            # 2. Both are target_lang (often happens if VI is misdetected).
-            is_pair = (
-                (curr_lang == source_lang and next_lang == target_lang)
-                or (curr_lang == target_lang and next_lang == target_lang)
-            )
-
-            if is_pair:
-                pair_id = str(uuid.uuid4())[:8]
-                LOGGER.info(
-                    "[ALIGN] Detected potential bilingual pair %s "
-                    "at indices (%d, %d)",
+        # Robust pair detection:
+        # 1. source_lang followed by target_lang
+        # 2. Both are target_lang (often happens if VI is misdetected).
+        if (
+            i + 1 < n
+            and langs[i + 1] == target_lang
+            and curr_lang in (source_lang, target_lang)
+            and (not within_slide or _same_region(curr, blocks[i + 1]))
+        ):
+            curr_text = curr.get("source_text", "").strip()
+            pair_id = f"p{i}"
+            if debug:
+                LOGGER.debug(
+                    "[ALIGN] Pair %s at (%d, %d): lang=%s, text_prefix=%s",
                     pair_id,
                     i,
                     i + 1,
+                    curr_lang,
+                    curr_text[:20],
                 )
-
-                # Mark source block
-                source_meta = dict(curr)
-                source_meta["alignment_role"] = "source"
-                source_meta["alignment_pair_id"] = pair_id
-
-                # Mark target block
-                target_meta = dict(next_block)
-                target_meta["alignment_role"] = "target"
-                target_meta["alignment_pair_id"] = pair_id
-                target_meta["alignment_source"] = curr_text
-
-                processed.append(source_meta)
-                processed.append(target_meta)
-                i += 2
-                continue
+            processed.append(
+                {**curr, "alignment_role": "source", "alignment_pair_id": pair_id}
+            )
+            processed.append(
+                {
+                    **blocks[i + 1],
+                    "alignment_role": "target",
+                    "alignment_pair_id": pair_id,
+                    "alignment_source": curr_text,
+                }
+            )
+            pairs += 1
+            i += 2
+            continue
 
         processed.append(curr)
         i += 1
 
+    if pairs:
+        LOGGER.info("[ALIGN] %d bilingual pairs in %d blocks", pairs, n)
     return processed
@@ -0,0 +1,87 @@
+"""Single-pass block analysis.
+
+Every extracted block is analysed once: language of the whole text and of
+each line, and the script histogram. Analyses are kept server-side in an
+LRU cache keyed by the block's stripped ``source_text`` so that language
+summaries, bilingual alignment and correction mode read them back instead
+of detecting the same text again. Blocks themselves are left untouched,
+so API responses do not carry the analysis, and an edited block is simply
+a new key.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from backend.services.language_detect import detect_languages, script_histogram
+
+CACHE_SIZE = 50_000
+
+_LOCK = threading.Lock()
+_CACHE: OrderedDict[str, dict] = OrderedDict()
+
+
+def _block_text(block: dict) -> str:
+    return (block.get("source_text") or "").strip()
+
+
+def _split_lines(text: str) -> list[str]:
+    return [line for line in text.splitlines() if line.strip()]
+
+
+def block_analyses(blocks: Iterable[dict]) -> list[dict]:
+    """Analysis of every block, in order.
+
+    Languages of all texts not analysed yet and their lines are detected in
+    one batch.
+    """
+    texts = [_block_text(block) for block in blocks]
+    with _LOCK:
+        found = {text: _CACHE[text] for text in texts if text in _CACHE}
+    new_texts = list(dict.fromkeys(text for text in texts if text not in found))
+    if new_texts:
+        lines = [_split_lines(text) for text in new_texts]
+        langs = detect_languages(
+            new_texts + [line for text_lines in lines for line in text_lines]
+        )
+        offset = len(new_texts)
+        for text, text_lines, lang in zip(
+            new_texts, lines, langs[: len(new_texts)], strict=True
+        ):
+            found[text] = {
+                "language": lang,
+                "line_languages": langs[offset : offset + len(text_lines)],
+                "scripts": script_histogram(text),
+            }
+            offset += len(text_lines)
+    with _LOCK:
+        for text in texts:
+            _CACHE[text] = found[text]
+            _CACHE.move_to_end(text)
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return [found[text] for text in texts]
+
+
+def annotate_blocks(blocks: Iterable[dict]) -> list[dict]:
+    """Analyse blocks ahead of use (e.g. at extraction) and return them."""
+    blocks = list(blocks)
+    block_analyses(blocks)
+    return blocks
+
+
+def block_languages(blocks: Iterable[dict]) -> list[str | None]:
+    """Language of each block's stripped ``source_text``, reusing analyses."""
+    return [analysis["language"] for analysis in block_analyses(blocks)]
+
+
+def block_line_languages(blocks: Iterable[dict]) -> list[list[str | None]]:
+    """Languages of the non-empty lines of each block."""
+    return [analysis["line_languages"] for analysis in block_analyses(blocks)]
+
+
+def clear_analysis_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from difflib import SequenceMatcher
 
-from backend.services.language_detect import detect_language
+from backend.services.block_analysis import block_languages
+from backend.services.language_detect import _CJK_RE, _VI_DIACRITIC_RE
 
 VI_DIACRITIC_PATTERN = (
     r"[đĐàáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệìíỉĩị"
@@ -28,6 +30,138 @@ def _is_similar_text(a: str, b: str, threshold: float) -> bool:
     )
 
 
+class _PendingIndex:
+    """Pending correction candidates indexed by character counts.
+
+    ``SequenceMatcher.ratio`` never exceeds the share of characters two
+    texts have in common (its ``quick_ratio``). The inverted index gives
+    that bound for every candidate at once, so only candidates whose bound
+    reaches the threshold get a real ratio. They are scored best bound
+    first, stopping once no bound can beat the best score. The result is
+    the same candidate the full pairwise scan picks, ties going to the
+    earliest pending item.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self._items: dict[int, dict] = {}
+        self._next_id = 0
+        # char -> {item id: count} for normalized and CJK-only texts.
+        self._postings: dict[str, dict[int, int]] = {}
+        self._cjk_postings: dict[str, dict[int, int]] = {}
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def add(self, source_index: int, translated_text: str) -> None:
+        item_id = self._next_id
+        self._next_id += 1
+        item = {
+            "source_index": source_index,
+            "translated_text": translated_text,
+            "normalized_text": _normalize_text(translated_text),
+            "cjk_text": "".join(_CJK_RE.findall(translated_text)),
+        }
+        self._items[item_id] = item
+        _index_chars(self._postings, item_id, item["normalized_text"])
+        _index_chars(self._cjk_postings, item_id, item["cjk_text"])
+
+    def pop(self, item_id: int) -> dict:
+        item = self._items.pop(item_id)
+        _unindex_chars(self._postings, item_id, item["normalized_text"])
+        _unindex_chars(self._cjk_postings, item_id, item["cjk_text"])
+        return item
+
+    def best_match(self, source_text: str) -> int | None:
+        """Id of the pending item that best matches ``source_text``."""
+        normalized = _normalize_text(source_text)
+        bounds = self._bounds(normalized, self._postings, "normalized_text")
+        # Check 2: If source_text has Vietnamese, it might be compared
+        # against pure Target text using only the CJK parts.
+        src_cjk = ""
+        if _VI_DIACRITIC_RE.search(source_text):
+            src_cjk = "".join(_CJK_RE.findall(source_text))
+            cjk_bounds = self._bounds(src_cjk, self._cjk_postings, "cjk_text")
+            for item_id, bound in cjk_bounds.items():
+                bounds[item_id] = max(bounds.get(item_id, 0.0), bound)
+
+        # Identical texts pass even when the threshold exceeds 1.
+        cutoff = min(self.threshold, 1.0)
+        candidates = sorted(
+            (-bound, item_id) for item_id, bound in bounds.items() if bound >= cutoff
+        )
+        match_id = None
+        match_score = 0.0
+        for negative_bound, item_id in candidates:
+            if -negative_bound < match_score:
+                break
+            score = self._score(item_id, normalized, src_cjk)
+            if score is None:
+                continue
+            if score > match_score or (
+                score == match_score and match_id is not None and item_id < match_id
+            ):
+                match_score = score
+                match_id = item_id
+        return match_id
+
+    def _bounds(
+        self,
+        text: str,
+        postings: dict[str, dict[int, int]],
+        field: str,
+    ) -> dict[int, float]:
+        if not text:
+            return {}
+        shared: dict[int, int] = {}
+        for char, count in Counter(text).items():
+            for item_id, item_count in postings.get(char, {}).items():
+                shared[item_id] = shared.get(item_id, 0) + min(count, item_count)
+        return {
+            item_id: 2.0 * common / (len(text) + len(self._items[item_id][field]))
+            for item_id, common in shared.items()
+        }
+
+    def _score(self, item_id: int, normalized: str, src_cjk: str) -> float | None:
+        item = self._items[item_id]
+        # Check 1: Normal similarity
+        score = _similarity(normalized, item["normalized_text"], self.threshold)
+        if score is None and src_cjk:
+            score = _similarity(src_cjk, item["cjk_text"], self.threshold)
+        return score
+
+
+def _similarity(a: str, b: str, threshold: float) -> float | None:
+    """``SequenceMatcher`` ratio if ``_is_similar_text`` holds, else None."""
+    if not a or not b:
+        return None
+    ratio = SequenceMatcher(None, a, b).ratio()
+    if a == b or ratio >= threshold:
+        return ratio
+    return None
+
+
+def _index_chars(
+    postings: dict[str, dict[int, int]],
+    item_id: int,
+    text: str,
+) -> None:
+    for char, count in Counter(text).items():
+        postings.setdefault(char, {})[item_id] = count
+
+
+def _unindex_chars(
+    postings: dict[str, dict[int, int]],
+    item_id: int,
+    text: str,
+) -> None:
+    for char in set(text):
+        entries = postings[char]
+        del entries[item_id]
+        if not entries:
+            del postings[char]
+
+
 def prepare_blocks_for_correction(
     blocks: list[dict],
     target_language: str | None,
@@ -35,7 +169,8 @@ def prepare_blocks_for_correction(
     if not target_language or target_language == "auto":
         return blocks
     prepared = []
-    for block in blocks:
+    langs = block_languages(blocks)
+    for block, detected in zip(blocks, langs, strict=True):
         text = block.get("source_text", "")
         if not text:
             prepared.append(block)
@@ -57,7 +192,6 @@ def prepare_blocks_for_correction(
         if has_source_characteristics:
             prepared.append(block)
             continue
-        detected = detect_language(text)
         if detected == target_language or detected == "zh-CN":
             # print(
             #     f"  [DECISION] CLEAR source_text for: {text[:20]}...",
@@ -105,62 +239,17 @@ def apply_correction_mode(  # noqa: C901
     if not target_language or target_language == "auto":
         return output_blocks
 
-    pending: list[dict] = []
+    pending = _PendingIndex(similarity_threshold)
+    langs = block_languages(blocks)
 
     for idx, block in enumerate(output_blocks):
         source_text = block.get("source_text", "")
-        detected = detect_language(source_text) if source_text else None
+        detected = langs[idx]
 
         if detected == target_language:
-            match_index = None
-            match_score = 0.0
-
             # [IMPROVED] Search for matching block, accounting for
             # mixed language.
-            for pending_index, pending_item in enumerate(pending):
-                candidate_text = pending_item["translated_text"]
-
-                # Check 1: Normal similarity
-                if _is_similar_text(
-                    source_text,
-                    candidate_text,
-                    similarity_threshold,
-                ):
-                    score = SequenceMatcher(
-                        None,
-                        _normalize_text(source_text),
-                        pending_item["normalized_text"],
-                    ).ratio()
-                else:
-                    # Check 2: If source_text has Vietnamese, it might be
-                    # compared against pure Target text.
-                    from backend.services.language_detect import (
-                        _CJK_RE,
-                        _VI_DIACRITIC_RE,
-                    )
-                    has_vi = bool(_VI_DIACRITIC_RE.search(source_text))
-                    if has_vi:
-                        # Only compare CJK parts
-                        src_cjk = "".join(_CJK_RE.findall(source_text))
-                        cand_cjk = "".join(_CJK_RE.findall(candidate_text))
-                        if src_cjk and cand_cjk and _is_similar_text(
-                            src_cjk,
-                            cand_cjk,
-                            similarity_threshold,
-                        ):
-                            score = SequenceMatcher(
-                                None,
-                                src_cjk,
-                                cand_cjk,
-                            ).ratio()
-                        else:
-                            continue
-                    else:
-                        continue
-
-                if score > match_score:
-                    match_score = score
-                    match_index = pending_index
+            match_index = pending.best_match(source_text)
 
             if match_index is not None:
                 matched = pending.pop(match_index)
@@ -169,7 +258,6 @@ def apply_correction_mode(  # noqa: C901
                 # [STITCH_PATCH] Ensure Bilingual Consistency
                 # If source text has Vietnamese but the matched translation
                 # (LLM output) missing it, prepend it back.
-                from backend.services.language_detect import _VI_DIACRITIC_RE
                 src_vi_parts = _VI_DIACRITIC_RE.findall(source_text)
                 if len(src_vi_parts) >= 2:  # Significant VI characteristic
                     if not _VI_DIACRITIC_RE.search(final_text):
@@ -177,7 +265,6 @@ def apply_correction_mode(  # noqa: C901
                         # (usually before the CJK/Chinese begins).
                         # We use a simple but robust approach: find the
                         # first CJK index in source.
-                        from backend.services.language_detect import _CJK_RE
                         cjk_match = _CJK_RE.search(source_text)
                         if cjk_match:
                             vi_prefix = source_text[:cjk_match.start()].strip()
@@ -198,15 +285,7 @@ def apply_correction_mode(  # noqa: C901
         block["temp_translated_text"] = block.get("translated_text", "")
         block["translated_text"] = ""
         block["correction_temp"] = True
-        pending.append(
-            {
-                "source_index": idx,
-                "translated_text": block["temp_translated_text"],
-                "normalized_text": _normalize_text(
-                    block["temp_translated_text"]
-                ),
-            }
-        )
+        pending.add(idx, block["temp_translated_text"])
 
     # Final Flush: If any items remain in pending, it means they were
     # not matched.
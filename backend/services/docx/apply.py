@@ -5,6 +5,8 @@ from io import BytesIO
 from docx import Document
 from docx.shared import RGBColor
 
+from backend.contracts import is_pass_through
+
 def _copy_run_format(source_run, target_run):
     """Deep copy formatting from one run to another."""
     target_run.bold = source_run.bold
@@ -69,6 +71,9 @@ def apply_translations(  # noqa: C901
                 continue
 
             if mode == "bilingual":
+                # Pass-through blocks are already in the target language.
+                if is_pass_through(block):
+                    continue
                 _set_paragraph_text(
                     para,
                     translated,
@@ -90,6 +95,8 @@ def apply_translations(  # noqa: C901
                         continue
 
                     if mode == "bilingual":
+                        if is_pass_through(block):
+                            continue
                         # For cells, we might want to just append or replace
                         source_text = block.get("source_text", "")
                         cell.text = f"{source_text}\n{translated}"
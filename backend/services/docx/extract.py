@@ -5,11 +5,9 @@ from io import BytesIO
 from docx import Document
 
 from backend.contracts import make_block
-from backend.services.extract_utils import (
-    is_garbage_text,
-    is_numeric_only,
-    is_technical_terms_only,
-)
+from backend.services.block_analysis import annotate_blocks
+from backend.services.extract_utils import classify_text
+from backend.services.parallel_extract import assign_block_ids
 
 def extract_blocks(docx_path: str | bytes) -> dict:
     """Extract text blocks from a .docx file."""
@@ -23,12 +21,7 @@ def extract_blocks(docx_path: str | bytes) -> dict:
     # 1. Extract Paragraphs
     for i, para in enumerate(doc.paragraphs):
         text = para.text.strip()
-        if (
-            not text
-            or is_numeric_only(text)
-            or is_technical_terms_only(text)
-            or is_garbage_text(text)
-        ):
+        if not text or classify_text(text):
             continue
         # Note: slide_index is used as paragraph_index for UI expectations.
         # Use 'textbox' as 'paragraph' is not in PPTXBlock Literal
@@ -41,12 +34,7 @@ def extract_blocks(docx_path: str | bytes) -> dict:
         for r_idx, row in enumerate(table.rows):
             for c_idx, cell in enumerate(row.cells):
                 text = cell.text.strip()
-                if (
-                    not text
-                    or is_numeric_only(text)
-                    or is_technical_terms_only(text)
-                    or is_garbage_text(text)
-                ):
+                if not text or classify_text(text):
                     continue
                 # Unique integer ID:
                 # table_idx * 1000 + row_idx * 100 + cell_idx
@@ -65,7 +53,7 @@ def extract_blocks(docx_path: str | bytes) -> dict:
                 )
 
     return {
-        "blocks": blocks,
+        "blocks": annotate_blocks(assign_block_ids(blocks, "docx")),
         "slide_width": 595,  # A4 width in points approx
         "slide_height": 842,  # A4 height in points approx
     }
@@ -1,26 +1,52 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
-from langdetect import DetectorFactory, detect
 from backend.services.preserve_terms_repository import list_preserve_terms
 
-# Set seed for consistent langdetect results
-DetectorFactory.seed = 0
-
-
 _PRESERVE_TERMS_CACHE: list[dict] = []
 _PRESERVE_TERMS_MTIME: float | None = None
+_PRESERVE_DB_PATH = Path("data/translation_memory.db")
+# Exact and lower-cased lookups for the cached preserve terms.
+_PRESERVE_INDEX: tuple[frozenset[str], frozenset[str]] = (frozenset(), frozenset())
+
+# Reasons returned by classify_text / classify_blocks.
+FILTER_EMPTY = "empty"
+FILTER_NUMERIC = "numeric"
+FILTER_TECHNICAL = "technical"
+FILTER_GARBAGE = "garbage"
+_UNSEEN = object()
+
+_LETTER_RE = re.compile(r"[a-zA-Z\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]")
+_SEPARATOR_RE = re.compile(r"[,、，/\s]+")
+_NON_LATIN_RE = re.compile(r"[\u4e00-\u9fff\u3040-\u30ff\u0e00-\u0e7f]")
+_SENTENCE_RE = re.compile(
+    r"\b(the|a|an|is|are|was|were|be|have|has|had|do|does|did|"
+    r"will|would|can|could|should|may|might|must|please|this|"
+    r"that|these|those|with|from|to|in|on|at|for|of|and|or|but)\b",
+    re.IGNORECASE,
+)
+# Employee ID or code patterns: #00661, ABC-1234, ID-999, etc.
+_ID_WORD_RE = re.compile(r"^[#A-Z0-9_\-]+$")
+_MIXED_CASE_WORD_RE = re.compile(r"^[A-Z][a-z]*[A-Z][a-zA-Z]*$")
+_TITLE_WORD_RE = re.compile(r"^[A-Z][a-z]+$")
+_LOWER_WORD_RE = re.compile(r"^[a-z]+$")
+_UUID_RE = re.compile(r"^[a-fA-F0-9\-]{32,}$")
+_HEX_RE = re.compile(r"^0x[a-fA-F0-9]+$")
 
 
 def _load_preserve_terms() -> tuple[list[dict], float | None]:
-    """Load preserve terms from SQLite table."""
-    db_path = Path("data/translation_memory.db")
+    """Load preserve terms from SQLite table when the database changed."""
     try:
-        mtime = db_path.stat().st_mtime if db_path.exists() else None
+        mtime = (
+            _PRESERVE_DB_PATH.stat().st_mtime if _PRESERVE_DB_PATH.exists() else None
+        )
     except Exception:
         mtime = None
+    if mtime is None or mtime == _PRESERVE_TERMS_MTIME:
+        return _PRESERVE_TERMS_CACHE, mtime
     try:
         terms = list_preserve_terms()
     except Exception:
@@ -30,65 +56,65 @@ def _load_preserve_terms() -> tuple[list[dict], float | None]:
 
 def _get_preserve_terms() -> list[dict]:
     """Return preserve terms with simple mtime-based cache invalidation."""
-    global _PRESERVE_TERMS_CACHE, _PRESERVE_TERMS_MTIME
+    global _PRESERVE_TERMS_CACHE, _PRESERVE_TERMS_MTIME, _PRESERVE_INDEX
     terms, mtime = _load_preserve_terms()
     if mtime is None:
         _PRESERVE_TERMS_CACHE = []
         _PRESERVE_TERMS_MTIME = None
+        _PRESERVE_INDEX = (frozenset(), frozenset())
         return _PRESERVE_TERMS_CACHE
     if _PRESERVE_TERMS_MTIME != mtime:
         _PRESERVE_TERMS_CACHE = terms
         _PRESERVE_TERMS_MTIME = mtime
+        _PRESERVE_INDEX = _build_preserve_index(terms)
     return _PRESERVE_TERMS_CACHE
 
 
+def _build_preserve_index(
+    terms: list[dict],
+) -> tuple[frozenset[str], frozenset[str]]:
+    exact = set()
+    folded = set()
+    for entry in terms:
+        term = entry.get("term", "")
+        if entry.get("case_sensitive", True):
+            exact.add(term)
+        else:
+            folded.add(term.lower())
+    return frozenset(exact), frozenset(folded)
+
+
+def _preserve_index() -> tuple[frozenset[str], frozenset[str]]:
+    _get_preserve_terms()
+    return _PRESERVE_INDEX
+
+
 def is_numeric_only(text: str) -> bool:
     """Check if text is only numbers, punctuation, or whitespace."""
     if not text or not text.strip():
         return True
     # If it contains any letter (English, CJK), it's not numeric-only.
-    if re.search(r"[a-zA-Z\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]", text):
-        return False
-    return True
+    return _LETTER_RE.search(text) is None
 
 
-def is_technical_terms_only(text: str) -> bool:  # noqa: C901
-    """
-    Check if the text consists only of technical terms, product names,
-    or acronyms.
-    First checks preserve_terms, then falls back to auto-detection.
-    """
-    if not text or not text.strip():
-        return True
+def _is_preserve_term(
+    text_clean: str,
+    index: tuple[frozenset[str], frozenset[str]],
+) -> bool:
+    exact, folded = index
+    return text_clean in exact or (bool(folded) and text_clean.lower() in folded)
 
-    # Priority 1: Check preserve terms database
-    text_clean = text.strip()
-    for term_entry in _get_preserve_terms():
-        term = term_entry.get("term", "")
-        case_sensitive = term_entry.get("case_sensitive", True)
-
-        if case_sensitive:
-            if text_clean == term:
-                return True
-        else:
-            if text_clean.lower() == term.lower():
-                return True
 
-    # Priority 2: Auto-detection fallback
+def _looks_like_technical_terms(text: str) -> bool:
     # Remove common separators
-    cleaned = re.sub(r"[,、，/\s]+", " ", text).strip()
+    cleaned = _SEPARATOR_RE.sub(" ", text).strip()
 
     # If contains any CJK characters, it's not pure technical terms.
-    if re.search(r"[\u4e00-\u9fff\u3040-\u30ff\u0e00-\u0e7f]", cleaned):
+    if _NON_LATIN_RE.search(cleaned):
         return False
 
     # Check if contains sentence-forming words (articles, prepositions, verbs)
-    sentence_indicators = (
-        r"\b(the|a|an|is|are|was|were|be|have|has|had|do|does|did|"
-        r"will|would|can|could|should|may|might|must|please|this|"
-        r"that|these|those|with|from|to|in|on|at|for|of|and|or|but)\b"
-    )
-    if re.search(sentence_indicators, cleaned, re.IGNORECASE):
+    if _SENTENCE_RE.search(cleaned):
         return False
 
     # Split into words
@@ -99,35 +125,34 @@ def is_technical_terms_only(text: str) -> bool:  # noqa: C901
     if word_count > 10:
         return False
 
-    # Patterns:
-    # Employee ID or code patterns: #00661, ABC-1234, ID-999, etc.
-    is_all_caps_or_id = all(
-        (
-            re.match(r"^[#A-Z0-9_\-]+$", w)
-            or re.match(r"^#\d+$", w)
-        )
-        and len(w) <= 30
-        for w in words
-    )
-    is_mixed_case = all(
-        re.match(r"^[A-Z][a-z]*[A-Z][a-zA-Z]*$", w) and len(w) <= 30
-        for w in words
-    )
-    is_title_case = all(re.match(r"^[A-Z][a-z]+$", w) for w in words)
-    is_pure_lower = all(re.match(r"^[a-z]+$", w) for w in words)
-
-    if is_all_caps_or_id or is_mixed_case:
+    if all(_ID_WORD_RE.match(w) and len(w) <= 30 for w in words):
+        return True
+    if all(_MIXED_CASE_WORD_RE.match(w) and len(w) <= 30 for w in words):
         return True
 
     # TitleCase or pure lower is only filtered if very short (<= 3 chars)
-    if (
-        (is_title_case or is_pure_lower)
-        and word_count <= 1
+    return (
+        word_count <= 1
         and len(cleaned) <= 3
-    ):
+        and all(_TITLE_WORD_RE.match(w) or _LOWER_WORD_RE.match(w) for w in words)
+    )
+
+
+def is_technical_terms_only(text: str) -> bool:
+    """
+    Check if the text consists only of technical terms, product names,
+    or acronyms.
+    First checks preserve_terms, then falls back to auto-detection.
+    """
+    if not text or not text.strip():
         return True
 
-    return False
+    # Priority 1: Check preserve terms database
+    if _is_preserve_term(text.strip(), _preserve_index()):
+        return True
+
+    # Priority 2: Auto-detection fallback
+    return _looks_like_technical_terms(text)
 
 
 def is_garbage_text(text: str) -> bool:
@@ -137,11 +162,11 @@ def is_garbage_text(text: str) -> bool:
 
     cleaned = text.strip()
     # UUID pattern
-    if re.match(r"^[a-fA-F0-9\-]{32,}$", cleaned):
+    if _UUID_RE.match(cleaned):
         return True
 
     # Hex pattern
-    if re.match(r"^0x[a-fA-F0-9]+$", cleaned) and len(cleaned) > 10:
+    if _HEX_RE.match(cleaned) and len(cleaned) > 10:
         return True
 
     # High entropy / Random character check
@@ -150,15 +175,54 @@ def is_garbage_text(text: str) -> bool:
         if alphas / len(cleaned) < 0.2:  # Mostly symbols or numbers
             return True
 
-    try:
-        # Simple langdetect check to see if it's identifiable
-        # Note: langdetect can be slow, so we only use it for longer strings
-        if len(cleaned) > 50:
-            lang = detect(cleaned)
-            # If it's unidentifiable, detect() might throw or return 'und'.
-            if lang == "und":
-                return True
-    except Exception:
-        pass
-
     return False
+
+
+def _classify(
+    text: str,
+    index: tuple[frozenset[str], frozenset[str]],
+) -> str | None:
+    stripped = text.strip()
+    if not stripped:
+        return FILTER_EMPTY
+    if _LETTER_RE.search(text) is None:
+        return FILTER_NUMERIC
+    if _is_preserve_term(stripped, index):
+        return FILTER_TECHNICAL
+    # CJK / kana / Thai text is never a technical term list, and only the
+    # symbol-ratio garbage check can apply to it.
+    if _NON_LATIN_RE.search(stripped):
+        if len(stripped) > 20 and is_garbage_text(stripped):
+            return FILTER_GARBAGE
+        return None
+    if _looks_like_technical_terms(text):
+        return FILTER_TECHNICAL
+    if is_garbage_text(stripped):
+        return FILTER_GARBAGE
+    return None
+
+
+def classify_blocks(texts: Iterable[str | None]) -> list[str | None]:
+    """Return why each text is filtered from translation, or None to keep it.
+
+    Same decision as ``is_numeric_only or is_technical_terms_only or
+    is_garbage_text``, evaluated in that order. Repeated values, common in
+    spreadsheets, are classified once, and preserve terms are loaded once
+    per call.
+    """
+    index = _preserve_index()
+    seen: dict[str, str | None] = {}
+    results: list[str | None] = []
+    for text in texts:
+        text = text or ""
+        reason = seen.get(text, _UNSEEN)
+        if reason is _UNSEEN:
+            reason = _classify(text, index)
+            seen[text] = reason
+        results.append(reason)
+    return results
+
+
+def classify_text(text: str | None) -> str | None:
+    return classify_blocks([text])[0]
+
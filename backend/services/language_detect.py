@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import re
-from collections import Counter
+import sys
+import threading
+from collections import Counter, OrderedDict
 from collections.abc import Iterable
-from functools import lru_cache
 
 from langdetect import DetectorFactory, LangDetectException, detect
+from langdetect.detector_factory import init_factory
+
+from backend.config import settings
 
 DetectorFactory.seed = 0
 
@@ -45,55 +49,204 @@ def _normalize_lang(code: str | None) -> str | None:
     return LANG_MAP.get(code, code)
 
 
-def _detect_zh_variant(text: str) -> str:
+def zh_variant_scores(text: str) -> tuple[int, int]:
+    """Count Traditional-only and Simplified-only marker characters."""
     trad_score = sum(1 for ch in text if ch in _ZH_TRAD_CHARS)
     simp_score = sum(1 for ch in text if ch in _ZH_SIMP_CHARS)
+    return trad_score, simp_score
+
+
+def _detect_zh_variant(text: str) -> str:
+    trad_score, simp_score = zh_variant_scores(text)
     if trad_score == 0 and simp_score == 0:
         return "zh-TW"
     return "zh-TW" if trad_score >= simp_score else "zh-CN"
 
 
-@lru_cache(maxsize=2048)
-def detect_language(text: str) -> str | None:
-    """偵測文字的語言。
+# Private-use code points standing in for each script in the histogram.
+_HAN, _KANA, _HANGUL, _THAI, _VI, _LATIN = (chr(0xE000 + i) for i in range(6))
+_NON_LATIN_SCRIPTS = ((_HANGUL, "ko"), (_THAI, "th"))
+# Share of the text a script needs before it decides the language.
+_SCRIPT_RATIO = 0.3
+# Approximate per-entry overhead of the detection cache (key, node, value).
+_CACHE_ENTRY_OVERHEAD = 120
+
+
+def _build_script_table() -> dict[int, str]:
+    table: dict[int, str] = {}
+    ranges = (
+        (0x4E00, 0x9FFF, _HAN),
+        (0x3400, 0x4DBF, _HAN),
+        (0x3040, 0x30FA, _KANA),
+        (0x30FC, 0x30FF, _KANA),  # skip U+30FB, also used in Chinese
+        (0x1100, 0x11FF, _HANGUL),
+        (0x3130, 0x318F, _HANGUL),
+        (0xAC00, 0xD7AF, _HANGUL),
+        (0x0E00, 0x0E7F, _THAI),
+        (0x0041, 0x005A, _LATIN),
+        (0x0061, 0x007A, _LATIN),
+        (0x00C0, 0x024F, _LATIN),
+        (0x1E00, 0x1EFF, _LATIN),
+    )
+    for start, end, mark in ranges:
+        for code in range(start, end + 1):
+            table[code] = mark
+    del table[0xD7], table[0xF7]  # × and ÷
+    for code in range(0x00C0, 0x1EFF + 1):
+        if _VI_DIACRITIC_RE.match(chr(code)):
+            table[code] = _VI
+    return table
+
+
+_SCRIPT_TABLE = _build_script_table()
+
+
+class _ByteBoundedCache:
+    """LRU cache of detection results bounded by the memory of its keys."""
 
-    Uses LRU cache to avoid redundant detections for the same text.
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: OrderedDict[str, str | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cost(key: str) -> int:
+        return sys.getsizeof(key) + _CACHE_ENTRY_OVERHEAD
+
+    def get(self, key: str) -> tuple[bool, str | None]:
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def put(self, key: str, value: str | None) -> None:
+        cost = self._cost(key)
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = value
+            self.bytes += cost
+            while self.bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self.bytes -= self._cost(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+_CACHE = _ByteBoundedCache(settings.language_detect_cache_bytes)
+
+
+def _detect_statistical(text: str) -> str | None:
+    try:
+        lang = _normalize_lang(detect(text))
+    except LangDetectException:
+        return None
+    if lang == "zh":
+        return _detect_zh_variant(text)
+    return lang
+
+
+_SCRIPT_NAMES = (
+    ("han", _HAN),
+    ("kana", _KANA),
+    ("hangul", _HANGUL),
+    ("thai", _THAI),
+    ("vi", _VI),
+    ("latin", _LATIN),
+)
+
+
+def script_histogram(text: str) -> dict[str, int]:
+    """Count characters per script (Vietnamese letters counted apart from Latin)."""
+    mapped = (text or "").translate(_SCRIPT_TABLE)
+    counts = {name: mapped.count(mark) for name, mark in _SCRIPT_NAMES}
+    counts["digits"] = sum(ch.isdigit() for ch in mapped)
+    counts["length"] = len(mapped)
+    return counts
+
+
+def _detect_uncached(text: str) -> str | None:
+    """Decide from the script histogram; langdetect only when ambiguous.
 
     判斷順序：
     1. 越南語專屬字元（需至少 2 個特徵字元避免誤判）
-    2. CJK 字元（中文/日文/韓文）
-    3. langdetect 函式庫判斷
+    2. 假名 → ja；韓文、泰文字元占比高 → ko / th
+    3. 漢字（中文）
+    4. 純 ASCII 英文
+    5. 其餘含字母的文字交由 langdetect 判斷
     """
-    if not text or not text.strip():
+    stripped = text.strip()
+    if not stripped:
         return None
+    mapped = stripped.translate(_SCRIPT_TABLE)
+    total = len(stripped)
 
     # 越南語專屬字元：需要至少 2 個特徵字元，避免將 café（法語）誤判為越南語
-    # 越南語特有字母：đ, ơ, ư, ă, ê, ô, â 以及帶聲調的組合
-    vi_matches = _VI_DIACRITIC_RE.findall(text)
-    if len(vi_matches) >= 2:
+    vi = mapped.count(_VI)
+    if vi >= 2:
         return "vi"
 
-    if _CJK_RE.search(text):
-        # Return ZH only if CJK characters are a significant portion
-        # or if there are no other identifiable language features.
-        cjk_count = len(_CJK_RE.findall(text))
-        total_len = len(text.strip())
-        if cjk_count / total_len > 0.3 or len(text.strip()) < 5:
-            return _detect_zh_variant(text)
-
-    ascii_text = text.strip()
-    if _ASCII_ONLY_RE.fullmatch(ascii_text):
-        alpha_count = len(re.findall(r"[A-Za-z]", ascii_text))
-        if alpha_count >= 2:
-            return "en"
+    han = mapped.count(_HAN)
+    kana = mapped.count(_KANA)
+    if kana and (han + kana) / total > _SCRIPT_RATIO:
+        return "ja"
+    for mark, lang in _NON_LATIN_SCRIPTS:
+        if mapped.count(mark) / total > _SCRIPT_RATIO:
+            return lang
+    # Return ZH only if CJK characters are a significant portion
+    # or if there are no other identifiable language features.
+    if han and (han / total > _SCRIPT_RATIO or total < 5):
+        return _detect_zh_variant(stripped)
 
-    try:
-        lang = _normalize_lang(detect(text))
-        if lang == "zh":
-            return _detect_zh_variant(text)
-        return lang
-    except LangDetectException:
+    latin = mapped.count(_LATIN)
+    if latin >= 2 and _ASCII_ONLY_RE.fullmatch(stripped):
+        return "en"
+    if not latin and not vi and not any(ch.isalpha() for ch in mapped):
+        # Digits and punctuation only: nothing to detect.
         return None
+    return _detect_statistical(stripped)
+
+
+def detect_languages(texts: Iterable[str]) -> list[str | None]:
+    """偵測多段文字的語言（批次）。
+
+    Duplicate texts are detected once, and results are kept in an LRU
+    cache bounded by ``LANGUAGE_DETECT_CACHE_BYTES``.
+    """
+    texts = list(texts)
+    results: dict[str, str | None] = {}
+    for text in dict.fromkeys(texts):
+        if not text:
+            results[text] = None
+            continue
+        hit, lang = _CACHE.get(text)
+        if not hit:
+            lang = _detect_uncached(text)
+            _CACHE.put(text, lang)
+        results[text] = lang
+    return [results[text] for text in texts]
+
+
+def detect_language(text: str) -> str | None:
+    """偵測文字的語言。"""
+    return detect_languages([text])[0]
+
+
+def clear_language_cache() -> None:
+    _CACHE.clear()
+
+
+def warm_up_language_detector() -> None:
+    """Load the langdetect profiles now instead of on the first request."""
+    init_factory()
 
 
 def detect_document_languages(blocks: Iterable[dict]) -> dict:
@@ -114,11 +267,10 @@ def detect_document_languages(blocks: Iterable[dict]) -> dict:
     else:
         sampled_blocks = blocks_list
 
-    for block in sampled_blocks:
-        text = block.get("source_text", "")
-        lines = [line for line in text.splitlines() if line.strip()]
-        for idx, line in enumerate(lines):
-            lang = detect_language(line)
+    from backend.services.block_analysis import block_line_languages
+
+    for line_langs in block_line_languages(sampled_blocks):
+        for idx, lang in enumerate(line_langs):
             if not lang:
                 continue
             counts[lang] += 1
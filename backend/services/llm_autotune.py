@@ -0,0 +1,300 @@
+"""Self-tuning chunk size and concurrency per provider/model.
+
+Every LLM chunk request records its latency, block and estimated token
+counts, and whether it failed or timed out. The figures are kept as
+moving averages per (provider, model) in ``backend/data/llm_autotune.json``
+so the next run starts from the last tuned values.
+
+Within a run the tuner keeps the predicted chunk latency under
+``LLM_AUTOTUNE_TIMEOUT_RISK`` × the provider timeout. It grows the chunk
+size while there is headroom and shrinks it after a timeout. Concurrency
+is hill-climbed on blocks/second measured over the wall-clock window of
+the samples taken at each level, so chunks sent one after another (the
+sync path) show no gain from a higher level.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from backend.config import settings
+from backend.services.llm_errors import is_timeout_error
+from backend.services.token_estimator import estimate_block_tokens
+
+LOGGER = logging.getLogger(__name__)
+
+TUNE_FILE = Path(__file__).parent.parent / "data" / "llm_autotune.json"
+
+# Weight of the newest sample in the moving averages.
+EWMA_ALPHA = 0.3
+# Samples needed at a concurrency level before it is compared.
+PROBE_SAMPLES = 3
+# Largest chunk size step up per sample.
+GROWTH_FACTOR = 1.5
+# A higher concurrency level is kept only if it beats the lower one by this.
+MIN_GAIN = 1.05
+
+_FILE_LOCK = threading.Lock()
+
+
+def provider_timeout(provider: str) -> float:
+    if provider == "ollama":
+        return float(settings.ollama_timeout)
+    if provider == "gemini":
+        return float(settings.gemini_timeout)
+    return float(settings.openai_timeout)
+
+
+def _ewma(current: float | None, value: float) -> float:
+    if current is None:
+        return value
+    return (1 - EWMA_ALPHA) * current + EWMA_ALPHA * value
+
+
+@dataclass
+class ModelProfile:
+    """Persisted telemetry and tuned values for one provider/model."""
+
+    chunk_size: int
+    concurrency: int
+    samples: int = 0
+    seconds_per_block: float | None = None
+    tokens_per_second: float | None = None
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    # Blocks/second measured at each concurrency level (keys are str for JSON).
+    throughput: dict[str, float] = field(default_factory=dict)
+
+
+class ChunkAutotuner:
+    """Tunes chunk size and concurrency from chunk telemetry."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        profile: ModelProfile,
+        timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.model = model
+        self.profile = profile
+        self.timeout = timeout or provider_timeout(provider)
+        self.max_chunk_size = max(1, settings.llm_autotune_max_chunk_size)
+        self.max_concurrency = max(1, settings.llm_autotune_max_concurrency)
+        self._clock = clock
+        self._level_samples = 0
+        # Blocks done and earliest chunk start of the samples at this level.
+        self._window_blocks = 0
+        self._window_start: float | None = None
+        self._lock = threading.Lock()
+        self._active = 0
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def chunk_size(self) -> int:
+        return self.profile.chunk_size
+
+    @property
+    def concurrency(self) -> int:
+        return self.profile.concurrency
+
+    @property
+    def latency_ceiling(self) -> float:
+        return self.timeout * settings.llm_autotune_timeout_risk
+
+    def record(
+        self,
+        blocks: list[dict],
+        seconds: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record one chunk request and retune."""
+        if not blocks:
+            return
+        timed_out = error is not None and is_timeout_error(error)
+        with self._lock:
+            profile = self.profile
+            profile.samples += 1
+            profile.error_rate = _ewma(profile.error_rate, float(error is not None))
+            profile.timeout_rate = _ewma(profile.timeout_rate, float(timed_out))
+            if error is None and seconds > 0:
+                tokens = sum(
+                    estimate_block_tokens(
+                        [block.get("source_text", "") for block in blocks],
+                        self.model,
+                    )
+                )
+                profile.seconds_per_block = _ewma(
+                    profile.seconds_per_block, seconds / len(blocks)
+                )
+                profile.tokens_per_second = _ewma(
+                    profile.tokens_per_second, tokens / seconds
+                )
+                started = self._clock() - seconds
+                if self._window_start is None or started < self._window_start:
+                    self._window_start = started
+                self._window_blocks += len(blocks)
+            self._tune(timed_out, error is not None)
+
+    def _tune(self, timed_out: bool, failed: bool) -> None:
+        profile = self.profile
+        if timed_out:
+            profile.chunk_size = max(1, profile.chunk_size // 2)
+            profile.concurrency = max(1, profile.concurrency // 2)
+            self._reset_window()
+            LOGGER.info(
+                "Autotune %s/%s: timeout, chunk=%s concurrency=%s",
+                self.provider,
+                self.model,
+                profile.chunk_size,
+                profile.concurrency,
+            )
+            return
+        if failed:
+            profile.chunk_size = max(1, math.floor(profile.chunk_size * 0.75))
+            return
+        if profile.seconds_per_block:
+            target = int(self.latency_ceiling / profile.seconds_per_block)
+            grown = math.ceil(profile.chunk_size * GROWTH_FACTOR)
+            profile.chunk_size = max(
+                1, min(target, grown, self.max_chunk_size)
+            )
+        self._level_samples += 1
+        if self._level_samples >= PROBE_SAMPLES:
+            self._record_throughput()
+            self._tune_concurrency()
+            self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._level_samples = 0
+        self._window_blocks = 0
+        self._window_start = None
+
+    def _record_throughput(self) -> None:
+        """Blocks/second of the current level over its wall-clock window."""
+        if self._window_start is None:
+            return
+        elapsed = self._clock() - self._window_start
+        if elapsed <= 0:
+            return
+        level = str(self.profile.concurrency)
+        self.profile.throughput[level] = _ewma(
+            self.profile.throughput.get(level), self._window_blocks / elapsed
+        )
+
+    def _tune_concurrency(self) -> None:
+        profile = self.profile
+        level = profile.concurrency
+        current = profile.throughput.get(str(level), 0.0)
+        lower = profile.throughput.get(str(level - 1))
+        if lower is not None and current < lower * MIN_GAIN:
+            profile.concurrency = level - 1
+        elif level < self.max_concurrency and str(level + 1) not in profile.throughput:
+            profile.concurrency = level + 1
+        elif (
+            level < self.max_concurrency
+            and profile.throughput[str(level + 1)] >= current * MIN_GAIN
+        ):
+            profile.concurrency = level + 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """Limit in-flight chunks to the current tuned concurrency."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        condition = self._condition
+        async with condition:
+            await condition.wait_for(lambda: self._active < self.concurrency)
+            self._active += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._active -= 1
+                condition.notify_all()
+
+    def save(self) -> None:
+        with _FILE_LOCK:
+            profiles = _load_profiles()
+            profiles[_profile_key(self.provider, self.model)] = asdict(self.profile)
+            _save_profiles(profiles)
+
+
+def _profile_key(provider: str, model: str) -> str:
+    return f"{provider}:{model}"
+
+
+def _load_profiles() -> dict[str, dict]:
+    if not TUNE_FILE.exists():
+        return {}
+    try:
+        return json.loads(TUNE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_profiles(profiles: dict[str, dict]) -> None:
+    try:
+        TUNE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = TUNE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(profiles, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        tmp_path.replace(TUNE_FILE)
+    except OSError as exc:
+        LOGGER.warning("Failed to save autotune profiles: %s", exc)
+
+
+def load_autotuner(
+    provider: str,
+    model: str,
+    chunk_size: int,
+    concurrency: int,
+) -> ChunkAutotuner:
+    """Return a tuner seeded from the stored profile or the given defaults."""
+    with _FILE_LOCK:
+        stored = _load_profiles().get(_profile_key(provider, model))
+    profile = ModelProfile(chunk_size=max(1, chunk_size), concurrency=max(1, concurrency))
+    if stored:
+        try:
+            profile = ModelProfile(**stored)
+        except TypeError:
+            LOGGER.warning("Ignoring invalid autotune profile for %s/%s", provider, model)
+    return ChunkAutotuner(provider, model, profile)
+
+
+def get_autotune_profiles() -> dict[str, dict]:
+    with _FILE_LOCK:
+        return _load_profiles()
+
+
+def record_chunk(
+    params: dict,
+    blocks: list[dict],
+    seconds: float,
+    error: BaseException | None = None,
+) -> None:
+    """Feed a chunk request into the job's tuner, if autotuning is on."""
+    tuner = params.get("autotune")
+    if tuner is not None:
+        tuner.record(blocks, seconds, error)
+
+
+def iter_adaptive_chunks(pending: list, tuner: ChunkAutotuner):
+    """Like ``chunked`` but reads the tuned chunk size before each chunk."""
+    position = 0
+    while position < len(pending):
+        size = tuner.chunk_size
+        yield pending[position : position + size]
+        position += size
@@ -0,0 +1,210 @@
+"""Per-endpoint circuit breakers for LLM providers.
+
+Each (provider, base_url) pair gets a breaker with the usual states:
+
+* ``closed``: requests flow normally; consecutive endpoint failures are
+  counted.
+* ``open``: after ``failure_threshold`` failures, requests fail fast with
+  :class:`CircuitOpenError` until ``reset_timeout`` has passed.
+* ``half_open``: a single probe request is let through; success closes
+  the circuit, failure opens it again.
+
+Only endpoint-level failures (connection errors, timeouts, HTTP 429/5xx)
+count. Bad model output does not.
+
+A multi-host Ollama spec gets no breaker: one failing host would open
+the circuit for the whole pool, while the pool already routes around
+hosts it has marked unhealthy (see ``ollama_pool``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from backend.config import settings
+from backend.services.ollama_pool import parse_base_urls
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ValueError):
+    """Raised when a request is short-circuited by an open breaker."""
+
+    def __init__(self, provider: str, base_url: str) -> None:
+        super().__init__(
+            f"{provider} 服務暫時無法使用（斷路器開啟）：{base_url}"
+        )
+        self.provider = provider
+        self.base_url = base_url
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one provider endpoint."""
+
+    def __init__(
+        self,
+        provider: str,
+        base_url: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.provider = provider
+        self.base_url = base_url
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_error: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def is_available(self) -> bool:
+        """Return False while the circuit is open (without using a probe)."""
+        with self._lock:
+            state = self._current_state()
+            return state == CLOSED or (
+                state == HALF_OPEN and not self._probe_in_flight
+            )
+
+    def before_request(self) -> None:
+        """Raise :class:`CircuitOpenError` if the request must fail fast."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+        raise CircuitOpenError(self.provider, self.base_url)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, exc: BaseException) -> None:
+        if not is_endpoint_failure(exc):
+            self.release()
+            return
+        with self._lock:
+            self._last_error = str(exc)
+            self._failures += 1
+            if (
+                self._state == HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Free a half-open probe slot without recording a verdict."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == OPEN:
+                retry_in = max(
+                    self.reset_timeout - (time.monotonic() - self._opened_at),
+                    0.0,
+                )
+            return {
+                "provider": self.provider,
+                "base_url": self.base_url,
+                "state": state,
+                "failures": self._failures,
+                "retry_in": round(retry_in, 1),
+                "last_error": self._last_error,
+            }
+
+
+_LOCK = threading.Lock()
+_BREAKERS: dict[tuple[str, str], CircuitBreaker] = {}
+
+
+def is_endpoint_failure(exc: BaseException) -> bool:
+    """Return True if ``exc`` (or its cause chain) is an endpoint failure."""
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(
+            current,
+            (httpx.TransportError, TimeoutError, asyncio.TimeoutError),
+        ):
+            return True
+        if isinstance(current, httpx.HTTPStatusError):
+            code = current.response.status_code
+            return code == 429 or code >= 500
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def endpoint_of(translator) -> str:
+    """Best-effort base URL of a translator instance."""
+    config = getattr(translator, "config", None)
+    base_url = getattr(translator, "base_url", None) or getattr(
+        config, "base_url", None
+    )
+    return (base_url or "default").rstrip("/")
+
+
+def get_breaker(provider: str, base_url: str) -> CircuitBreaker:
+    key = (provider, base_url.rstrip("/"))
+    with _LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                provider,
+                key[1],
+                failure_threshold=settings.llm_circuit_failure_threshold,
+                reset_timeout=settings.llm_circuit_reset_seconds,
+            )
+            _BREAKERS[key] = breaker
+        return breaker
+
+
+def breaker_for(provider: str, translator) -> CircuitBreaker | None:
+    """Return the breaker guarding ``translator``; None for mock."""
+    if provider == "mock" or not settings.llm_circuit_enabled:
+        return None
+    endpoint = endpoint_of(translator)
+    if provider == "ollama" and len(parse_base_urls(endpoint)) > 1:
+        return None
+    return get_breaker(provider, endpoint)
+
+
+def get_circuit_states() -> list[dict]:
+    with _LOCK:
+        breakers = list(_BREAKERS.values())
+    return [breaker.snapshot() for breaker in breakers]
+
+
+def reset_circuits() -> None:
+    with _LOCK:
+        _BREAKERS.clear()
@@ -47,6 +47,7 @@ class MockTranslator:
         preferred_terms: list[tuple[str, str]] | None = None,
         placeholder_tokens: list[str] | None = None,
         language_hint: str | None = None,
+        mode: str = "direct",
     ) -> dict:
         """Return original text as translation (mock mode)."""
         return build_contract(blocks, target_language, translated_texts=None)
@@ -59,6 +60,7 @@ class MockTranslator:
         preferred_terms: list[tuple[str, str]] | None = None,
         placeholder_tokens: list[str] | None = None,
         language_hint: str | None = None,
+        mode: str = "direct",
     ) -> dict:
         """Return original text as translation (mock mode)."""
         return self.translate(
@@ -14,9 +14,16 @@ import httpx
 
 from backend.config import settings
 from backend.services.llm_client_base import load_contract_example
-from backend.services.llm_contract import validate_contract
+from backend.services.llm_http import get_async_client, get_sync_client
 from backend.services.llm_prompt import build_prompt
+from backend.services.llm_schema import (
+    build_translation_schema,
+    load_structured_response,
+    to_gemini_schema,
+)
 from backend.services.llm_utils import safe_json_loads
+from backend.services.prompt_store import get_prompt
+from backend.services.token_tracker import record_usage
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +47,8 @@ class GeminiTranslator:
         mode: str = "direct",
     ) -> dict:
         """Translate blocks using Gemini API (Synchronous)."""
+        blocks = list(blocks)
+        block_count = len(blocks) if settings.llm_structured_output else None
         contract_example = load_contract_example()
         prompt = build_prompt(
             blocks,
@@ -50,18 +59,9 @@ class GeminiTranslator:
             placeholder_tokens,
             language_hint,
             mode=mode,
+            compact=True if block_count is not None else None,
         )
-
-        system_message = self._get_system_message()
-        full_prompt = f"{system_message}\n\n[TASK START]\n{prompt}"
-
-        payload = {
-            "contents": [{"role": "user", "parts": [{"text": full_prompt}]}],
-            "generationConfig": {
-                "temperature": 0,
-                "responseMimeType": "application/json",
-            },
-        }
+        payload = self._translate_payload(prompt, block_count)
 
         timeout = settings.gemini_timeout
         url = (
@@ -70,16 +70,20 @@ class GeminiTranslator:
         )
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-                response_data = response.json()
+            client = get_sync_client("gemini", self.base_url)
+            response = client.post(url, json=payload, timeout=timeout)
+            response.raise_for_status()
+            response_data = response.json()
         except httpx.HTTPStatusError as exc:
             self._handle_http_error(exc)
         except httpx.RequestError as exc:
             raise ValueError(f"Gemini API 連線錯誤: {exc}") from exc
 
-        return self._process_response(response_data)
+        return self._process_response(
+            response_data,
+            block_count,
+            payload["contents"][0]["parts"][0]["text"],
+        )
 
     async def translate_async(
         self,
@@ -92,6 +96,8 @@ class GeminiTranslator:
         mode: str = "direct",
     ) -> dict:
         """Translate blocks using Gemini API (Asynchronous)."""
+        blocks = list(blocks)
+        block_count = len(blocks) if settings.llm_structured_output else None
         contract_example = load_contract_example()
         prompt = build_prompt(
             blocks,
@@ -102,18 +108,9 @@ class GeminiTranslator:
             placeholder_tokens,
             language_hint,
             mode=mode,
+            compact=True if block_count is not None else None,
         )
-
-        system_message = self._get_system_message()
-        full_prompt = f"{system_message}\n\n[TASK START]\n{prompt}"
-
-        payload = {
-            "contents": [{"role": "user", "parts": [{"text": full_prompt}]}],
-            "generationConfig": {
-                "temperature": 0,
-                "responseMimeType": "application/json",
-            },
-        }
+        payload = self._translate_payload(prompt, block_count)
 
         timeout = settings.gemini_timeout
         url = (
@@ -122,18 +119,48 @@ class GeminiTranslator:
         )
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                response_data = response.json()
+            client = get_async_client("gemini", self.base_url)
+            response = await client.post(url, json=payload, timeout=timeout)
+            response.raise_for_status()
+            response_data = response.json()
         except httpx.HTTPStatusError as exc:
             self._handle_http_error(exc)
         except httpx.RequestError as exc:
             raise ValueError(f"Gemini API 連線錯誤: {exc}") from exc
 
-        return self._process_response(response_data)
+        return self._process_response(
+            response_data,
+            block_count,
+            payload["contents"][0]["parts"][0]["text"],
+        )
+
+    def _translate_payload(self, prompt: str, block_count: int | None) -> dict:
+        """Build the generateContent payload.
 
-    def _process_response(self, response_data: dict) -> dict:
+        With ``block_count`` the response is constrained by
+        ``responseSchema``.
+        """
+        system_message = self._get_system_message()
+        full_prompt = f"{system_message}\n\n[TASK START]\n{prompt}"
+        generation_config: dict = {
+            "temperature": 0,
+            "responseMimeType": "application/json",
+        }
+        if block_count is not None:
+            generation_config["responseSchema"] = to_gemini_schema(
+                build_translation_schema(block_count)
+            )
+        return {
+            "contents": [{"role": "user", "parts": [{"text": full_prompt}]}],
+            "generationConfig": generation_config,
+        }
+
+    def _process_response(
+        self,
+        response_data: dict,
+        block_count: int | None = None,
+        prompt_text: str | None = None,
+    ) -> dict:
         """Extract and validate translation from Gemini response."""
         self._check_prompt_feedback(response_data)
         self._check_candidates(response_data)
@@ -144,13 +171,41 @@ class GeminiTranslator:
             .get("parts", [])
         )
         content = parts[0].get("text", "") if parts else ""
+        self._record_usage(response_data, prompt_text, content)
 
         if not content:
             raise ValueError("Gemini 回應內容為空。請檢查 API 設定或稍後再試。")
 
-        result = safe_json_loads(content)
-        validate_contract(result)
-        return result
+        if block_count is not None:
+            return load_structured_response(
+                content, block_count, "gemini", self.model
+            )
+        return safe_json_loads(content)
+
+    def _record_usage(
+        self,
+        response_data: dict,
+        prompt_text: str | None = None,
+        content: str | None = None,
+    ) -> None:
+        usage = response_data.get("usageMetadata")
+        if not usage:
+            return
+        record_usage(
+            provider="gemini",
+            model=self.model,
+            prompt_tokens=usage.get("promptTokenCount", 0),
+            completion_tokens=usage.get("candidatesTokenCount", 0),
+            cached_tokens=usage.get("cachedContentTokenCount", 0),
+            prompt_text=prompt_text,
+            completion_text=content,
+        )
+
+    def _get_system_message(self) -> str:
+        try:
+            return get_prompt("system_message")
+        except FileNotFoundError:
+            return "你是負責翻譯 PPTX 文字區塊的助手。只回傳 JSON，且必須符合既定 schema。"
 
     def _handle_http_error(self, exc: httpx.HTTPStatusError) -> None:
         """Handle HTTP errors from Gemini API."""
@@ -227,10 +282,14 @@ class GeminiTranslator:
             f"{self.base_url}/models/{self.model}:generateContent"
             f"?key={self.api_key}"
         )
-        with httpx.Client(timeout=settings.gemini_timeout) as client:
-            response = client.post(url, json=payload)
-            response.raise_for_status()
-            response_data = response.json()
+        client = get_sync_client("gemini", self.base_url)
+        response = client.post(
+            url,
+            json=payload,
+            timeout=settings.gemini_timeout,
+        )
+        response.raise_for_status()
+        response_data = response.json()
         parts = (
             response_data.get("candidates", [])[0]
             .get("content", {})
@@ -248,12 +307,14 @@ class GeminiTranslator:
             f"{self.base_url}/models/{self.model}:generateContent"
             f"?key={self.api_key}"
         )
-        async with httpx.AsyncClient(
-            timeout=settings.gemini_timeout
-        ) as client:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            response_data = response.json()
+        client = get_async_client("gemini", self.base_url)
+        response = await client.post(
+            url,
+            json=payload,
+            timeout=settings.gemini_timeout,
+        )
+        response.raise_for_status()
+        response_data = response.json()
         parts = (
             response_data.get("candidates", [])[0]
             .get("content", {})
@@ -13,9 +13,14 @@ import httpx
 
 from backend.config import settings
 from backend.services.llm_client_base import load_contract_example
-from backend.services.llm_contract import validate_contract
+from backend.services.llm_http import get_async_client, get_sync_client
 from backend.services.llm_prompt import build_prompt
+from backend.services.llm_schema import (
+    build_translation_schema,
+    load_structured_response,
+)
 from backend.services.llm_utils import safe_json_loads
+from backend.services.ollama_pool import get_host_pool, keep_alive_value
 from backend.services.prompt_store import get_prompt
 from backend.services.token_tracker import record_usage
 
@@ -51,76 +56,95 @@ class OllamaTranslator:
     def __init__(self, model: str, base_url: str) -> None:
         self.model = model
         self.base_url = base_url.rstrip("/")
+        self._pool = get_host_pool(self.base_url)
         self._async_client: httpx.AsyncClient | None = None
 
     def set_async_client(self, client: httpx.AsyncClient) -> None:
-        """Set an external async client for connection pooling."""
+        """Override the shared pooled async client (mainly for tests)."""
         self._async_client = client
 
+    def _with_keep_alive(self, payload: dict) -> dict:
+        keep_alive = keep_alive_value()
+        if keep_alive and "keep_alive" not in payload:
+            return {**payload, "keep_alive": keep_alive}
+        return payload
+
+    def _record_usage(self, data: dict) -> None:
+        if "prompt_eval_count" in data or "eval_count" in data:
+            # prompt_eval_count skips the KV-cached prefix, so only the
+            # completion calibrates the token estimator.
+            completion_text = data.get("response") or (
+                data.get("message") or {}
+            ).get("content")
+            record_usage(
+                provider="ollama",
+                model=self.model,
+                prompt_tokens=data.get("prompt_eval_count", 0),
+                completion_tokens=data.get("eval_count", 0),
+                completion_text=completion_text,
+            )
+
     def _post(self, endpoint: str, payload: dict) -> dict:
-        """Make POST request to Ollama API (Synchronous)."""
-        url = f"{self.base_url}{endpoint}"
+        """Make POST request to Ollama API (Synchronous).
+
+        The request goes to the pool host with the fewest outstanding
+        requests.
+        """
+        host = self._pool.acquire()
+        url = f"{host.base_url}{endpoint}"
+        error: Exception | None = None
         try:
-            with httpx.Client(timeout=settings.ollama_timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-
-                # Record usage
-                if "prompt_eval_count" in data or "eval_count" in data:
-                    record_usage(
-                        provider="ollama",
-                        model=self.model,
-                        prompt_tokens=data.get("prompt_eval_count", 0),
-                        completion_tokens=data.get("eval_count", 0),
-                    )
-
-                return data
+            client = get_sync_client("ollama", host.base_url)
+            response = client.post(
+                url,
+                json=self._with_keep_alive(payload),
+                timeout=settings.ollama_timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            self._record_usage(data)
+            return data
         except httpx.HTTPStatusError as exc:
+            error = exc
             raise ValueError(
                 f"Ollama API 錯誤 ({exc.response.status_code}): "
                 f"{exc.response.reason_phrase}"
             ) from exc
         except httpx.RequestError as exc:
-            raise ValueError(f"無法連線至 Ollama ({self.base_url}): {exc}") from exc
+            error = exc
+            raise ValueError(f"無法連線至 Ollama ({host.base_url}): {exc}") from exc
+        finally:
+            self._pool.release(host, error)
 
     async def _post_async(self, endpoint: str, payload: dict) -> dict:
         """Make POST request to Ollama API (Asynchronous)."""
-        url = f"{self.base_url}{endpoint}"
+        host = self._pool.acquire()
+        url = f"{host.base_url}{endpoint}"
+        error: Exception | None = None
         try:
-            if self._async_client is not None:
-                response = await self._async_client.post(
-                    url,
-                    json=payload,
-                    timeout=settings.ollama_timeout,
-                )
-                response.raise_for_status()
-                data = response.json()
-            else:
-                async with httpx.AsyncClient(
-                    timeout=settings.ollama_timeout
-                ) as client:
-                    response = await client.post(url, json=payload)
-                    response.raise_for_status()
-                    data = response.json()
-
-            # Record usage
-            if "prompt_eval_count" in data or "eval_count" in data:
-                record_usage(
-                    provider="ollama",
-                    model=self.model,
-                    prompt_tokens=data.get("prompt_eval_count", 0),
-                    completion_tokens=data.get("eval_count", 0),
-                )
-
+            client = self._async_client or get_async_client(
+                "ollama", host.base_url
+            )
+            response = await client.post(
+                url,
+                json=self._with_keep_alive(payload),
+                timeout=settings.ollama_timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            self._record_usage(data)
             return data
         except httpx.HTTPStatusError as exc:
+            error = exc
             raise ValueError(
                 f"Ollama API 錯誤 ({exc.response.status_code}): "
                 f"{exc.response.reason_phrase}"
             ) from exc
         except httpx.RequestError as exc:
-            raise ValueError(f"無法連線至 Ollama ({self.base_url}): {exc}") from exc
+            error = exc
+            raise ValueError(f"無法連線至 Ollama ({host.base_url}): {exc}") from exc
+        finally:
+            self._pool.release(host, error)
 
     def translate(
         self,
@@ -133,6 +157,8 @@ class OllamaTranslator:
         mode: str = "direct",
     ) -> dict:
         """Translate blocks using Ollama API (Synchronous)."""
+        blocks = list(blocks)
+        structured = settings.llm_structured_output
         contract_example = load_contract_example()
         prompt = build_prompt(
             blocks,
@@ -143,22 +169,9 @@ class OllamaTranslator:
             placeholder_tokens,
             language_hint,
             mode=mode,
+            compact=True if structured else None,
         )
-
-        system_message = self._get_system_message()
-        payload = {
-            "model": self.model,
-            "format": "json",
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt},
-            ],
-            "stream": False,
-        }
-
-        options = build_ollama_options()
-        if options:
-            payload["options"] = options
+        payload = self._chat_payload(prompt, len(blocks) if structured else None)
 
         response_data = self._post("/api/chat", payload)
         content = response_data.get("message", {}).get("content", "")
@@ -166,9 +179,11 @@ class OllamaTranslator:
         if not content:
             raise ValueError("Ollama 回傳內容為空 (/api/chat)")
 
-        result = safe_json_loads(content)
-        validate_contract(result)
-        return result
+        if structured:
+            return load_structured_response(
+                content, len(blocks), "ollama", self.model
+            )
+        return safe_json_loads(content)
 
     async def translate_async(
         self,
@@ -181,6 +196,8 @@ class OllamaTranslator:
         mode: str = "direct",
     ) -> dict:
         """Translate blocks using Ollama API (Asynchronous)."""
+        blocks = list(blocks)
+        structured = settings.llm_structured_output
         contract_example = load_contract_example()
         prompt = build_prompt(
             blocks,
@@ -191,32 +208,45 @@ class OllamaTranslator:
             placeholder_tokens,
             language_hint,
             mode=mode,
+            compact=True if structured else None,
         )
+        payload = self._chat_payload(prompt, len(blocks) if structured else None)
 
-        system_message = self._get_system_message()
+        response_data = await self._post_async("/api/chat", payload)
+        content = response_data.get("message", {}).get("content", "")
+
+        if not content:
+            raise ValueError("Ollama 回傳內容為空 (/api/chat)")
+
+        if structured:
+            return load_structured_response(
+                content, len(blocks), "ollama", self.model
+            )
+        return safe_json_loads(content)
+
+    def _chat_payload(self, prompt: str, block_count: int | None) -> dict:
+        """Build the /api/chat payload.
+
+        With ``block_count`` the response is constrained by a JSON Schema
+        instead of plain JSON mode.
+        """
         payload = {
             "model": self.model,
-            "format": "json",
+            "format": (
+                "json"
+                if block_count is None
+                else build_translation_schema(block_count)
+            ),
             "messages": [
-                {"role": "system", "content": system_message},
+                {"role": "system", "content": self._get_system_message()},
                 {"role": "user", "content": prompt},
             ],
             "stream": False,
         }
-
         options = build_ollama_options()
         if options:
             payload["options"] = options
-
-        response_data = await self._post_async("/api/chat", payload)
-        content = response_data.get("message", {}).get("content", "")
-
-        if not content:
-            raise ValueError("Ollama 回傳內容為空 (/api/chat)")
-
-        result = safe_json_loads(content)
-        validate_contract(result)
-        return result
+        return payload
 
     def _get_system_message(self) -> str:
         try:
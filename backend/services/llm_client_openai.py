@@ -6,19 +6,17 @@ with OpenAI's chat completions API.
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Iterable
 
-import httpx
-
 from backend.config import settings
 from backend.services.llm_client_base import (
     TranslationConfig,
     load_contract_example,
 )
-from backend.services.llm_contract import validate_contract
+from backend.services.llm_http import get_async_client, get_sync_client
 from backend.services.llm_prompt import build_prompt
+from backend.services.llm_utils import safe_json_loads
 from backend.services.prompt_store import get_prompt
 from backend.services.token_tracker import record_usage
 
@@ -71,25 +69,19 @@ class OpenAITranslator:
         }
         url = f"{self.config.base_url}/chat/completions"
 
-        with httpx.Client(timeout=settings.openai_timeout) as client:
-            response = client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            response_data = response.json()
-
-        # Record usage
-        if "usage" in response_data:
-            usage = response_data["usage"]
-            record_usage(
-                provider="openai",
-                model=self.config.model,
-                prompt_tokens=usage.get("prompt_tokens", 0),
-                completion_tokens=usage.get("completion_tokens", 0),
-            )
+        client = get_sync_client("openai", self.config.base_url)
+        response = client.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=settings.openai_timeout,
+        )
+        response.raise_for_status()
+        response_data = response.json()
 
         content = response_data["choices"][0]["message"]["content"]
-        result = json.loads(content)
-        validate_contract(result)
-        return result
+        self._record_usage(response_data, payload, content)
+        return safe_json_loads(content)
 
     async def translate_async(
         self,
@@ -131,27 +123,42 @@ class OpenAITranslator:
         }
         url = f"{self.config.base_url}/chat/completions"
 
-        async with httpx.AsyncClient(
-            timeout=settings.openai_timeout
-        ) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            response_data = response.json()
-
-        # Record usage
-        if "usage" in response_data:
-            usage = response_data["usage"]
-            record_usage(
-                provider="openai",
-                model=self.config.model,
-                prompt_tokens=usage.get("prompt_tokens", 0),
-                completion_tokens=usage.get("completion_tokens", 0),
-            )
+        client = get_async_client("openai", self.config.base_url)
+        response = await client.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=settings.openai_timeout,
+        )
+        response.raise_for_status()
+        response_data = response.json()
 
         content = response_data["choices"][0]["message"]["content"]
-        result = json.loads(content)
-        validate_contract(result)
-        return result
+        self._record_usage(response_data, payload, content)
+        return safe_json_loads(content)
+
+    def _record_usage(
+        self,
+        response_data: dict,
+        payload: dict | None = None,
+        content: str | None = None,
+    ) -> None:
+        usage = response_data.get("usage")
+        if not usage:
+            return
+        details = usage.get("prompt_tokens_details") or {}
+        prompt_text = (
+            "\n".join(m["content"] for m in payload["messages"]) if payload else None
+        )
+        record_usage(
+            provider="openai",
+            model=self.config.model,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cached_tokens=details.get("cached_tokens", 0),
+            prompt_text=prompt_text,
+            completion_text=content,
+        )
 
     def _get_system_message(self) -> str:
         try:
@@ -178,10 +185,15 @@ class OpenAITranslator:
             "Content-Type": "application/json",
         }
         url = f"{self.config.base_url}/chat/completions"
-        with httpx.Client(timeout=settings.openai_timeout) as client:
-            response = client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            response_data = response.json()
+        client = get_sync_client("openai", self.config.base_url)
+        response = client.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=settings.openai_timeout,
+        )
+        response.raise_for_status()
+        response_data = response.json()
         return response_data["choices"][0]["message"]["content"]
 
     async def complete_async(
@@ -207,10 +219,13 @@ class OpenAITranslator:
             "Content-Type": "application/json",
         }
         url = f"{self.config.base_url}/chat/completions"
-        async with httpx.AsyncClient(
-            timeout=settings.openai_timeout
-        ) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            response_data = response.json()
+        client = get_async_client("openai", self.config.base_url)
+        response = await client.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=settings.openai_timeout,
+        )
+        response.raise_for_status()
+        response_data = response.json()
         return response_data["choices"][0]["message"]["content"]
@@ -1,20 +1,126 @@
+"""Per-document context index for LLM prompts.
+
+The index is built once per document: a slide → texts map plus a short
+title and summary string per slide. ``build_context`` then only looks up
+the slides of a chunk, memoizes the payload per slide set and keeps it
+under a token budget. The ``summary`` strategy sends the same cached deck
+summary with every chunk.
+"""
+
 from __future__ import annotations
 
-def build_context(  # noqa: C901
+import json
+
+from backend.config import settings
+from backend.services.llm_deck_summary import get_deck_summary
+from backend.services.token_tracker import estimate_tokens
+
+TITLE_CHARS = 80
+SUMMARY_CHARS = 240
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+class DocumentContextIndex:
+    """Slide lookup tables shared by every chunk of one document."""
+
+    def __init__(self, all_blocks: list[dict], max_tokens: int | None = None):
+        self.max_tokens = (
+            settings.llm_context_max_tokens if max_tokens is None else max_tokens
+        )
+        self.texts_by_slide: dict[int, list[str]] = {}
+        for block in all_blocks:
+            slide_index = block.get("slide_index")
+            text = (block.get("source_text") or "").strip()
+            if slide_index is None or not text:
+                continue
+            self.texts_by_slide.setdefault(slide_index, []).append(text)
+        self.total_slides = (
+            max(self.texts_by_slide) + 1 if self.texts_by_slide else 0
+        )
+        self.titles = {
+            slide: _clip(texts[0], TITLE_CHARS)
+            for slide, texts in self.texts_by_slide.items()
+        }
+        self.summaries = {
+            slide: _clip(" / ".join(texts), SUMMARY_CHARS)
+            for slide, texts in self.texts_by_slide.items()
+        }
+        self.deck_summary: dict | None = None
+        self._memo: dict[tuple[str, tuple[int, ...]], dict | None] = {}
+
+    def get_deck_summary(self) -> dict:
+        if self.deck_summary is None:
+            self.deck_summary = get_deck_summary(self.texts_by_slide)
+        return self.deck_summary
+
+    def build(self, strategy: str, chunk_slides: list[int]) -> dict | None:
+        key = (strategy, tuple(chunk_slides))
+        if key not in self._memo:
+            self._memo[key] = self._build(strategy, chunk_slides)
+        return self._memo[key]
+
+    def _build(self, strategy: str, chunk_slides: list[int]) -> dict | None:
+        if strategy == "neighbor":
+            # Current slides first so they survive the token cap.
+            slides = list(chunk_slides)
+            for slide_index in chunk_slides:
+                slides.extend((slide_index - 1, slide_index + 1))
+            entries = self._entries(slides, summary=True)
+        elif strategy == "title-only":
+            entries = self._entries(chunk_slides, summary=False)
+        elif strategy == "deck":
+            entries = self._entries(sorted(self.texts_by_slide)[:2], summary=True)
+        elif strategy == "summary":
+            return {
+                "strategy": strategy,
+                "deck_summary": self.get_deck_summary(),
+                "current_slides": list(chunk_slides),
+                "total_slides": self.total_slides,
+            }
+        else:
+            return None
+        return {
+            "strategy": strategy,
+            "context_slides": entries,
+            "current_slides": list(chunk_slides),
+            "total_slides": self.total_slides,
+        }
+
+    def _entries(self, slides: list[int], summary: bool) -> list[dict]:
+        entries: list[dict] = []
+        used = 0
+        for slide_index in dict.fromkeys(slides):
+            if slide_index not in self.texts_by_slide:
+                continue
+            entry = {"slide": slide_index, "title": self.titles[slide_index]}
+            if summary:
+                entry["summary"] = self.summaries[slide_index]
+            cost = estimate_tokens(json.dumps(entry, ensure_ascii=False))
+            if entries and used + cost > self.max_tokens:
+                break
+            entries.append(entry)
+            used += cost
+        return sorted(entries, key=lambda entry: entry["slide"])
+
+
+def build_context(
     strategy: str,
     all_blocks: list[dict],
     chunk_blocks: list[dict],
+    index: DocumentContextIndex | None = None,
 ) -> dict | None:
+    """Return the context payload for a chunk.
+
+    Pass the document's ``index`` to avoid rebuilding it for each chunk.
+    """
     if strategy == "none":
         return None
-
-    blocks_by_slide: dict[int, list[dict]] = {}
-    for block in all_blocks:
-        slide_index = block.get("slide_index")
-        if slide_index is None:
-            continue
-        blocks_by_slide.setdefault(slide_index, []).append(block)
-
+    if index is None:
+        index = DocumentContextIndex(all_blocks)
     chunk_slides = sorted(
         {
             block.get("slide_index")
@@ -22,43 +128,4 @@ def build_context(  # noqa: C901
             if block.get("slide_index") is not None
         }
     )
-    total_slides = max(blocks_by_slide.keys()) + 1 if blocks_by_slide else 0
-
-    if strategy == "neighbor":
-        context_blocks = []
-        for slide_index in chunk_slides:
-            for neighbor in (slide_index - 1, slide_index, slide_index + 1):
-                context_blocks.extend(blocks_by_slide.get(neighbor, []))
-        return {
-            "strategy": "neighbor",
-            "context_blocks": context_blocks,
-            "current_slides": chunk_slides,
-            "total_slides": total_slides,
-        }
-
-    if strategy == "title-only":
-        title_blocks = []
-        for slide_index in chunk_slides:
-            slide_blocks = blocks_by_slide.get(slide_index, [])
-            if slide_blocks:
-                # Try to pick a block that looks like a title (usually first).
-                title_blocks.append(slide_blocks[0])
-        return {
-            "strategy": "title-only",
-            "context_blocks": title_blocks,
-            "current_slides": chunk_slides,
-            "total_slides": total_slides,
-        }
-
-    if strategy == "deck":
-        deck_blocks = []
-        for slide_index in sorted(blocks_by_slide.keys())[:2]:
-            deck_blocks.extend(blocks_by_slide.get(slide_index, []))
-        return {
-            "strategy": "deck",
-            "context_blocks": deck_blocks,
-            "current_slides": chunk_slides,
-            "total_slides": total_slides,
-        }
-
-    return None
+    return index.build(strategy, chunk_slides)
@@ -0,0 +1,219 @@
+"""Deck-level summary used by the ``summary`` context strategy.
+
+A compact summary (topic, audience, key terms) is produced once per
+document, either extractively or with one cheap LLM call, and cached by
+the hash of the document text (plus provider and model for LLM
+summaries). Every chunk then carries the same small
+payload instead of neighbouring slides.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from backend.config import settings
+from backend.services.token_tracker import estimate_tokens
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_KEY_TERMS = 12
+TOPIC_CHARS = 120
+LLM_SAMPLE_CHARS = 4000
+CACHE_SIZE = 128
+
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9\-]{2,}")
+_CJK_RUN_RE = re.compile(r"[一-鿿]{2,}")
+# CJK has no word boundaries: candidate terms are the 2-4 character
+# n-grams of each run, and an n-gram only counts as a term when no longer
+# candidate recurs on as many slides.
+_CJK_NGRAM_SIZES = (2, 3, 4)
+# Function characters that do not start or end a term.
+_CJK_EDGE_STOPCHARS = frozenset("的了是在和與及或等也就都而之其為以於")
+_STOPWORDS = frozenset(
+    "the and for with from that this are was were will have has not you your our "
+    "all can its into more than then also but any per via".split()
+)
+
+_LOCK = threading.Lock()
+_CACHE: OrderedDict[str, dict] = OrderedDict()
+
+
+def content_hash(
+    texts_by_slide: dict[int, list[str]],
+    method: str,
+    provider: str | None = None,
+    model: str | None = None,
+) -> str:
+    digest = hashlib.sha256(f"{method}\x1f{provider or ''}\x1f{model or ''}".encode())
+    for slide_index in sorted(texts_by_slide):
+        digest.update(f"\x1e{slide_index}\x1f".encode())
+        digest.update("\x1f".join(texts_by_slide[slide_index]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cjk_terms(text: str) -> set[str]:
+    terms = set()
+    for run in _CJK_RUN_RE.findall(text):
+        for size in _CJK_NGRAM_SIZES:
+            for start in range(len(run) - size + 1):
+                gram = run[start:start + size]
+                if gram[0] in _CJK_EDGE_STOPCHARS or gram[-1] in _CJK_EDGE_STOPCHARS:
+                    continue
+                terms.add(gram)
+    return terms
+
+
+def _drop_subsumed(slide_counts: Counter[str]) -> None:
+    """Drop CJK n-grams found inside a longer one on as many slides."""
+    grams = [key for key in slide_counts if _CJK_RUN_RE.fullmatch(key)]
+    for gram in grams:
+        count = slide_counts[gram]
+        if any(
+            len(other) > len(gram) and gram in other and slide_counts[other] >= count
+            for other in grams
+        ):
+            del slide_counts[gram]
+
+
+def _key_terms(texts_by_slide: dict[int, list[str]]) -> list[str]:
+    """Words that recur across slides, most widespread first."""
+    slide_counts: Counter[str] = Counter()
+    spelling: dict[str, str] = {}
+    for texts in texts_by_slide.values():
+        text = " ".join(texts)
+        seen: set[str] = set()
+        for match in _WORD_RE.finditer(text):
+            word = match.group(0)
+            key = word.lower()
+            if key in _STOPWORDS or key in seen:
+                continue
+            seen.add(key)
+            spelling.setdefault(key, word)
+        for gram in _cjk_terms(text):
+            seen.add(gram)
+            spelling.setdefault(gram, gram)
+        slide_counts.update(seen)
+    min_slides = 2 if len(texts_by_slide) > 1 else 1
+    slide_counts = Counter(
+        {key: count for key, count in slide_counts.items() if count >= min_slides}
+    )
+    _drop_subsumed(slide_counts)
+    return [spelling[key] for key, _ in slide_counts.most_common()][:MAX_KEY_TERMS]
+
+
+def extract_deck_summary(texts_by_slide: dict[int, list[str]]) -> dict:
+    """Build the summary from the first title and recurring terms."""
+    topic = ""
+    if texts_by_slide:
+        topic = texts_by_slide[min(texts_by_slide)][0]
+    return {
+        "topic": " ".join(topic.split())[:TOPIC_CHARS],
+        "key_terms": _key_terms(texts_by_slide),
+    }
+
+
+def _llm_sample(texts_by_slide: dict[int, list[str]]) -> str:
+    lines = []
+    size = 0
+    for slide_index in sorted(texts_by_slide):
+        line = f"[{slide_index + 1}] " + " / ".join(texts_by_slide[slide_index])
+        if size + len(line) > LLM_SAMPLE_CHARS:
+            break
+        lines.append(line)
+        size += len(line)
+    return "\n".join(lines)
+
+
+def summarize_with_llm(texts_by_slide: dict[int, list[str]], client) -> dict:
+    """Ask ``client`` for a JSON summary; raises ValueError on bad output."""
+    from backend.services.llm_utils import safe_json_loads
+    from backend.services.prompt_store import render_prompt
+
+    prompt = render_prompt(
+        "deck_summary", {"text_sample": _llm_sample(texts_by_slide)}
+    )
+    if hasattr(client, "complete"):
+        response = client.complete(prompt)
+    elif hasattr(client, "translate_plain"):
+        response = client.translate_plain(prompt)
+    else:
+        raise ValueError("翻譯器不支援摘要生成")
+
+    data = safe_json_loads(response)
+    if not isinstance(data, dict) or not data.get("topic"):
+        raise ValueError("摘要回應格式錯誤")
+    terms = data.get("key_terms") or []
+    return {
+        "topic": " ".join(str(data["topic"]).split())[:TOPIC_CHARS],
+        "audience": " ".join(str(data.get("audience") or "").split())[:TOPIC_CHARS],
+        "key_terms": [str(term) for term in terms if term][:MAX_KEY_TERMS],
+    }
+
+
+def cap_summary(summary: dict, max_tokens: int) -> dict:
+    """Drop trailing key terms until the summary fits ``max_tokens``."""
+    capped = {key: value for key, value in summary.items() if value}
+    terms = list(capped.get("key_terms", []))
+    while terms and estimate_tokens(json.dumps(capped, ensure_ascii=False)) > max_tokens:
+        terms.pop()
+        capped["key_terms"] = terms
+    if not terms:
+        capped.pop("key_terms", None)
+    return capped
+
+
+def get_deck_summary(
+    texts_by_slide: dict[int, list[str]],
+    client=None,
+    method: str | None = None,
+    provider: str | None = None,
+    model: str | None = None,
+) -> dict:
+    """Return the cached deck summary, generating it on first use.
+
+    ``method`` is ``extractive`` or ``llm``; the LLM method falls back to
+    the extractive summary (without caching it) when the call fails. LLM
+    summaries are cached per ``provider`` and ``model`` (defaulting to
+    the client's class and ``model`` attribute).
+    """
+    method = (method or settings.llm_context_summary_method).lower()
+    if method != "llm" or client is None:
+        method = "extractive"
+        provider = model = None
+    else:
+        provider = provider or type(client).__name__
+        model = model or getattr(client, "model", None)
+    key = content_hash(texts_by_slide, method, provider, model)
+    with _LOCK:
+        if key in _CACHE:
+            _CACHE.move_to_end(key)
+            return _CACHE[key]
+
+    if method == "llm":
+        try:
+            summary = summarize_with_llm(texts_by_slide, client)
+        except Exception as exc:
+            LOGGER.warning("Deck summary via LLM failed, using extractive: %s", exc)
+            return cap_summary(
+                extract_deck_summary(texts_by_slide),
+                settings.llm_context_summary_tokens,
+            )
+    else:
+        summary = extract_deck_summary(texts_by_slide)
+
+    summary = cap_summary(summary, settings.llm_context_summary_tokens)
+    with _LOCK:
+        _CACHE[key] = summary
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return summary
+
+
+def clear_deck_summary_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 
+import httpx
+
 def _iter_errors(error: BaseException) -> Iterable[BaseException]:
     current: BaseException | None = error
     seen: set[int] = set()
@@ -43,3 +46,23 @@ def build_connection_refused_message(
         f"無法連線到 {provider_label} 服務（{location}），"
         "請確認服務已啟動且 Base URL 正確。"
     )
+
+
+def is_request_error(error: BaseException) -> bool:
+    """Return True if the error came from the HTTP layer (not the output).
+
+    Transport failures, timeouts and HTTP error responses mean the request
+    itself failed, so splitting the chunk would not help.
+    """
+    return any(
+        isinstance(item, (httpx.HTTPError, TimeoutError, asyncio.TimeoutError))
+        for item in _iter_errors(error)
+    )
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """Return True if the request failed because it timed out."""
+    return any(
+        isinstance(item, (httpx.TimeoutException, TimeoutError, asyncio.TimeoutError))
+        for item in _iter_errors(error)
+    )
@@ -0,0 +1,122 @@
+"""Shared HTTP clients for LLM providers.
+
+Clients are pooled per (provider, host) so that every chunk, job and
+translator instance reuses the same keep-alive connections instead of
+paying for TCP/TLS setup on each request. Async clients are bound to the
+event loop that created them, so they are additionally keyed by loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+
+from backend.config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+_LOCK = threading.Lock()
+_SYNC_CLIENTS: dict[tuple[str, str], httpx.Client] = {}
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def _http2_enabled() -> bool:
+    if not settings.llm_http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+    )
+
+
+def host_key(base_url: str) -> str:
+    """Return ``scheme://host:port`` used to share pools between URLs."""
+    parts = urlsplit(base_url)
+    if not parts.netloc:
+        return base_url.rstrip("/")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_sync_client(provider: str, base_url: str) -> httpx.Client:
+    """Return the pooled sync client for ``provider`` at ``base_url``."""
+    key = (provider, host_key(base_url))
+    with _LOCK:
+        client = _SYNC_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                limits=_build_limits(),
+                http2=_http2_enabled(),
+            )
+            _SYNC_CLIENTS[key] = client
+        return client
+
+
+def get_async_client(provider: str, base_url: str) -> httpx.AsyncClient:
+    """Return the pooled async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (provider, host_key(base_url))
+    with _LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=_build_limits(),
+                http2=_http2_enabled(),
+            )
+            clients[key] = client
+        return client
+
+
+def init_http_clients() -> None:
+    """Pre-create pools for the configured provider endpoints."""
+    for base_url in settings.ollama_base_url.split(","):
+        if base_url.strip():
+            get_sync_client("ollama", base_url.strip())
+            get_async_client("ollama", base_url.strip())
+    if settings.openai_api_key:
+        get_async_client("openai", settings.openai_base_url)
+    if settings.gemini_api_key:
+        get_async_client("gemini", settings.gemini_base_url)
+    LOGGER.info(
+        "LLM HTTP pools ready (max_connections=%s, http2=%s)",
+        settings.llm_http_max_connections,
+        _http2_enabled(),
+    )
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client. Called on application shutdown."""
+    with _LOCK:
+        sync_clients = list(_SYNC_CLIENTS.values())
+        _SYNC_CLIENTS.clear()
+        async_clients = [
+            client
+            for clients in _ASYNC_CLIENTS.values()
+            for client in clients.values()
+        ]
+        _ASYNC_CLIENTS.clear()
+
+    for client in sync_clients:
+        client.close()
+    for client in async_clients:
+        try:
+            await client.aclose()
+        except RuntimeError:
+            # Client belongs to a loop that is already closed.
+            pass
@@ -1,41 +1,235 @@
 from __future__ import annotations
 
+import itertools
 import json
+import logging
+import re
 from collections.abc import Iterable
+from functools import lru_cache
 
+from backend.config import settings
 from backend.services.prompt_store import render_prompt
+from backend.services.token_tracker import (
+    estimate_tokens,
+    record_prompt_compaction,
+)
 from backend.services.translate_config import (
     get_language_example as _language_example,
     get_language_hint as _language_hint,
     get_language_label as _language_label,
 )
 
-def build_prompt(
-    blocks: Iterable[dict],
+LOGGER = logging.getLogger(__name__)
+
+COMPACT_OUTPUT_EXAMPLE = {"blocks": [{"id": 0, "translated_text": "..."}]}
+# Compact prompts only serialize the full payload for every Nth request,
+# to measure the savings without paying for both forms each time.
+COMPACTION_SAMPLE_EVERY = 20
+_COMPACTION_COUNTER = itertools.count()
+# Context keys that are identical for every chunk of a document.
+STABLE_CONTEXT_KEYS = ("deck_summary",)
+COMPACT_OUTPUT_HINT = (
+    "請依 output_format 輸出 JSON：每個區塊回傳相同的 id 與 translated_text。"
+)
+
+
+@lru_cache(maxsize=32)
+def _term_matcher(sources: tuple[str, ...]) -> re.Pattern | None:
+    # Longest terms first so the alternation prefers the most specific match.
+    unique = sorted({source for source in sources if source}, key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(source) for source in unique), re.IGNORECASE)
+
+
+def select_chunk_terms(
+    preferred_terms: list[tuple[str, str]] | None,
+    texts: Iterable[str],
+) -> list[tuple[str, str]]:
+    """Return the preferred terms whose source occurs in ``texts``.
+
+    Matching is case-insensitive, like placeholder substitution. A short
+    term that only occurs inside a longer matched term is left out.
+    """
+    if not preferred_terms:
+        return []
+    matcher = _term_matcher(tuple(source for source, _ in preferred_terms))
+    if matcher is None:
+        return []
+    found = {
+        match.group(0).lower()
+        for text in texts
+        if text
+        for match in matcher.finditer(text)
+    }
+    return [
+        (source, target)
+        for source, target in preferred_terms
+        if source and source.lower() in found
+    ]
+
+
+def _split_context(context: dict | None) -> tuple[dict, dict]:
+    """Separate document-wide context (deck summary) from per-chunk keys."""
+    if not context:
+        return {}, {}
+    stable = {key: context[key] for key in STABLE_CONTEXT_KEYS if key in context}
+    chunk = {
+        key: value
+        for key, value in context.items()
+        if key not in STABLE_CONTEXT_KEYS
+    }
+    return stable, chunk
+
+
+def _join_payload(stable: dict, chunk: dict, compact: bool) -> str:
+    """Serialize the job-wide part first so it forms a cacheable prefix."""
+    separators = (",", ":") if compact else None
+    return "\n".join(
+        json.dumps(part, ensure_ascii=False, separators=separators)
+        for part in (stable, chunk)
+    )
+
+
+def _full_payload(
+    blocks: list[dict],
     target_language: str,
     contract_example: dict,
     context: dict | None,
-    preferred_terms: list[tuple[str, str]] | None = None,
-    placeholder_tokens: list[str] | None = None,
-    language_hint: str | None = None,
-    mode: str = "direct",
+    preferred_terms: list[tuple[str, str]] | None,
+    placeholder_tokens: list[str] | None,
+    mode: str,
 ) -> str:
-    input_payload = {
+    stable_context, chunk_context = _split_context(context)
+    stable = {
         "target_language": target_language,
         "mode": mode,
-        "blocks": list(blocks),
         "contract_schema_example": contract_example,
     }
     if preferred_terms:
-        input_payload["preferred_terms"] = [
+        stable["preferred_terms"] = [
             {"source": source, "target": target}
             for source, target in preferred_terms
         ]
+    if stable_context:
+        stable["document_context"] = stable_context
+    chunk: dict = {}
+    if chunk_context:
+        chunk["context"] = chunk_context
     if placeholder_tokens:
-        input_payload["placeholder_tokens"] = placeholder_tokens
-    if context:
-        input_payload["context"] = context
-    payload = json.dumps(input_payload, ensure_ascii=False)
+        chunk["placeholder_tokens"] = placeholder_tokens
+    chunk["blocks"] = blocks
+    return _join_payload(stable, chunk, compact=False)
+
+
+def _compact_payload(
+    blocks: list[dict],
+    target_language: str,
+    context: dict | None,
+    preferred_terms: list[tuple[str, str]] | None,
+    placeholder_tokens: list[str] | None,
+    mode: str,
+) -> str:
+    """Serialize only what the model needs: id + text per block."""
+    records = []
+    for i, block in enumerate(blocks):
+        record = {"id": i, "text": block.get("source_text", "")}
+        if block.get("alignment_source"):
+            record["alignment_source"] = block["alignment_source"]
+        records.append(record)
+    stable_context, chunk_context = _split_context(context)
+    stable = {
+        "target_language": target_language,
+        "mode": mode,
+        "output_format": COMPACT_OUTPUT_EXAMPLE,
+    }
+    if stable_context:
+        stable["document_context"] = stable_context
+    chunk: dict = {}
+    # Terms are selected per chunk, so they belong to the varying part.
+    terms = select_chunk_terms(preferred_terms, [r["text"] for r in records])
+    if terms:
+        chunk["preferred_terms"] = [list(term) for term in terms]
+    if chunk_context:
+        chunk["context"] = chunk_context
+    if placeholder_tokens:
+        chunk["placeholder_tokens"] = placeholder_tokens
+    chunk["blocks"] = records
+    return _join_payload(stable, chunk, compact=True)
+
+
+def _record_compaction(compact_payload: str, full_payload: str) -> None:
+    full_tokens = estimate_tokens(full_payload)
+    compact_tokens = estimate_tokens(compact_payload)
+    record_prompt_compaction(full_tokens, compact_tokens)
+    LOGGER.info(
+        "Compact prompt payload: %s tokens (full %s, saved %.0f%%)",
+        compact_tokens,
+        full_tokens,
+        100 * (1 - compact_tokens / full_tokens),
+    )
+
+
+def build_prompt(
+    blocks: Iterable[dict],
+    target_language: str,
+    contract_example: dict,
+    context: dict | None,
+    preferred_terms: list[tuple[str, str]] | None = None,
+    placeholder_tokens: list[str] | None = None,
+    language_hint: str | None = None,
+    mode: str = "direct",
+    compact: bool | None = None,
+) -> str:
+    """Render the JSON translation prompt.
+
+    The payload is two JSON lines: job-wide material (target language,
+    contract example, glossary, deck summary) first, then the chunk's
+    context and blocks. Everything before the second line is identical for
+    every chunk of a job, so providers can reuse the prompt prefix.
+
+    In compact mode (``LLM_PROMPT_COMPACT``) blocks are sent as ``id`` +
+    ``text`` records and only the preferred terms found in the chunk are
+    included. For every ``COMPACTION_SAMPLE_EVERY``-th compact prompt the
+    full payload is also built and the token estimates of both are
+    logged and recorded.
+    """
+    blocks = list(blocks)
+    if compact is None:
+        compact = settings.llm_prompt_compact
+    if compact:
+        payload = _compact_payload(
+            blocks,
+            target_language,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+            mode,
+        )
+        if next(_COMPACTION_COUNTER) % COMPACTION_SAMPLE_EVERY == 0:
+            _record_compaction(
+                payload,
+                _full_payload(
+                    blocks,
+                    target_language,
+                    contract_example,
+                    context,
+                    preferred_terms,
+                    placeholder_tokens,
+                    mode,
+                ),
+            )
+        language_hint = f"{COMPACT_OUTPUT_HINT}\n{language_hint or ''}"
+    else:
+        payload = _full_payload(
+            blocks,
+            target_language,
+            contract_example,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+            mode,
+        )
 
     # Merge static hint (from map) and dynamic hint (from args)
     static_hint = _language_hint(target_language)
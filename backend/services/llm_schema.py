@@ -0,0 +1,144 @@
+"""Schema-constrained structured output for translation requests.
+
+When ``LLM_STRUCTURED_OUTPUT`` is enabled, Ollama (``format``) and Gemini
+(``responseSchema``) are sent a JSON Schema that pins the response to
+exactly one ``{id, translated_text}`` item per block. Responses that
+match are read through :func:`parse_structured_blocks` without the
+lenient JSON repair path; the outcome is tracked per provider and model.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+from backend.services.llm_utils import safe_json_loads
+
+_GEMINI_KEYS = ("type", "properties", "items", "required", "minItems", "maxItems")
+
+
+def build_translation_schema(count: int) -> dict:
+    """JSON Schema for a response with exactly ``count`` blocks."""
+    return {
+        "type": "object",
+        "properties": {
+            "blocks": {
+                "type": "array",
+                "minItems": count,
+                "maxItems": count,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "maximum": max(count - 1, 0),
+                        },
+                        "translated_text": {"type": "string"},
+                    },
+                    "required": ["id", "translated_text"],
+                },
+            }
+        },
+        "required": ["blocks"],
+    }
+
+
+def to_gemini_schema(schema: dict) -> dict:
+    """Convert to the OpenAPI subset accepted by Gemini ``responseSchema``."""
+    converted: dict = {}
+    for key in _GEMINI_KEYS:
+        if key not in schema:
+            continue
+        value = schema[key]
+        if key == "type":
+            value = value.upper()
+        elif key == "properties":
+            value = {name: to_gemini_schema(sub) for name, sub in value.items()}
+        elif key == "items":
+            value = to_gemini_schema(value)
+        converted[key] = value
+    return converted
+
+
+def parse_structured_blocks(data, count: int) -> list[str] | None:
+    """Return the texts in id order if ``data`` matches the schema exactly."""
+    if not isinstance(data, dict):
+        return None
+    items = data.get("blocks")
+    if not isinstance(items, list) or len(items) != count:
+        return None
+    texts: list[str | None] = [None] * count
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        index = item.get("id")
+        text = item.get("translated_text")
+        if (
+            not isinstance(index, int)
+            or not 0 <= index < count
+            or texts[index] is not None
+            or not isinstance(text, str)
+        ):
+            return None
+        texts[index] = text
+    return texts  # type: ignore[return-value]
+
+
+_LOCK = threading.Lock()
+_STATS: dict[tuple[str, str], dict[str, int]] = {}
+
+
+def record_structured_result(provider: str, model: str, ok: bool) -> None:
+    with _LOCK:
+        stats = _STATS.setdefault((provider, model), {"requests": 0, "valid": 0})
+        stats["requests"] += 1
+        if ok:
+            stats["valid"] += 1
+
+
+def get_structured_output_stats() -> list[dict]:
+    """Schema success rate per (provider, model) since process start."""
+    with _LOCK:
+        items = [(key, dict(stats)) for key, stats in _STATS.items()]
+    return [
+        {
+            "provider": provider,
+            "model": model,
+            "requests": stats["requests"],
+            "valid": stats["valid"],
+            "success_rate": round(stats["valid"] / stats["requests"], 4),
+        }
+        for (provider, model), stats in items
+    ]
+
+
+def reset_structured_output_stats() -> None:
+    with _LOCK:
+        _STATS.clear()
+
+
+def load_structured_response(
+    content: str,
+    count: int,
+    provider: str,
+    model: str,
+) -> dict:
+    """Parse a schema-constrained response, falling back to lenient parsing.
+
+    The fast path is a plain ``json.loads`` plus an exact shape check; only
+    when that fails does the response go through ``safe_json_loads``.
+    """
+    try:
+        data = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        data = None
+    texts = parse_structured_blocks(data, count)
+    record_structured_result(provider, model, texts is not None)
+    if texts is not None:
+        return {
+            "blocks": [
+                {"id": i, "translated_text": text} for i, text in enumerate(texts)
+            ]
+        }
+    return safe_json_loads(content)
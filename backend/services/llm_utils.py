@@ -13,10 +13,65 @@ def safe_json_loads(content: str) -> dict:
         start = content.find("{")
         end = content.rfind("}")
         if start != -1 and end != -1 and end > start:
-            return json.loads(content[start:end + 1])
+            try:
+                return json.loads(content[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+        salvaged = salvage_truncated_json(content)
+        if salvaged is not None:
+            return salvaged
         raise ValueError("LLM response is not valid JSON") from err
 
 
+def salvage_truncated_json(content: str, max_attempts: int = 50) -> dict | None:
+    """Recover the complete prefix of a truncated JSON object.
+
+    The latest point where a nested object closed is tried first, with
+    the brackets still open at that point appended. A response cut off
+    mid-way through ``blocks`` therefore keeps every finished block.
+    """
+    start = content.find("{")
+    if start == -1:
+        return None
+    cuts = _json_cut_points(content, start)
+    for end, closing in reversed(cuts[-max_attempts:]):
+        try:
+            result = json.loads(content[start:end] + closing)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(result, dict):
+            return result
+    return None
+
+
+def _json_cut_points(content: str, start: int) -> list[tuple[int, str]]:  # noqa: C901
+    """Return (end, closing brackets) after each nested object closes."""
+    stack: list[str] = []
+    cuts: list[tuple[int, str]] = []
+    in_string = False
+    escaped = False
+    for pos in range(start, len(content)):
+        char = content[pos]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not stack:
+                break
+            stack.pop()
+            if char == "}" and stack:
+                cuts.append((pos + 1, "".join(reversed(stack))))
+    return cuts
+
+
 def cache_key(block: dict, context: dict | None = None) -> str:
     """Generate a cache key based on text and optional LLM context."""
     text = block.get("source_text", "").strip()
@@ -48,6 +103,28 @@ def chunked(
         yield items[i:i + size]
 
 
+def chunked_by_tokens(
+    items: list[tuple[int, dict]],
+    size: int,
+    token_counts: list[int],
+    max_tokens: int,
+) -> Iterable[list[tuple[int, dict]]]:
+    """Like ``chunked`` but also closes a chunk at ``max_tokens``.
+
+    A single block above the budget still gets a chunk of its own.
+    """
+    chunk: list[tuple[int, dict]] = []
+    used = 0
+    for item, tokens in zip(items, token_counts, strict=True):
+        if chunk and (len(chunk) >= size or used + tokens > max_tokens):
+            yield chunk
+            chunk, used = [], 0
+        chunk.append(item)
+        used += tokens
+    if chunk:
+        yield chunk
+
+
 def tm_respects_terms(
     source_text: str,
     translated_text: str,
@@ -0,0 +1,163 @@
+"""Numeric templating: translate number-only variants of a string once.
+
+"Page 3 of 42", "Page 4 of 42" and "Page 5 of 42" only differ in their
+digits. Before cache and TM lookup, dates, currency amounts and
+standalone numbers are masked with typed slots (``__DATE_0__``,
+``__AMT_1__``, ``__NUM_2__``). All blocks sharing a template are sent to
+the LLM once, and the original values are put back into each instance.
+
+A template translation that lost, duplicated or invented a slot is not
+used (nor cached). Those blocks are translated again without templating.
+Templated text is never written to the translation memory.
+"""
+
+from __future__ import annotations
+
+import re
+
+_SLOT_RE = re.compile(
+    r"(?P<DATE>(?<!\d)(?:\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4})(?!\d))"
+    r"|(?P<AMT>(?:NT\$|US\$|[$€£¥₫])\s?\d[\d,]*(?:\.\d+)?)"
+    # Standalone numbers only: "Q3", "4G" or "COVID-19" stay as they are.
+    r"|(?P<NUM>(?<![A-Za-z_\d])(?<![A-Za-z]-)\d+(?:[.,]\d+)*(?![A-Za-z_\d]))"
+)
+_TOKEN_RE = re.compile(r"__(?:DATE|AMT|NUM)_(\d+)__")
+
+
+def make_template(text: str) -> tuple[str, list[str]]:
+    """Mask numeric values in ``text``; returns (template, values)."""
+    values: list[str] = []
+
+    def _slot(match: re.Match) -> str:
+        token = f"__{match.lastgroup}_{len(values)}__"
+        values.append(match.group(0))
+        return token
+
+    return _SLOT_RE.sub(_slot, text), values
+
+
+def slot_tokens(text: str) -> list[str]:
+    return [match.group(0) for match in _TOKEN_RE.finditer(text or "")]
+
+
+def strip_slots(text: str) -> str:
+    """Drop slot tokens, e.g. before language detection."""
+    return _TOKEN_RE.sub("", text or "")
+
+
+def _slot_indices(text: str) -> list[int]:
+    return sorted(int(index) for index in _TOKEN_RE.findall(text or ""))
+
+
+def slots_intact(template: str, translated: str) -> bool:
+    """True if ``translated`` has exactly the slots of ``template``."""
+    return _slot_indices(translated) == _slot_indices(template)
+
+
+def fill_template(translated: str, values: list[str]) -> str | None:
+    """Put ``values`` back into a translated template.
+
+    Returns None unless every slot appears exactly once.
+    """
+    if _slot_indices(translated) != list(range(len(values))):
+        return None
+    return _TOKEN_RE.sub(lambda match: values[int(match.group(1))], translated)
+
+
+class NumericTemplates:
+    """Per-job bookkeeping of templated blocks and their duplicates."""
+
+    def __init__(self) -> None:
+        self._values: dict[int, list[str]] = {}
+        # Representative block index -> pending entries sharing its template.
+        self._members: dict[int, list[tuple[int, dict]]] = {}
+        self.failed: list[int] = []
+
+    @property
+    def templated_count(self) -> int:
+        return len(self._values)
+
+    def apply(self, blocks: list[dict]) -> list[dict]:
+        """Return ``blocks`` with numeric values masked in ``source_text``."""
+        templated = []
+        for index, block in enumerate(blocks):
+            text = block.get("source_text", "")
+            if block.get("alignment_role") or not text:
+                templated.append(block)
+                continue
+            template, values = make_template(text)
+            if not values:
+                templated.append(block)
+                continue
+            self._values[index] = values
+            templated.append({**block, "source_text": template})
+        return templated
+
+    def dedupe(self, pending: list[tuple[int, dict]]) -> list[tuple[int, dict]]:
+        """Keep one pending entry per template; the rest follow it."""
+        first: dict[str, int] = {}
+        kept = []
+        for item in pending:
+            index, block = item
+            if index not in self._values:
+                kept.append(item)
+                continue
+            template = block.get("source_text", "").strip()
+            representative = first.setdefault(template, index)
+            if representative == index:
+                kept.append(item)
+            else:
+                self._members.setdefault(representative, []).append(item)
+        return kept
+
+    def fill(
+        self,
+        chunk: list[tuple[int, dict]],
+        translated_texts: list[str | None],
+    ) -> list[tuple[int, dict]]:
+        """Fill in a finished chunk and its duplicates.
+
+        Returns the chunk extended with the duplicates, so progress
+        reporting covers every block that got its text.
+        """
+        expanded = []
+        for item in chunk:
+            expanded.append(item)
+            index = item[0]
+            if index not in self._values:
+                continue
+            members = self._members.pop(index, [])
+            translated = translated_texts[index]
+            for member_index, _ in [item, *members]:
+                self._fill_one(member_index, translated, translated_texts)
+            expanded.extend(members)
+        return expanded
+
+    def fill_cached(self, translated_texts: list[str | None]) -> None:
+        """Fill blocks whose template translation came from cache or TM."""
+        for index in list(self._values):
+            translated = translated_texts[index]
+            if translated is not None:
+                self._fill_one(index, translated, translated_texts)
+
+    def take_failed(self, blocks: list[dict]) -> list[tuple[int, dict]]:
+        """Pending entries (original text) for templates that failed to fill."""
+        failed, self.failed = self.failed, []
+        return [(index, blocks[index]) for index in failed]
+
+    def _fill_one(
+        self,
+        index: int,
+        translated: str | None,
+        translated_texts: list[str | None],
+    ) -> None:
+        if translated is None:
+            # The chunk itself failed; nothing to fill in.
+            translated_texts[index] = None
+            return
+        filled = fill_template(translated, self._values[index])
+        if filled is None:
+            # Translated again without templating; later fills skip it.
+            del self._values[index]
+            self.failed.append(index)
+        translated_texts[index] = filled
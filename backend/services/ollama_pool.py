@@ -0,0 +1,263 @@
+"""Multi-host routing, health checks and warm-up for Ollama.
+
+``OLLAMA_BASE_URL`` may list several hosts separated by commas. Each
+request goes to the healthy host with the fewest outstanding requests.
+A maintenance loop checks every host (``/api/tags``) each
+``OLLAMA_HEALTH_INTERVAL`` seconds and sends an empty generate request
+every ``OLLAMA_WARMUP_INTERVAL`` so the model stays loaded
+(``OLLAMA_KEEP_ALIVE``). Only the configured ``OLLAMA_BASE_URL`` /
+``OLLAMA_MODEL`` is warmed up; pools for base URLs given per request
+only have their unhealthy hosts re-checked, so a request naming another
+model never keeps it loaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import httpx
+
+from backend.config import settings
+from backend.services.llm_http import get_async_client
+
+LOGGER = logging.getLogger(__name__)
+
+HEALTH_TIMEOUT = 5.0
+
+
+def parse_base_urls(spec: str) -> list[str]:
+    """Split a comma-separated base URL list, dropping blanks/duplicates."""
+    urls = [url.strip().rstrip("/") for url in (spec or "").split(",")]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+@dataclass
+class OllamaHost:
+    base_url: str
+    outstanding: int = 0
+    healthy: bool = True
+    last_error: str | None = None
+    last_checked: float = 0.0
+    warmed_at: float = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "base_url": self.base_url,
+            "outstanding": self.outstanding,
+            "healthy": self.healthy,
+            "last_error": self.last_error,
+            "warmed_at": self.warmed_at or None,
+        }
+
+
+class OllamaHostPool:
+    """Least-outstanding-requests routing over a set of Ollama hosts."""
+
+    def __init__(self, base_urls: list[str]) -> None:
+        if not base_urls:
+            raise ValueError("未設定 Ollama 主機")
+        self.hosts = [OllamaHost(url) for url in base_urls]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def acquire(self) -> OllamaHost:
+        """Pick a host and count the request as outstanding.
+
+        Unhealthy hosts are skipped unless every host is unhealthy. Ties
+        rotate so idle hosts share the load.
+        """
+        with self._lock:
+            candidates = [host for host in self.hosts if host.healthy] or self.hosts
+            count = len(candidates)
+            start = self._next % count
+            rotated = candidates[start:] + candidates[:start]
+            host = min(rotated, key=lambda item: item.outstanding)
+            self._next += 1
+            host.outstanding += 1
+            return host
+
+    def release(self, host: OllamaHost, error: BaseException | None = None) -> None:
+        with self._lock:
+            host.outstanding = max(host.outstanding - 1, 0)
+            if error is None:
+                # A served request keeps the model loaded as well.
+                host.warmed_at = time.time()
+            elif isinstance(error, httpx.TransportError):
+                host.healthy = False
+                host.last_error = str(error)
+                host.warmed_at = 0.0
+
+    def mark(self, host: OllamaHost, healthy: bool, error: str | None = None) -> None:
+        with self._lock:
+            host.healthy = healthy
+            host.last_error = error
+            host.last_checked = time.time()
+            if not healthy:
+                # The model has to be loaded again once the host is back.
+                host.warmed_at = 0.0
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [host.snapshot() for host in self.hosts]
+
+
+_POOLS_LOCK = threading.Lock()
+_POOLS: dict[str, OllamaHostPool] = {}
+
+
+def get_host_pool(spec: str) -> OllamaHostPool:
+    """Return the shared pool for a base URL spec."""
+    base_urls = parse_base_urls(spec)
+    key = ",".join(base_urls)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = OllamaHostPool(base_urls)
+            _POOLS[key] = pool
+        return pool
+
+
+def get_host_states() -> list[dict]:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    return [state for pool in pools for state in pool.snapshot()]
+
+
+def keep_alive_value() -> str | None:
+    value = (settings.ollama_keep_alive or "").strip()
+    return value or None
+
+
+async def check_host(pool: OllamaHostPool, host: OllamaHost) -> bool:
+    """Probe ``/api/tags`` and update the host's health."""
+    client = get_async_client("ollama", host.base_url)
+    try:
+        response = await client.get(
+            f"{host.base_url}/api/tags", timeout=HEALTH_TIMEOUT
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        pool.mark(host, False, str(exc) or type(exc).__name__)
+        LOGGER.warning("Ollama host %s unhealthy: %s", host.base_url, exc)
+        return False
+    pool.mark(host, True)
+    return True
+
+
+async def warm_up_host(host: OllamaHost, model: str) -> bool:
+    """Load ``model`` on ``host`` with an empty generate request."""
+    payload: dict = {"model": model, "prompt": "", "stream": False}
+    keep_alive = keep_alive_value()
+    if keep_alive:
+        payload["keep_alive"] = keep_alive
+    client = get_async_client("ollama", host.base_url)
+    try:
+        response = await client.post(
+            f"{host.base_url}/api/generate",
+            json=payload,
+            timeout=settings.ollama_timeout,
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        LOGGER.warning("Ollama warm-up failed on %s: %s", host.base_url, exc)
+        return False
+    host.warmed_at = time.time()
+    LOGGER.info("Ollama model %s warm on %s", model, host.base_url)
+    return True
+
+
+def _needs_warm_up(host: OllamaHost, now: float) -> bool:
+    interval = settings.ollama_warmup_interval
+    if not host.warmed_at:
+        return True
+    return interval > 0 and now - host.warmed_at >= interval
+
+
+async def maintain_hosts(spec: str | None = None, model: str | None = None) -> None:
+    """Health-check every host, then warm the model where it is due."""
+    pool = get_host_pool(spec or settings.ollama_base_url)
+    model = model or settings.ollama_model
+    healthy = await asyncio.gather(
+        *(check_host(pool, host) for host in pool.hosts)
+    )
+    if not settings.ollama_warmup_enabled:
+        return
+    now = time.time()
+    await asyncio.gather(
+        *(
+            warm_up_host(host, model)
+            for host, ok in zip(pool.hosts, healthy, strict=True)
+            if ok and _needs_warm_up(host, now)
+        )
+    )
+
+
+async def recover_hosts(skip: OllamaHostPool | None = None) -> None:
+    """Health-check the unhealthy hosts of every other pool.
+
+    Pools built for per-request base URLs only get their hosts marked
+    healthy again; their models are never warmed up.
+    """
+    with _POOLS_LOCK:
+        pools = [pool for pool in _POOLS.values() if pool is not skip]
+    await asyncio.gather(
+        *(
+            check_host(pool, host)
+            for pool in pools
+            for host in pool.hosts
+            if not host.healthy
+        )
+    )
+
+
+async def ollama_maintenance_task() -> None:
+    """Background loop started with the app.
+
+    The configured pool is health-checked and, when Ollama is the
+    provider, kept warm; other pools only recover unhealthy hosts.
+    """
+    warm = settings.llm_provider.lower() == "ollama"
+    while True:
+        try:
+            if warm:
+                await maintain_hosts()
+            else:
+                pool = get_host_pool(settings.ollama_base_url)
+                await asyncio.gather(*(check_host(pool, host) for host in pool.hosts))
+            await recover_hosts(skip=get_host_pool(settings.ollama_base_url))
+        except Exception as exc:
+            LOGGER.error("Ollama maintenance error: %s", exc)
+        interval = settings.ollama_health_interval
+        if interval <= 0:
+            return
+        await asyncio.sleep(interval)
+
+
+_MAINTENANCE: asyncio.Task | None = None
+
+
+def start_maintenance() -> None:
+    """Start the maintenance loop on the running event loop (app startup)."""
+    global _MAINTENANCE
+    if _MAINTENANCE is not None and not _MAINTENANCE.done():
+        return
+    if not parse_base_urls(settings.ollama_base_url):
+        return
+    _MAINTENANCE = asyncio.get_running_loop().create_task(ollama_maintenance_task())
+
+
+async def stop_maintenance() -> None:
+    """Cancel the maintenance loop (app shutdown)."""
+    global _MAINTENANCE
+    task, _MAINTENANCE = _MAINTENANCE, None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -0,0 +1,146 @@
+"""Parallel extraction of independent document units.
+
+Extractors split a document into units that can be read on their own
+(slides, sheets, pages) and pass a module-level ``unit_func(path,
+indices)`` returning one block list per index. ``run_units`` hands
+contiguous batches of units to a bounded process pool and returns the
+per-unit results in unit order, so the merged blocks are identical to a
+sequential run. Small documents, in-memory sources and
+``EXTRACT_WORKERS=1`` are extracted in-process.
+
+Workers are started once with the spawn method (safe next to the
+server's threads) and import the extractor modules up front.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+UnitFunc = Callable[[str, list[int]], list[list[dict]]]
+
+# Imported by each worker at start-up so the first batch does not pay
+# for lxml / PyMuPDF imports.
+_PRELOAD_MODULES = (
+    "backend.services.pptx.extract_stream",
+    "backend.services.xlsx.extract_stream",
+    "backend.services.pdf.extract",
+)
+_MAX_AUTO_WORKERS = 8
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _preload_worker() -> None:
+    for name in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # Optional dependency missing (e.g. OCR); that format is
+            # then unavailable in the parent process as well.
+            pass
+
+
+def worker_count() -> int:
+    """Configured number of extraction processes (1 = in-process)."""
+    workers = settings.extract_workers
+    if workers <= 0:
+        workers = min(os.cpu_count() or 1, _MAX_AUTO_WORKERS)
+    return workers
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS != workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_preload_worker,
+            )
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def shutdown_pool() -> None:
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL, _POOL_WORKERS = None, 0
+
+
+atexit.register(shutdown_pool)
+
+
+def _batches(unit_count: int, batch_count: int) -> list[list[int]]:
+    """Split ``range(unit_count)`` into contiguous, near-equal batches."""
+    size, extra = divmod(unit_count, batch_count)
+    batches, start = [], 0
+    for index in range(batch_count):
+        end = start + size + (1 if index < extra else 0)
+        if end > start:
+            batches.append(list(range(start, end)))
+        start = end
+    return batches
+
+
+def run_units(
+    unit_func: UnitFunc,
+    source,
+    unit_count: int,
+    workers: int | None = None,
+    min_units: int | None = None,
+) -> list[list[dict]]:
+    """Extract ``unit_count`` units of ``source``; results in unit order."""
+    workers = worker_count() if workers is None else workers
+    if min_units is None:
+        min_units = settings.extract_parallel_min_units
+    if workers <= 1 or unit_count < max(min_units, 2) or not isinstance(source, str):
+        return unit_func(source, list(range(unit_count)))
+
+    batches = _batches(unit_count, min(workers, unit_count))
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(unit_func, source, batch) for batch in batches]
+        results: list[list[dict]] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+    except BrokenProcessPool:
+        LOGGER.warning("Extraction pool broke, extracting in-process", exc_info=True)
+        shutdown_pool()
+        return unit_func(source, list(range(unit_count)))
+
+
+def assign_block_ids(blocks: Iterable[dict], prefix: str) -> list[dict]:
+    """Give blocks without a ``client_id`` a deterministic one.
+
+    Ids are ``{prefix}-{slide_index}-{n}`` with ``n`` counting the
+    blocks of that slide/sheet/page, so they do not depend on how the
+    document was split across workers.
+    """
+    counters: dict[int, int] = {}
+    result = []
+    for block in blocks:
+        unit = block.get("slide_index", 0)
+        counters[unit] = counters.get(unit, 0) + 1
+        if not block.get("client_id"):
+            block["client_id"] = f"{prefix}-{unit}-{counters[unit]}"
+        result.append(block)
+    return result
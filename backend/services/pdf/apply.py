@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import fitz  # PyMuPDF
 
+from backend.contracts import is_pass_through
+
 def apply_translations(
     input_path: str,
     output_path: str,
@@ -74,7 +76,8 @@ def apply_bilingual(
         for block in page_blocks:
             source_text = block.get("source_text", "").strip()
             translated_text = block.get("translated_text", "").strip()
-            if not translated_text:
+            # Pass-through blocks are already in the target language.
+            if not translated_text or is_pass_through(block):
                 continue
             bilingual_text = f"{source_text}\n{translated_text}"
             x0 = block.get("x")
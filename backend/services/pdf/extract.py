@@ -9,11 +9,9 @@ except ImportError:
     pdfplumber = None
 
 from backend.contracts import make_block
-from backend.services.extract_utils import (
-    is_garbage_text,
-    is_numeric_only,
-    is_technical_terms_only,
-)
+from backend.services.block_analysis import annotate_blocks
+from backend.services.extract_utils import classify_text
+from backend.services.parallel_extract import assign_block_ids, run_units
 from backend.services.pdf.clustering import cluster_blocks
 from backend.services.pdf.ocr_engine import (
     get_ocr_config,
@@ -26,110 +24,142 @@ from backend.services.pdf.table_extract import extract_table_blocks
 LOGGER = logging.getLogger(__name__)
 
 
-def extract_blocks(pdf_path: str) -> dict:  # noqa: C901
-    """Extract text blocks from PDF using PyMuPDF and OCR/table extraction."""
+def _text_blocks(page, page_index: int) -> list[dict]:
+    """Standard text extraction of one page."""
+    text_dict = page.get_text("dict")
+    page_blocks = []
+    for b_idx, b in enumerate(text_dict["blocks"]):
+        if b.get("type") != 0:
+            continue
+        text = "".join(
+            span.get("text", "")
+            for line in b.get("lines", [])
+            for span in line.get("spans", [])
+        ).strip()
+        if not text or classify_text(text):
+            continue
+
+        x0, y0, x1, y1 = b.get("bbox")
+        first_span = (
+            b["lines"][0]["spans"][0]
+            if b["lines"] and b["lines"][0]["spans"]
+            else {}
+        )
+        block = make_block(
+            page_index,
+            b_idx + 1,
+            "pdf_text_block",
+            text,
+            x0,
+            y0,
+            x1 - x0,
+            y1 - y0,
+        )
+        block.update(
+            {
+                "font_size": first_span.get("size", 10.0),
+                "font_name": first_span.get("font", "helv"),
+                "page_no": page_index + 1,
+            }
+        )
+        page_blocks.append(block)
+    return page_blocks
+
+
+def _add_table_blocks(
+    page_blocks: list[dict],
+    plumber_page,
+    pdf_path: str,
+    page_index: int,
+    cfg: dict,
+) -> None:
+    """Table extraction if text extraction is sparse or for mixed content."""
+    force_ocr = len(page_blocks) == 0
+    page_image = None
+    if force_ocr:
+        try:
+            imgs = convert_from_path(
+                pdf_path,
+                first_page=page_index + 1,
+                last_page=page_index + 1,
+                dpi=cfg["dpi"],
+                poppler_path=get_poppler_path(),
+            )
+            page_image = imgs[0] if imgs else None
+        except Exception:
+            pass
+
+    table_blocks = extract_table_blocks(
+        plumber_page,
+        page_index,
+        page_image,
+        cfg,
+        force_ocr,
+    )
+    existing_texts = {b["source_text"].strip() for b in page_blocks}
+    for tb in table_blocks:
+        if tb["source_text"].strip() not in existing_texts:
+            page_blocks.append(tb)
+
+
+def _ocr_blocks(pdf_path: str, page_index: int, cfg: dict) -> list[dict]:
+    """OCR fallback for a page without any blocks."""
+    ocr_func = (
+        perform_paddle_ocr_on_page
+        if cfg.get("engine") == "paddle"
+        else perform_ocr_on_page
+    )
+    ob, conf = ocr_func(pdf_path, page_index, cfg)
+    if cfg.get("engine") != "paddle" and conf < 60 and len(ob) < 5:
+        pb, _ = perform_paddle_ocr_on_page(pdf_path, page_index, cfg)
+        if len(pb) > len(ob):
+            ob = pb
+    return ob
+
+
+def extract_page_units(pdf_path: str, indices: list[int]) -> list[list[dict]]:
+    """Blocks of the pages at ``indices`` (before clustering)."""
     doc = fitz.open(pdf_path)
     plumber_doc = pdfplumber.open(pdf_path) if pdfplumber else None
-    blocks, cfg = [], get_ocr_config()
-
-    for page_index, page in enumerate(doc):
-        text_dict = page.get_text("dict")
-        page_blocks = []
-
-        # 1. Standard text extraction
-        for b_idx, b in enumerate(text_dict["blocks"]):
-            if b.get("type") != 0:
-                continue
-            text = "".join(
-                span.get("text", "")
-                for line in b.get("lines", [])
-                for span in line.get("spans", [])
-            ).strip()
-            if (
-                not text
-                or is_numeric_only(text)
-                or is_technical_terms_only(text)
-                or is_garbage_text(text)
-            ):
-                continue
-
-            x0, y0, x1, y1 = b.get("bbox")
-            first_span = (
-                b["lines"][0]["spans"][0]
-                if b["lines"] and b["lines"][0]["spans"]
-                else {}
-            )
-            block = make_block(
-                page_index,
-                b_idx + 1,
-                "pdf_text_block",
-                text,
-                x0,
-                y0,
-                x1 - x0,
-                y1 - y0,
-            )
-            block.update(
-                {
-                    "font_size": first_span.get("size", 10.0),
-                    "font_name": first_span.get("font", "helv"),
-                    "page_no": page_index + 1,
-                }
-            )
-            page_blocks.append(block)
-
-        # 2. Table extraction if text extraction is sparse or for mixed content
-        if plumber_doc and page_index < len(plumber_doc.pages):
-            force_ocr = len(page_blocks) == 0
-            page_image = None
-            if force_ocr:
-                try:
-                    imgs = convert_from_path(
-                        pdf_path,
-                        first_page=page_index + 1,
-                        last_page=page_index + 1,
-                        dpi=cfg["dpi"],
-                        poppler_path=get_poppler_path(),
-                    )
-                    page_image = imgs[0] if imgs else None
-                except Exception:
-                    pass
-
-            table_blocks = extract_table_blocks(
-                plumber_doc.pages[page_index],
-                page_index,
-                page_image,
-                cfg,
-                force_ocr,
-            )
-            existing_texts = {b["source_text"].strip() for b in page_blocks}
-            for tb in table_blocks:
-                if tb["source_text"].strip() not in existing_texts:
-                    page_blocks.append(tb)
-
-        # 3. OCR Fallback if still no blocks
-        if not page_blocks:
-            ocr_func = (
-                perform_paddle_ocr_on_page
-                if cfg.get("engine") == "paddle"
-                else perform_ocr_on_page
-            )
-            ob, conf = ocr_func(pdf_path, page_index, cfg)
-            if cfg.get("engine") != "paddle" and conf < 60 and len(ob) < 5:
-                pb, _ = perform_paddle_ocr_on_page(pdf_path, page_index, cfg)
-                if len(pb) > len(ob):
-                    ob = pb
-            page_blocks.extend(ob)
+    cfg = get_ocr_config()
+    units = []
+    try:
+        for page_index in indices:
+            page_blocks = _text_blocks(doc[page_index], page_index)
+            if plumber_doc and page_index < len(plumber_doc.pages):
+                _add_table_blocks(
+                    page_blocks,
+                    plumber_doc.pages[page_index],
+                    pdf_path,
+                    page_index,
+                    cfg,
+                )
+            if not page_blocks:
+                page_blocks.extend(_ocr_blocks(pdf_path, page_index, cfg))
+            units.append(page_blocks)
+    finally:
+        if plumber_doc:
+            plumber_doc.close()
+    return units
+
 
-        blocks.extend(page_blocks)
+def extract_blocks(pdf_path: str) -> dict:
+    """Extract text blocks from PDF using PyMuPDF and OCR/table extraction.
 
-    if plumber_doc:
-        plumber_doc.close()
+    Pages are extracted in parallel for large documents (see
+    ``parallel_extract``); clustering runs on the merged pages.
+    """
+    page_count = len(fitz.open(pdf_path))
+    units = run_units(extract_page_units, pdf_path, page_count)
+    blocks = [block for unit in units for block in unit]
     clustered = cluster_blocks(blocks)
     LOGGER.info(
         "pdf_extract complete: pages=%s, refined blocks from %s to %s",
-        len(doc),
+        page_count,
         len(blocks),
         len(clustered),
     )
-    return {"blocks": clustered, "page_count": len(doc)}
+    return {
+        "blocks": annotate_blocks(assign_block_ids(clustered, "pdf")),
+        "page_count": page_count,
+    }
@@ -4,11 +4,7 @@ import os
 import pytesseract
 
 from backend.contracts import make_block
-from backend.services.extract_utils import (
-    is_garbage_text,
-    is_numeric_only,
-    is_technical_terms_only,
-)
+from backend.services.extract_utils import classify_text
 from backend.services.pdf.ocr_engine import (
     enhance_image_for_ocr,
     is_noisy_text,
@@ -72,9 +68,7 @@ def extract_table_blocks(  # noqa: C901
             if (
                 not full_text
                 or is_noisy_text(full_text)
-                or is_numeric_only(full_text)
-                or is_technical_terms_only(full_text)
-                or is_garbage_text(full_text)
+                or classify_text(full_text)
             ):
                 continue
             x0, top, x1, bottom = table.bbox
@@ -141,9 +135,7 @@ def extract_table_blocks(  # noqa: C901
             if (
                 not text
                 or is_noisy_text(text)
-                or is_numeric_only(text)
-                or is_technical_terms_only(text)
-                or is_garbage_text(text)
+                or classify_text(text)
             ):
                 continue
             block = make_block(
@@ -131,7 +131,7 @@ def _get_accent_color(
 
 
 def _compose_text(source_text: str, translated_text: str, mode: str) -> str:
-    if mode == "bilingual":
+    if mode == "bilingual" and translated_text != source_text:
         return f"{source_text}\n\n{translated_text}"
     return translated_text
 
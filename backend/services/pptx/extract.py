@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import re
 from collections.abc import Iterable
 
@@ -9,12 +10,18 @@ from pptx.slide import Slide
 from pptx.table import _Cell
 from pptx.text.text import TextFrame
 
+from backend.config import settings
 from backend.contracts import make_block
+from backend.services.block_analysis import annotate_blocks
 from backend.services.extract_utils import (
-    is_garbage_text,
+    classify_text,
     is_numeric_only,
     is_technical_terms_only,
 )
+from backend.services.parallel_extract import assign_block_ids
+
+LOGGER = logging.getLogger(__name__)
+
 
 def _safe_get_shape_type(shape) -> int | None:
     try:
@@ -107,12 +114,7 @@ def _iter_textbox_blocks(  # noqa: C901
             text = _text_frame_to_text(shape.text_frame)
         except Exception:
             continue
-        if (
-            not text
-            or is_numeric_only(text)
-            or is_technical_terms_only(text)
-            or is_garbage_text(text)
-        ):
+        if not text or classify_text(text):
             continue
 
         seen_ids.add(shape.shape_id)
@@ -187,12 +189,7 @@ def _iter_table_blocks(slide: Slide, slide_index: int) -> Iterable[dict]:
                 for cell in row.cells:
                     try:
                         text = _cell_to_text(cell)
-                        if (
-                            not text
-                            or is_numeric_only(text)
-                            or is_technical_terms_only(text)
-                            or is_garbage_text(text)
-                        ):
+                        if not text or classify_text(text):
                             continue
                         yield make_block(
                             slide_index,
@@ -224,12 +221,7 @@ def _iter_notes_blocks(slide: Slide, slide_index: int) -> Iterable[dict]:
             if not _safe_has_text_frame(shape):
                 continue
             text = _text_frame_to_text(shape.text_frame)
-            if (
-                not text
-                or is_numeric_only(text)
-                or is_technical_terms_only(text)
-                or is_garbage_text(text)
-            ):
+            if not text or classify_text(text):
                 continue
 
             # Notes position
@@ -266,12 +258,7 @@ def _iter_master_blocks(presentation: Presentation) -> Iterable[dict]:
                     if not _safe_has_text_frame(shape):
                         continue
                     text = _text_frame_to_text(shape.text_frame)
-                    if (
-                        not text
-                        or is_numeric_only(text)
-                        or is_technical_terms_only(text)
-                        or is_garbage_text(text)
-                    ):
+                    if not text or classify_text(text):
                         continue
 
                     sid = getattr(shape, "shape_id", 0)
@@ -292,7 +279,29 @@ def _iter_master_blocks(presentation: Presentation) -> Iterable[dict]:
             continue
 
 
-def extract_blocks(pptx_path: str) -> dict:
+def extract_blocks(pptx_path: str, engine: str | None = None) -> dict:
+    """Extract text blocks with the configured engine.
+
+    ``python-pptx`` (default) walks the object model; ``stream`` (opt-in,
+    see ``extract_stream``) reads the slide XML straight from the zip. A
+    deck the stream engine cannot read falls back to python-pptx.
+    """
+    engine = (engine or settings.pptx_extract_engine).lower()
+    if engine == "stream":
+        from backend.services.pptx.extract_stream import extract_blocks_stream
+
+        try:
+            return extract_blocks_stream(pptx_path)
+        except Exception:
+            LOGGER.warning(
+                "Streaming PPTX extraction failed, using python-pptx", exc_info=True
+            )
+            if hasattr(pptx_path, "seek"):
+                pptx_path.seek(0)
+    return _extract_blocks_pptx(pptx_path)
+
+
+def _extract_blocks_pptx(pptx_path: str) -> dict:
     presentation = Presentation(pptx_path)
     blocks: list[dict] = []
 
@@ -310,7 +319,7 @@ def extract_blocks(pptx_path: str) -> dict:
     blocks.extend(_iter_master_blocks(presentation))
 
     return {
-        "blocks": blocks,
+        "blocks": annotate_blocks(assign_block_ids(blocks, "pptx")),
         "slide_width": slide_width,
         "slide_height": slide_height,
     }
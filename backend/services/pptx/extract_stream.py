@@ -0,0 +1,555 @@
+"""Streaming PPTX extraction straight from the package zip.
+
+``Presentation(...)`` reads every part of the package, embedded media
+included, before the first shape can be visited. This engine opens the
+zip itself, follows the relationships from ``ppt/presentation.xml`` and
+iterparses only the slide, notes slide and slide master parts. Layout
+and notes master parts are parsed on demand when a placeholder inherits
+its position, chart and SmartArt text is read from their related parts.
+
+It emits the same blocks as ``extract.extract_blocks`` (block order,
+shape ids, EMU-to-point geometry); charts and SmartArt additionally
+yield ``complex_graphic`` blocks, which python-pptx cannot read from the
+graphic frame alone.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import zipfile
+from collections.abc import Iterator
+
+from lxml import etree
+
+from backend.contracts import make_block
+from backend.services.block_analysis import annotate_blocks
+from backend.services.extract_utils import (
+    classify_text,
+    is_numeric_only,
+    is_technical_terms_only,
+)
+from backend.services.parallel_extract import assign_block_ids, run_units
+
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_C = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_NS_DGM = "http://schemas.openxmlformats.org/drawingml/2006/diagram"
+_NS_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_P_SP = f"{{{_NS_P}}}sp"
+_P_GRPSP = f"{{{_NS_P}}}grpSp"
+_P_SPTREE = f"{{{_NS_P}}}spTree"
+_P_GRAPHIC_FRAME = f"{{{_NS_P}}}graphicFrame"
+_SHAPE_TAGS = (
+    _P_SP,
+    _P_GRPSP,
+    _P_GRAPHIC_FRAME,
+    f"{{{_NS_P}}}cxnSp",
+    f"{{{_NS_P}}}pic",
+)
+_A_R = f"{{{_NS_A}}}r"
+_A_BR = f"{{{_NS_A}}}br"
+_A_FLD = f"{{{_NS_A}}}fld"
+_A_T = f"{{{_NS_A}}}t"
+_R_ID = f"{{{_NS_R}}}id"
+
+_NS = {"p": _NS_P, "a": _NS_A, "c": _NS_C, "dgm": _NS_DGM, "rel": _NS_REL}
+_GEOMETRY = ("x", "y", "cx", "cy")
+_EMU_PER_POINT = 12700.0
+
+_CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_DIAGRAM_URI = "http://schemas.openxmlformats.org/drawingml/2006/diagram"
+_TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+
+# Layout placeholder type -> master placeholder type it inherits from
+# (mirrors python-pptx's LayoutPlaceholder).
+_MASTER_PH_TYPE = {
+    "body": "body",
+    "chart": "body",
+    "clipArt": "body",
+    "ctrTitle": "title",
+    "dgm": "body",
+    "dt": "dt",
+    "ftr": "ftr",
+    "media": "body",
+    "obj": "body",
+    "pic": "body",
+    "sldNum": "sldNum",
+    "subTitle": "body",
+    "tbl": "body",
+    "title": "title",
+}
+
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+
+
+def _points(emu: int | None) -> float:
+    return emu / _EMU_PER_POINT if emu is not None else 0.0
+
+
+class _Package:
+    """Lazy access to the parts and relationships of an OPC zip."""
+
+    def __init__(self, archive: zipfile.ZipFile):
+        self._zip = archive
+        self._names = set(archive.namelist())
+        self._rels: dict[str, dict[str, tuple[str, str]]] = {}
+        self._parts: dict[str, etree._Element | None] = {}
+
+    def rels(self, part: str) -> dict[str, tuple[str, str]]:
+        """rId -> (relationship type suffix, target part) for ``part``."""
+        if part not in self._rels:
+            base, name = posixpath.split(part)
+            rels_name = posixpath.join(base, "_rels", f"{name}.rels")
+            rels: dict[str, tuple[str, str]] = {}
+            root = self.xml(rels_name)
+            if root is not None:
+                for rel in root.iterfind("rel:Relationship", _NS):
+                    if rel.get("TargetMode") == "External":
+                        continue
+                    target = rel.get("Target", "")
+                    if target.startswith("/"):
+                        target = target.lstrip("/")
+                    else:
+                        target = posixpath.normpath(posixpath.join(base, target))
+                    rel_type = rel.get("Type", "").rsplit("/", 1)[-1]
+                    rels[rel.get("Id", "")] = (rel_type, target)
+            self._rels[part] = rels
+        return self._rels[part]
+
+    def related(self, part: str, rel_type: str) -> str | None:
+        for found_type, target in self.rels(part).values():
+            if found_type == rel_type:
+                return target
+        return None
+
+    def target(self, part: str, r_id: str | None) -> str | None:
+        rel = self.rels(part).get(r_id or "")
+        return rel[1] if rel else None
+
+    def xml(self, part: str | None) -> etree._Element | None:
+        """Parse (and cache) a small part such as a layout or chart."""
+        if part is None or part not in self._names:
+            return None
+        if part not in self._parts:
+            self._parts[part] = etree.fromstring(self._zip.read(part), _PARSER)
+        return self._parts[part]
+
+    def iter_shapes(self, part: str) -> Iterator[etree._Element]:
+        """Iterparse ``part`` and yield its p:sp / p:graphicFrame shapes.
+
+        Only shapes of the shape tree and its groups are yielded (as
+        python-pptx sees them), in document order. Each shape is cleared
+        once the caller is done with it.
+        """
+        if part not in self._names:
+            return
+        with self._zip.open(part) as stream:
+            for _, elem in etree.iterparse(
+                stream,
+                events=("end",),
+                tag=(_P_SP, _P_GRAPHIC_FRAME),
+                resolve_entities=False,
+                no_network=True,
+                huge_tree=True,
+            ):
+                if _in_shape_tree(elem):
+                    yield elem
+                elem.clear(keep_tail=True)
+
+
+def _in_shape_tree(elem: etree._Element) -> bool:
+    parent = elem.getparent()
+    while parent is not None and parent.tag == _P_GRPSP:
+        parent = parent.getparent()
+    return parent is not None and parent.tag == _P_SPTREE
+
+
+def _shape_id(elem: etree._Element) -> int | None:
+    c_nv_pr = elem[0].find("p:cNvPr", _NS) if len(elem) else None
+    if c_nv_pr is None:
+        return None
+    try:
+        return int(c_nv_pr.get("id", ""))
+    except ValueError:
+        return None
+
+
+def _placeholder(elem: etree._Element) -> tuple[str, int] | None:
+    ph = elem[0].find("p:nvPr/p:ph", _NS) if len(elem) else None
+    if ph is None:
+        return None
+    return ph.get("type", "obj"), int(ph.get("idx", "0"))
+
+
+def _own_geometry(elem: etree._Element) -> dict[str, int | None]:
+    if elem.tag == _P_GRAPHIC_FRAME:
+        xfrm = elem.find("p:xfrm", _NS)
+    else:
+        xfrm = elem.find("p:spPr/a:xfrm", _NS)
+    geometry: dict[str, int | None] = dict.fromkeys(_GEOMETRY)
+    if xfrm is None:
+        return geometry
+    off = xfrm.find("a:off", _NS)
+    ext = xfrm.find("a:ext", _NS)
+    if off is not None:
+        geometry["x"], geometry["y"] = int(off.get("x")), int(off.get("y"))
+    if ext is not None:
+        geometry["cx"], geometry["cy"] = int(ext.get("cx")), int(ext.get("cy"))
+    return geometry
+
+
+def _find_placeholder(
+    root: etree._Element | None,
+    ph_type: str | None = None,
+    idx: int | None = None,
+) -> etree._Element | None:
+    if root is None:
+        return None
+    tree = root.find("p:cSld/p:spTree", _NS)
+    if tree is None:
+        return None
+    for elem in tree:
+        if elem.tag not in _SHAPE_TAGS:
+            continue
+        placeholder = _placeholder(elem)
+        if placeholder is None:
+            continue
+        if idx is not None and placeholder[1] == idx:
+            return elem
+        if ph_type is not None and placeholder[0] == ph_type:
+            return elem
+    return None
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    parts = []
+    for child in paragraph:
+        if child.tag == _A_BR:
+            parts.append("\v")
+        elif child.tag in (_A_R, _A_FLD):
+            t = child.find(_A_T)
+            parts.append(t.text or "" if t is not None else "")
+    return "".join(parts)
+
+
+def _text_body_text(tx_body: etree._Element | None) -> str:
+    if tx_body is None:
+        return ""
+    paragraphs = [_paragraph_text(p) for p in tx_body.iterfind("a:p", _NS)]
+    return "\n".join(paragraphs).strip()
+
+
+def _graphic_data(elem: etree._Element) -> etree._Element | None:
+    return elem.find("a:graphic/a:graphicData", _NS)
+
+
+def _unique_complex_texts(texts) -> list[str]:
+    cleaned = []
+    for text in texts:
+        text = (text or "").strip()
+        if text and not is_numeric_only(text) and not is_technical_terms_only(text):
+            cleaned.append(text)
+    return list(dict.fromkeys(cleaned))
+
+
+class _SlideReader:
+    """Blocks of one slide, notes slide or slide master part."""
+
+    def __init__(self, package: _Package, part: str):
+        self.package = package
+        self.part = part
+
+    def geometry(self, elem: etree._Element, kind: str) -> tuple[float, ...]:
+        geometry = _own_geometry(elem)
+        if None in geometry.values():
+            placeholder = _placeholder(elem)
+            base = self._base_placeholder(placeholder, kind) if placeholder else None
+            if base is not None:
+                inherited = base()
+                geometry = {
+                    key: inherited[key] if value is None else value
+                    for key, value in geometry.items()
+                }
+        return tuple(_points(geometry[key]) for key in _GEOMETRY)
+
+    def _base_placeholder(self, placeholder: tuple[str, int], kind: str):
+        """Callable returning the inherited geometry, or None."""
+        ph_type, idx = placeholder
+        package = self.package
+        if kind == "notes":
+            master = package.xml(package.related(self.part, "notesMaster"))
+            base = _find_placeholder(master, ph_type=ph_type)
+            return (lambda: _own_geometry(base)) if base is not None else None
+        if kind != "slide":
+            return None
+        layout_part = package.related(self.part, "slideLayout")
+        layout = _find_placeholder(package.xml(layout_part), idx=idx)
+        if layout is None:
+            return None
+
+        def _layout_geometry() -> dict[str, int | None]:
+            geometry = _own_geometry(layout)
+            if None not in geometry.values():
+                return geometry
+            layout_ph = _placeholder(layout)
+            master_type = _MASTER_PH_TYPE.get(layout_ph[0]) if layout_ph else None
+            master = _find_placeholder(
+                package.xml(package.related(layout_part, "slideMaster")),
+                ph_type=master_type,
+            )
+            if master_type is None or master is None:
+                return geometry
+            master_geometry = _own_geometry(master)
+            return {
+                key: master_geometry[key] if value is None else value
+                for key, value in geometry.items()
+            }
+
+        return _layout_geometry
+
+    def complex_texts(self, frame: etree._Element) -> list[str]:
+        """Text of a chart or SmartArt frame, read from its related part."""
+        data = _graphic_data(frame)
+        if data is None:
+            return []
+        uri = data.get("uri")
+        package = self.package
+        if uri == _CHART_URI:
+            chart = data.find("c:chart", _NS)
+            root = package.xml(
+                package.target(self.part, chart.get(_R_ID) if chart is not None else None)
+            )
+            if root is None:
+                return []
+            texts = [t.text for t in root.iter(_A_T)]
+            texts.extend(v.text for v in root.iterfind(".//c:strCache/c:pt/c:v", _NS))
+            return _unique_complex_texts(texts)
+        if uri == _DIAGRAM_URI:
+            rel_ids = data.find("dgm:relIds", _NS)
+            dm = rel_ids.get(f"{{{_NS_R}}}dm") if rel_ids is not None else None
+            root = package.xml(package.target(self.part, dm))
+            if root is None:
+                return []
+            return _unique_complex_texts(t.text for t in root.iter(_A_T))
+        return []
+
+    def slide_blocks(self, slide_index: int) -> list[dict]:
+        textboxes: list[dict] = []
+        frames: list[tuple[int, tuple[float, ...], list[str]]] = []
+        tables: list[dict] = []
+        seen_ids: set[int] = set()
+        for elem in self.package.iter_shapes(self.part):
+            shape_id = _shape_id(elem)
+            if elem.tag == _P_SP:
+                block = self._textbox_block(elem, slide_index, shape_id, seen_ids)
+                if block is not None:
+                    textboxes.append(block)
+                continue
+            data = _graphic_data(elem)
+            if data is None:
+                continue
+            if data.get("uri") == _TABLE_URI:
+                tables.extend(self._table_blocks(elem, data, slide_index, shape_id))
+                continue
+            texts = self.complex_texts(elem) if shape_id is not None else []
+            if texts:
+                frames.append((shape_id, self.geometry(elem, "slide"), texts))
+
+        # Charts/SmartArt come after every textbox, as in the python-pptx engine.
+        for shape_id, (x, y, w, h), texts in frames:
+            if shape_id in seen_ids:
+                continue
+            seen_ids.add(shape_id)
+            textboxes.append(
+                make_block(
+                    slide_index,
+                    shape_id,
+                    "complex_graphic",
+                    "\n".join(texts),
+                    x=x,
+                    y=y,
+                    width=w,
+                    height=h,
+                )
+            )
+        return textboxes + tables
+
+    def _textbox_block(
+        self,
+        elem: etree._Element,
+        slide_index: int,
+        shape_id: int | None,
+        seen_ids: set[int],
+    ) -> dict | None:
+        if shape_id in seen_ids:
+            return None
+        text = _text_body_text(elem.find("p:txBody", _NS))
+        if not text or classify_text(text):
+            return None
+        seen_ids.add(shape_id)
+        x, y, w, h = self.geometry(elem, "slide")
+        return make_block(
+            slide_index,
+            shape_id,
+            "textbox",
+            text,
+            x=x,
+            y=y,
+            width=w,
+            height=h,
+        )
+
+    def _table_blocks(
+        self,
+        frame: etree._Element,
+        data: etree._Element,
+        slide_index: int,
+        shape_id: int | None,
+    ) -> list[dict]:
+        x, y, w, h = self.geometry(frame, "slide")
+        blocks = []
+        for cell in data.iterfind("a:tbl/a:tr/a:tc", _NS):
+            text = _text_body_text(cell.find("a:txBody", _NS))
+            if not text or classify_text(text):
+                continue
+            blocks.append(
+                make_block(
+                    slide_index,
+                    shape_id,
+                    "table_cell",
+                    text,
+                    x=x,
+                    y=y,
+                    width=w,
+                    height=h,
+                )
+            )
+        return blocks
+
+    def notes_blocks(self, slide_index: int) -> list[dict]:
+        blocks = []
+        for elem in self.package.iter_shapes(self.part):
+            if elem.tag != _P_SP:
+                continue
+            text = _text_body_text(elem.find("p:txBody", _NS))
+            if not text or classify_text(text):
+                continue
+            x, y, w, h = self.geometry(elem, "notes")
+            blocks.append(
+                make_block(
+                    slide_index,
+                    _shape_id(elem) or 0,
+                    "notes",
+                    text,
+                    x=x,
+                    y=y,
+                    width=w,
+                    height=h,
+                )
+            )
+        return blocks
+
+    def master_blocks(self, master_index: int) -> list[dict]:
+        blocks = []
+        for elem in self.package.iter_shapes(self.part):
+            if elem.tag != _P_SP:
+                continue
+            text = _text_body_text(elem.find("p:txBody", _NS))
+            if not text or classify_text(text):
+                continue
+            shape_id = f"m{master_index}_{_shape_id(elem) or 0}"
+            blocks.append(
+                make_block(
+                    -1,
+                    shape_id,
+                    "master",
+                    text,
+                    x=0.0,
+                    y=0.0,
+                    width=500,
+                    height=50,
+                )
+            )
+        return blocks
+
+
+def _presentation_part(package: _Package) -> str:
+    part = package.related("", "officeDocument")
+    if part is None:
+        raise ValueError("PPTX 缺少 presentation 部件")
+    return part
+
+
+class _Deck:
+    """Slide and master parts of a presentation, in deck order."""
+
+    def __init__(self, archive: zipfile.ZipFile):
+        package = _Package(archive)
+        presentation_part = _presentation_part(package)
+        presentation = package.xml(presentation_part)
+        if presentation is None:
+            raise ValueError("PPTX 缺少 presentation 部件")
+        self.package = package
+
+        size = presentation.find("p:sldSz", _NS)
+        self.slide_width = _points(int(size.get("cx"))) if size is not None else 0.0
+        self.slide_height = _points(int(size.get("cy"))) if size is not None else 0.0
+        self.slide_parts = [
+            package.target(presentation_part, slide_id.get(_R_ID))
+            for slide_id in presentation.iterfind("p:sldIdLst/p:sldId", _NS)
+        ]
+        self.master_parts = [
+            package.target(presentation_part, master_id.get(_R_ID))
+            for master_id in presentation.iterfind("p:sldMasterIdLst/p:sldMasterId", _NS)
+        ]
+
+    @property
+    def unit_count(self) -> int:
+        # One unit per slide (with its notes), plus one for all masters.
+        return len(self.slide_parts) + 1
+
+    def unit_blocks(self, index: int) -> list[dict]:
+        package = self.package
+        if index == len(self.slide_parts):
+            blocks = []
+            for master_index, master_part in enumerate(self.master_parts):
+                if master_part is not None:
+                    reader = _SlideReader(package, master_part)
+                    blocks.extend(reader.master_blocks(master_index))
+            return blocks
+        slide_part = self.slide_parts[index]
+        if slide_part is None:
+            return []
+        blocks = _SlideReader(package, slide_part).slide_blocks(index)
+        notes_part = package.related(slide_part, "notesSlide")
+        if notes_part is not None:
+            blocks.extend(_SlideReader(package, notes_part).notes_blocks(index))
+        return blocks
+
+
+def extract_slide_units(pptx_path, indices: list[int]) -> list[list[dict]]:
+    """Blocks of the given units (slides, then the masters) of a deck."""
+    with zipfile.ZipFile(pptx_path) as archive:
+        deck = _Deck(archive)
+        return [deck.unit_blocks(index) for index in indices]
+
+
+def extract_blocks_stream(pptx_path) -> dict:
+    """Extract blocks without building the python-pptx object model.
+
+    ``pptx_path`` may be a path or a binary file object. Slides of large
+    decks are extracted in parallel (see ``parallel_extract``).
+    """
+    with zipfile.ZipFile(pptx_path) as archive:
+        deck = _Deck(archive)
+    units = run_units(extract_slide_units, pptx_path, deck.unit_count)
+    blocks = assign_block_ids(
+        (block for unit in units for block in unit), "pptx"
+    )
+    return {
+        "blocks": annotate_blocks(blocks),
+        "slide_width": deck.slide_width,
+        "slide_height": deck.slide_height,
+    }
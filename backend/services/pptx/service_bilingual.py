@@ -5,6 +5,7 @@ from collections.abc import Iterable
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 
+from backend.contracts import is_pass_through
 from backend.services.font_manager import estimate_scale
 
 from .apply_core import _apply_translations_to_presentation
@@ -47,7 +48,8 @@ def apply_bilingual(  # noqa: C901
         if not _should_process_block(block, supported_types):
             continue
         translation = block.get("translated_text", "")
-        if not translation:
+        # Pass-through blocks are already in the target language.
+        if not translation or is_pass_through(block):
             continue
         slide_index = block.get("slide_index")
         shape_id = block.get("shape_id")
@@ -94,6 +94,20 @@ DEFAULT_PROMPTS = {
   }
 ]
 
+## 待分析簡報內容
+---
+{text_sample}
+---"""
+    ),
+    "deck_summary": (
+        """# 任務：簡報摘要
+請閱讀以下簡報內容，為後續逐段翻譯提供簡短的全域背景。
+
+## 輸出結構規範
+輸出必須且僅能是一個 JSON 物件：
+{"topic": "一句話主題", "audience": "目標讀者", "key_terms": ["核心術語", "..."]}
+- key_terms 最多 12 個，保留原文，不要翻譯。
+
 ## 待分析簡報內容
 ---
 {text_sample}
@@ -0,0 +1,226 @@
+"""Token estimator calibrated from recorded usage.
+
+Tokens per character differ a lot by script: ASCII English is about four
+characters per token, while CJK and Vietnamese with diacritics are closer
+to one or two. Each text is reduced to character counts per script class
+(ASCII, extended Latin, CJK, other) plus a per-request overhead term. The
+estimate is a dot product with per-model rates.
+
+The rates start from defaults and are fitted per model with ridge
+regression on the ``(text, tokens)`` pairs the LLM clients report. The
+normal equations are accumulated, so calibration costs O(1) memory. They
+are persisted to ``backend/data/token_calibration.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+CALIBRATION_FILE = Path(__file__).parent.parent / "data" / "token_calibration.json"
+
+SCRIPT_CLASSES = ("ascii", "latin_ext", "cjk", "other")
+FEATURES = len(SCRIPT_CLASSES) + 1  # + per-request overhead
+# Tokens per character for each script class, then tokens per request.
+DEFAULT_RATES = np.array([0.25, 0.7, 1.0, 0.5, 0.0])
+# Ridge prior strength per feature (squared characters / requests).
+PRIOR_WEIGHT = np.array([1e4, 1e4, 1e4, 1e4, 10.0])
+MIN_RATE = 0.02
+# Calibration is saved every N observations per model.
+SAVE_EVERY = 20
+# Weight of the newest sample in the relative error average.
+ERROR_ALPHA = 0.1
+
+_CJK_RE = re.compile(
+    "[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]"
+)
+# Latin-1 letters, Latin Extended A/B, combining marks and Vietnamese.
+_LATIN_EXT_RE = re.compile("[\u00c0-\u024f\u0300-\u036f\u1e00-\u1eff]")
+
+
+def script_counts(texts: Sequence[str]) -> np.ndarray:
+    """Return an ``(n, FEATURES)`` matrix of characters per script class."""
+    counts = np.zeros((len(texts), FEATURES))
+    for row, text in enumerate(texts):
+        if not text:
+            continue
+        ascii_chars = len(text.encode("ascii", "ignore"))
+        cjk = len(_CJK_RE.findall(text))
+        latin_ext = len(_LATIN_EXT_RE.findall(text))
+        other = max(len(text) - ascii_chars - cjk - latin_ext, 0)
+        counts[row] = (ascii_chars, latin_ext, cjk, other, 1.0)
+    return counts
+
+
+class TokenEstimator:
+    """Per-model linear token estimator fitted from observed usage."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or CALIBRATION_FILE
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+        self._rates: dict[str, np.ndarray] = {}
+        self._load()
+
+    def rates(self, model: str | None = None) -> np.ndarray:
+        if not model:
+            return DEFAULT_RATES
+        with self._lock:
+            rates = self._rates.get(model)
+            if rates is None and model in self._stats:
+                rates = self._solve(self._stats[model])
+                self._rates[model] = rates
+        return DEFAULT_RATES if rates is None else rates
+
+    def estimate(
+        self,
+        texts: Sequence[str],
+        model: str | None = None,
+        per_request: bool = False,
+    ) -> np.ndarray:
+        """Estimate the token count of every text in one matrix product.
+
+        The per-request overhead is only added with ``per_request``, i.e.
+        when each text is a whole prompt rather than a block.
+        """
+        if not texts:
+            return np.zeros(0, dtype=int)
+        counts = script_counts(texts)
+        rates = self.rates(model)
+        if not per_request:
+            rates = rates.copy()
+            rates[-1] = 0.0
+        tokens = np.ceil(counts @ rates).astype(int)
+        has_text = counts[:, :-1].sum(axis=1) > 0
+        return np.where(has_text, np.maximum(tokens, 1), 0)
+
+    def estimate_text(self, text: str, model: str | None = None) -> int:
+        return int(self.estimate([text], model)[0])
+
+    def observe(self, model: str, text: str, tokens: int) -> None:
+        """Add one ``(text, actual tokens)`` pair to the model's fit."""
+        if not model or not text or tokens <= 0:
+            return
+        x = script_counts([text])[0]
+        with self._lock:
+            stats = self._stats.setdefault(model, _empty_stats())
+            predicted = float(x @ self._rates.get(model, DEFAULT_RATES))
+            error = abs(predicted - tokens) / tokens
+            stats["error"] = (
+                error
+                if stats["samples"] == 0
+                else (1 - ERROR_ALPHA) * stats["error"] + ERROR_ALPHA * error
+            )
+            stats["xtx"] += np.outer(x, x)
+            stats["xty"] += x * tokens
+            stats["samples"] += 1
+            self._rates[model] = self._solve(stats)
+            due = stats["samples"] % SAVE_EVERY == 0
+        if due:
+            self.save()
+
+    @staticmethod
+    def _solve(stats: dict) -> np.ndarray:
+        lhs = stats["xtx"] + np.diag(PRIOR_WEIGHT)
+        rhs = stats["xty"] + PRIOR_WEIGHT * DEFAULT_RATES
+        rates = np.linalg.solve(lhs, rhs)
+        rates[:-1] = np.maximum(rates[:-1], MIN_RATE)
+        rates[-1] = max(rates[-1], 0.0)
+        return rates
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            models = list(self._stats)
+        result = {}
+        for model in models:
+            rates = self.rates(model)
+            stats = self._stats[model]
+            result[model] = {
+                "samples": stats["samples"],
+                "tokens_per_char": {
+                    name: round(float(rate), 4)
+                    for name, rate in zip(SCRIPT_CLASSES, rates, strict=False)
+                },
+                "request_overhead": round(float(rates[-1]), 2),
+                "relative_error": round(float(stats["error"]), 4),
+            }
+        return result
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                model: {
+                    "samples": stats["samples"],
+                    "error": stats["error"],
+                    "xtx": stats["xtx"].tolist(),
+                    "xty": stats["xty"].tolist(),
+                }
+                for model, stats in self._stats.items()
+            }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as exc:
+            LOGGER.warning("Failed to save token calibration: %s", exc)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for model, stats in data.items():
+                self._stats[model] = {
+                    "samples": int(stats["samples"]),
+                    "error": float(stats.get("error", 0.0)),
+                    "xtx": np.array(stats["xtx"], dtype=float).reshape(
+                        FEATURES, FEATURES
+                    ),
+                    "xty": np.array(stats["xty"], dtype=float).reshape(FEATURES),
+                }
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning("Ignoring invalid token calibration file: %s", exc)
+            self._stats = {}
+
+
+def _empty_stats() -> dict:
+    return {
+        "samples": 0,
+        "error": 0.0,
+        "xtx": np.zeros((FEATURES, FEATURES)),
+        "xty": np.zeros(FEATURES),
+    }
+
+
+_ESTIMATOR: TokenEstimator | None = None
+_ESTIMATOR_LOCK = threading.Lock()
+
+
+def get_token_estimator() -> TokenEstimator:
+    global _ESTIMATOR
+    with _ESTIMATOR_LOCK:
+        if _ESTIMATOR is None:
+            _ESTIMATOR = TokenEstimator()
+        return _ESTIMATOR
+
+
+def estimate_block_tokens(
+    texts: Sequence[str],
+    model: str | None = None,
+) -> list[int]:
+    """Calibrated token estimate per block text."""
+    return get_token_estimator().estimate(texts, model).tolist()
+
+
+def observe_usage(model: str, text: str | None, tokens: int) -> None:
+    if text:
+        get_token_estimator().observe(model, text, tokens)
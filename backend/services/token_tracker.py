@@ -13,6 +13,8 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
+from backend.services.token_estimator import observe_usage
+
 # Token estimation constants (approximate)
 CHARS_PER_TOKEN = {
     "openai": 4,  # GPT models average ~4 chars per token
@@ -22,6 +24,9 @@ CHARS_PER_TOKEN = {
     "default": 4,
 }
 
+# Cached prompt tokens are billed at a fraction of the input rate
+CACHED_INPUT_RATIO = 0.5
+
 # Cost per 1M tokens (USD) - approximate rates
 COST_PER_MILLION_TOKENS = {
     "gpt-4o": {"input": 2.50, "output": 10.00},
@@ -39,6 +44,9 @@ COST_PER_MILLION_TOKENS = {
 
 USAGE_FILE = Path(__file__).parent.parent / "data" / "token_usage.json"
 
+_COMPACTION_LOCK = threading.Lock()
+_COMPACTION_STATS = {"requests": 0, "full_tokens": 0, "compact_tokens": 0}
+
 
 @dataclass
 class TokenUsage:
@@ -52,6 +60,7 @@ class TokenUsage:
     total_tokens: int
     estimated_cost_usd: float
     operation: str = "translate"
+    cached_tokens: int = 0
 
 
 def estimate_tokens(text: str, provider: str = "default") -> int:
@@ -64,8 +73,13 @@ def estimate_cost(
     model: str,
     prompt_tokens: int,
     completion_tokens: int,
+    cached_tokens: int = 0,
 ) -> float:
-    """Estimate cost in USD based on model and token counts."""
+    """Estimate cost in USD based on model and token counts.
+
+    ``cached_tokens`` is the part of ``prompt_tokens`` served from the
+    provider's prompt cache.
+    """
     # Normalize model name for lookup
     model_key = model.lower()
     for key in COST_PER_MILLION_TOKENS:
@@ -75,7 +89,9 @@ def estimate_cost(
     else:
         rates = COST_PER_MILLION_TOKENS["default"]
 
-    input_cost = (prompt_tokens / 1_000_000) * rates["input"]
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    billed_input = prompt_tokens - cached_tokens + cached_tokens * CACHED_INPUT_RATIO
+    input_cost = (billed_input / 1_000_000) * rates["input"]
     output_cost = (completion_tokens / 1_000_000) * rates["output"]
     return round(input_cost + output_cost, 6)
 
@@ -107,10 +123,19 @@ def record_usage(
     prompt_tokens: int,
     completion_tokens: int,
     operation: str = "translate",
+    cached_tokens: int = 0,
+    prompt_text: str | None = None,
+    completion_text: str | None = None,
 ) -> TokenUsage:
-    """Record a token usage event."""
+    """Record a token usage event.
+
+    When the request/response texts are given they also calibrate the
+    token estimator for ``model``.
+    """
+    observe_usage(model, prompt_text, prompt_tokens)
+    observe_usage(model, completion_text, completion_tokens)
     total_tokens = prompt_tokens + completion_tokens
-    cost = estimate_cost(model, prompt_tokens, completion_tokens)
+    cost = estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens)
 
     usage = TokenUsage(
         timestamp=datetime.utcnow().isoformat() + "Z",
@@ -121,6 +146,7 @@ def record_usage(
         total_tokens=total_tokens,
         estimated_cost_usd=cost,
         operation=operation,
+        cached_tokens=cached_tokens,
     )
 
     # Persist to file
@@ -138,6 +164,29 @@ def record_usage(
     return usage
 
 
+def record_prompt_compaction(full_tokens: int, compact_tokens: int) -> None:
+    """Record the estimated payload size of a full vs. compact prompt.
+
+    Only sampled compact prompts are recorded (see ``llm_prompt``).
+    """
+    with _COMPACTION_LOCK:
+        _COMPACTION_STATS["requests"] += 1
+        _COMPACTION_STATS["full_tokens"] += full_tokens
+        _COMPACTION_STATS["compact_tokens"] += compact_tokens
+
+
+def get_prompt_compaction_stats() -> dict:
+    """Get compact prompt savings since process start."""
+    with _COMPACTION_LOCK:
+        stats = dict(_COMPACTION_STATS)
+    saved = stats["full_tokens"] - stats["compact_tokens"]
+    stats["saved_tokens"] = saved
+    stats["saved_ratio"] = (
+        round(saved / stats["full_tokens"], 4) if stats["full_tokens"] else 0.0
+    )
+    return stats
+
+
 def get_session_stats() -> dict:
     """Get statistics for current session (last 24 hours)."""
     history = _load_usage_history()
@@ -160,6 +209,7 @@ def get_session_stats() -> dict:
             "total_tokens": 0,
             "prompt_tokens": 0,
             "completion_tokens": 0,
+            "cached_tokens": 0,
             "estimated_cost_usd": 0.0,
             "request_count": 0,
             "models_used": [],
@@ -168,6 +218,7 @@ def get_session_stats() -> dict:
     total_tokens = sum(r.get("total_tokens", 0) for r in recent)
     prompt_tokens = sum(r.get("prompt_tokens", 0) for r in recent)
     completion_tokens = sum(r.get("completion_tokens", 0) for r in recent)
+    cached_tokens = sum(r.get("cached_tokens", 0) for r in recent)
     total_cost = sum(r.get("estimated_cost_usd", 0) for r in recent)
     models = list({r.get("model", "unknown") for r in recent})
 
@@ -175,6 +226,7 @@ def get_session_stats() -> dict:
         "total_tokens": total_tokens,
         "prompt_tokens": prompt_tokens,
         "completion_tokens": completion_tokens,
+        "cached_tokens": cached_tokens,
         "estimated_cost_usd": round(total_cost, 4),
         "request_count": len(recent),
         "models_used": models,
@@ -0,0 +1,178 @@
+"""Cancellation support for long-running translation jobs.
+
+A ``CancellationToken`` is created per streaming request and threaded
+through the chunk pipeline. Cancelling it aborts queued chunks and
+in-flight LLM calls, while chunks that already finished keep their
+cache/TM checkpoints.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from backend.services.translate_priority import PriorityHint
+
+LOGGER = logging.getLogger(__name__)
+# How often the stream loop checks whether the client went away.
+DISCONNECT_POLL_SECONDS = 1.0
+
+T = TypeVar("T")
+
+
+class TranslationCancelled(Exception):
+    """Raised when a translation job is cancelled mid-flight."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared by all chunks of a job."""
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if self._event.is_set():
+            return
+        self.reason = reason
+        self._event.set()
+        LOGGER.info("Translation job cancelled (%s)", reason)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TranslationCancelled(self.reason or "cancelled")
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable`` unless the token fires first.
+
+        When the token fires, the underlying task is cancelled so that an
+        in-flight httpx request is torn down instead of running to
+        completion in the background.
+        """
+        if self.cancelled:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise TranslationCancelled(self.reason or "cancelled")
+        work = asyncio.ensure_future(awaitable)
+        waiter = asyncio.ensure_future(self._event.wait())
+        try:
+            await asyncio.wait(
+                [work, waiter], return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            work.cancel()
+            raise
+        finally:
+            waiter.cancel()
+
+        if work.done():
+            return work.result()
+
+        work.cancel()
+        try:
+            await work
+        except (asyncio.CancelledError, Exception):
+            pass
+        raise TranslationCancelled(self.reason or "cancelled")
+
+
+@dataclass
+class TranslationJob:
+    """A registered streaming translation job."""
+
+    job_id: str
+    token: CancellationToken = field(default_factory=CancellationToken)
+    # Only set when the client sent a hint; jobs without one keep the
+    # provider's plain concurrent dispatch.
+    priority: PriorityHint | None = None
+
+
+_JOBS: dict[str, TranslationJob] = {}
+
+
+def register_job(job_id: str | None = None) -> TranslationJob:
+    """Create and register a job so it can be cancelled by id."""
+    job = TranslationJob(job_id=job_id or uuid.uuid4().hex)
+    _JOBS[job.job_id] = job
+    return job
+
+
+def get_job(job_id: str) -> TranslationJob | None:
+    return _JOBS.get(job_id)
+
+
+def cancel_job(job_id: str, reason: str = "user") -> bool:
+    """Cancel a registered job. Returns False if the job is unknown."""
+    job = _JOBS.get(job_id)
+    if job is None:
+        return False
+    job.token.cancel(reason)
+    return True
+
+
+def unregister_job(job_id: str) -> None:
+    _JOBS.pop(job_id, None)
+
+
+def _format_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def iter_job_events(
+    request,
+    job: TranslationJob,
+    task: asyncio.Task,
+    queue: asyncio.Queue,
+):
+    """Yield queued SSE events until ``task`` finishes.
+
+    ``request`` is the Starlette request (or None) polled for client
+    disconnects while waiting; a disconnect (or the generator being
+    closed by the server) cancels the job so that in-flight LLM requests
+    stop consuming tokens/GPU time.
+    """
+    try:
+        while True:
+            get_queue_task = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait(
+                [get_queue_task, task],
+                timeout=DISCONNECT_POLL_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if get_queue_task in done:
+                event = get_queue_task.result()
+                yield _format_event(event["event"], event["data"])
+            else:
+                get_queue_task.cancel()
+
+            if task in done:
+                # Flush any remaining items in queue regardless of
+                # task status.
+                while not queue.empty():
+                    event = queue.get_nowait()
+                    yield _format_event(event["event"], event["data"])
+                return
+
+            if request is not None and await request.is_disconnected():
+                LOGGER.info(
+                    "Client disconnected, cancelling job %s", job.job_id
+                )
+                job.token.cancel("client_disconnected")
+                return
+    finally:
+        if not task.done():
+            job.token.cancel("client_disconnected")
+            task.cancel()
+        unregister_job(job.job_id)
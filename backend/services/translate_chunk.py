@@ -12,9 +12,13 @@ import random
 import time
 from urllib.error import HTTPError
 
-from backend.services.language_detect import detect_language
+from backend.services.language_detect import detect_languages
+from backend.services.llm_autotune import record_chunk
+from backend.services.llm_circuit import CircuitOpenError
 from backend.services.llm_placeholders import apply_placeholders
+from backend.services.numeric_template import slot_tokens
 from backend.services.translate_chunk_cache import (
+    cache_block_texts,
     get_from_cache,
     translate_and_cache_blocks,
     translate_and_cache_blocks_async,
@@ -23,10 +27,17 @@ from backend.services.translate_chunk_dispatch import (
     dispatch_translate,
     dispatch_translate_async,
 )
+from backend.services.translate_failover import (
+    make_failover_dispatch,
+    make_failover_dispatch_async,
+    make_hedged_dispatch_async,
+    make_timed_dispatch,
+)
+from backend.services.translate_partial import PartialTranslationError
 from backend.services.translate_retry import (
     fallback_mock,
     fallback_mock_async,
-    has_language_mismatch,
+    language_retry_indices,
     retry_for_language,
     retry_for_language_async,
 )
@@ -56,6 +67,8 @@ def prepare_chunk(
         prepared["source_text"] = prepared_text
         if mapping:
             placeholder_tokens.extend(mapping.keys())
+        # Numeric template slots must come back untouched as well.
+        placeholder_tokens.extend(slot_tokens(prepared_text))
         placeholder_maps.append(mapping)
         chunk_blocks.append(prepared)
 
@@ -80,6 +93,14 @@ def translate_chunk(
     """Translate a single chunk with retry logic."""
     attempt = 0
     retried_for_language = False
+    # Blocks accepted by earlier attempts (partial results).
+    accepted: list[dict | None] = [None] * len(chunk_blocks)
+    failover = params.get("failover")
+    dispatch_func = (
+        make_timed_dispatch(failover)
+        if failover is not None
+        else dispatch_translate
+    )
 
     while True:
         try:
@@ -91,45 +112,51 @@ def translate_chunk(
                 len(chunk_blocks),
             )
 
-            refresh = params.get("refresh", False)
-            if refresh:
-                final_blocks = [None] * len(chunk_blocks)
-                uncached_indices = list(range(len(chunk_blocks)))
-            else:
-                final_blocks, uncached_indices = get_from_cache(
-                    chunk_blocks,
-                    target_language,
-                    provider,
-                    params.get("model", "default"),
-                    tone=tone,
-                    vision_context=vision_context,
-                )
-
-            if not uncached_indices:
-                return {"blocks": final_blocks}
-
-            result = translate_and_cache_blocks(
-                translator,
-                provider,
+            final_blocks, uncached_indices = _lookup_blocks(
                 chunk_blocks,
-                uncached_indices,
-                final_blocks,
+                accepted,
                 target_language,
-                context,
-                preferred_terms,
-                placeholder_tokens,
+                provider,
+                params,
                 tone,
                 vision_context,
-                params,
-                dispatch_translate,
-                mode=mode,
             )
 
+            if not uncached_indices:
+                return {"blocks": final_blocks}
+
+            requested = [chunk_blocks[i] for i in uncached_indices]
+            started = time.perf_counter()
+            try:
+                result = translate_and_cache_blocks(
+                    translator,
+                    provider,
+                    chunk_blocks,
+                    uncached_indices,
+                    final_blocks,
+                    target_language,
+                    context,
+                    preferred_terms,
+                    placeholder_tokens,
+                    tone,
+                    vision_context,
+                    params,
+                    dispatch_func,
+                    mode=mode,
+                )
+            except Exception as exc:
+                record_chunk(params, requested, time.perf_counter() - started, exc)
+                if isinstance(exc, PartialTranslationError):
+                    _keep_accepted(accepted, chunk_blocks, uncached_indices, exc.texts)
+                raise
+            record_chunk(params, requested, time.perf_counter() - started)
+
             chunk_texts = [
                 item.get("translated_text", "")
                 for item in result["blocks"]
             ]
-            if not retried_for_language and has_language_mismatch(
+            if not retried_for_language and language_retry_indices(
+                chunk_blocks,
                 chunk_texts,
                 target_language,
             ):
@@ -142,7 +169,17 @@ def translate_chunk(
                     context,
                     preferred_terms,
                     placeholder_tokens,
+                    result,
+                )
+                _cache_retried_texts(
                     chunk_texts,
+                    result,
+                    chunk_blocks,
+                    target_language,
+                    provider,
+                    params,
+                    tone,
+                    vision_context,
                 )
 
             return result
@@ -151,16 +188,30 @@ def translate_chunk(
             if _is_vision_error(str(exc)):
                 raise ValueError("偵測到圖片相關錯誤") from exc
 
-            if attempt > params["max_retries"]:
-                if fallback_on_error and mode != "mock":
-                    return fallback_mock(
-                        chunk_blocks,
-                        target_language,
-                        context,
-                        preferred_terms,
-                        placeholder_tokens,
-                    )
-                raise
+            # An open circuit means the endpoint is known to be down:
+            # skip the remaining retries and go straight to failover.
+            if attempt > params["max_retries"] or isinstance(
+                exc, CircuitOpenError
+            ):
+                result = _handle_exhausted(
+                    translator,
+                    provider,
+                    chunk_blocks,
+                    accepted,
+                    target_language,
+                    context,
+                    preferred_terms,
+                    placeholder_tokens,
+                    tone,
+                    vision_context,
+                    params,
+                    chunk_index,
+                    fallback_on_error,
+                    mode,
+                )
+                if result is None:
+                    raise
+                return result
 
             sleep_for = _calculate_backoff(
                 exc,
@@ -189,6 +240,14 @@ async def translate_chunk_async(
     """Translate a single chunk with retry logic (Async)."""
     attempt = 0
     retried_for_language = False
+    # Blocks accepted by earlier attempts (partial results).
+    accepted: list[dict | None] = [None] * len(chunk_blocks)
+    failover = params.get("failover")
+    dispatch_func = (
+        make_hedged_dispatch_async(failover)
+        if failover is not None
+        else dispatch_translate_async
+    )
 
     while True:
         try:
@@ -200,45 +259,51 @@ async def translate_chunk_async(
                 len(chunk_blocks),
             )
 
-            refresh = params.get("refresh", False)
-            if refresh:
-                final_blocks = [None] * len(chunk_blocks)
-                uncached_indices = list(range(len(chunk_blocks)))
-            else:
-                final_blocks, uncached_indices = get_from_cache(
-                    chunk_blocks,
-                    target_language,
-                    provider,
-                    params.get("model", "default"),
-                    tone=tone,
-                    vision_context=vision_context,
-                )
-
-            if not uncached_indices:
-                return {"blocks": final_blocks}
-
-            result = await translate_and_cache_blocks_async(
-                translator,
-                provider,
+            final_blocks, uncached_indices = _lookup_blocks(
                 chunk_blocks,
-                uncached_indices,
-                final_blocks,
+                accepted,
                 target_language,
-                context,
-                preferred_terms,
-                placeholder_tokens,
+                provider,
+                params,
                 tone,
                 vision_context,
-                params,
-                dispatch_translate_async,
-                mode=mode,
             )
 
+            if not uncached_indices:
+                return {"blocks": final_blocks}
+
+            requested = [chunk_blocks[i] for i in uncached_indices]
+            started = time.perf_counter()
+            try:
+                result = await translate_and_cache_blocks_async(
+                    translator,
+                    provider,
+                    chunk_blocks,
+                    uncached_indices,
+                    final_blocks,
+                    target_language,
+                    context,
+                    preferred_terms,
+                    placeholder_tokens,
+                    tone,
+                    vision_context,
+                    params,
+                    dispatch_func,
+                    mode=mode,
+                )
+            except Exception as exc:
+                record_chunk(params, requested, time.perf_counter() - started, exc)
+                if isinstance(exc, PartialTranslationError):
+                    _keep_accepted(accepted, chunk_blocks, uncached_indices, exc.texts)
+                raise
+            record_chunk(params, requested, time.perf_counter() - started)
+
             chunk_texts = [
                 item.get("translated_text", "")
                 for item in result["blocks"]
             ]
-            if not retried_for_language and has_language_mismatch(
+            if not retried_for_language and language_retry_indices(
+                chunk_blocks,
                 chunk_texts,
                 target_language,
             ):
@@ -251,7 +316,17 @@ async def translate_chunk_async(
                     context,
                     preferred_terms,
                     placeholder_tokens,
+                    result,
+                )
+                _cache_retried_texts(
                     chunk_texts,
+                    result,
+                    chunk_blocks,
+                    target_language,
+                    provider,
+                    params,
+                    tone,
+                    vision_context,
                 )
 
             return result
@@ -260,16 +335,30 @@ async def translate_chunk_async(
             if _is_vision_error(str(exc)):
                 raise ValueError("偵測到圖片相關錯誤") from exc
 
-            if attempt > params["max_retries"]:
-                if fallback_on_error and mode != "mock":
-                    return await fallback_mock_async(
-                        chunk_blocks,
-                        target_language,
-                        context,
-                        preferred_terms,
-                        placeholder_tokens,
-                    )
-                raise
+            # An open circuit means the endpoint is known to be down:
+            # skip the remaining retries and go straight to failover.
+            if attempt > params["max_retries"] or isinstance(
+                exc, CircuitOpenError
+            ):
+                result = await _handle_exhausted_async(
+                    translator,
+                    provider,
+                    chunk_blocks,
+                    accepted,
+                    target_language,
+                    context,
+                    preferred_terms,
+                    placeholder_tokens,
+                    tone,
+                    vision_context,
+                    params,
+                    chunk_index,
+                    fallback_on_error,
+                    mode,
+                )
+                if result is None:
+                    raise
+                return result
 
             sleep_for = _calculate_backoff(
                 exc,
@@ -280,11 +369,220 @@ async def translate_chunk_async(
             await asyncio.sleep(sleep_for)
 
 
+def _handle_exhausted(
+    translator,
+    provider: str,
+    chunk_blocks: list[dict],
+    accepted: list[dict | None],
+    target_language: str,
+    context: dict | None,
+    preferred_terms: list,
+    placeholder_tokens: list,
+    tone: str | None,
+    vision_context: bool,
+    params: dict,
+    chunk_index: int,
+    fallback_on_error: bool,
+    mode: str,
+) -> dict | None:
+    """Route a chunk that ran out of retries through the failover chain.
+
+    Blocks accepted by a partial result are kept and only the rest is
+    sent on. Returns None when the original error should be raised.
+    """
+    final_blocks, failed = _unaccepted_blocks(accepted)
+    failover = params.get("failover")
+    if failover is not None and failover.links:
+        try:
+            return translate_and_cache_blocks(
+                translator,
+                provider,
+                chunk_blocks,
+                failed,
+                final_blocks,
+                target_language,
+                context,
+                preferred_terms,
+                placeholder_tokens,
+                tone,
+                vision_context,
+                params,
+                make_failover_dispatch(failover),
+                mode=mode,
+            )
+        except Exception as exc:
+            LOGGER.warning(
+                "Failover chain exhausted for chunk %s: %s",
+                chunk_index,
+                exc,
+            )
+    if fallback_on_error and mode != "mock":
+        result = fallback_mock(
+            [chunk_blocks[i] for i in failed],
+            target_language,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+        )
+        return _merge_fallback(result, final_blocks, failed)
+    return None
+
+
+async def _handle_exhausted_async(
+    translator,
+    provider: str,
+    chunk_blocks: list[dict],
+    accepted: list[dict | None],
+    target_language: str,
+    context: dict | None,
+    preferred_terms: list,
+    placeholder_tokens: list,
+    tone: str | None,
+    vision_context: bool,
+    params: dict,
+    chunk_index: int,
+    fallback_on_error: bool,
+    mode: str,
+) -> dict | None:
+    """Async variant of :func:`_handle_exhausted`."""
+    final_blocks, failed = _unaccepted_blocks(accepted)
+    failover = params.get("failover")
+    if failover is not None and failover.links:
+        try:
+            return await translate_and_cache_blocks_async(
+                translator,
+                provider,
+                chunk_blocks,
+                failed,
+                final_blocks,
+                target_language,
+                context,
+                preferred_terms,
+                placeholder_tokens,
+                tone,
+                vision_context,
+                params,
+                make_failover_dispatch_async(failover),
+                mode=mode,
+            )
+        except Exception as exc:
+            LOGGER.warning(
+                "Failover chain exhausted for chunk %s: %s",
+                chunk_index,
+                exc,
+            )
+    if fallback_on_error and mode != "mock":
+        result = await fallback_mock_async(
+            [chunk_blocks[i] for i in failed],
+            target_language,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+        )
+        return _merge_fallback(result, final_blocks, failed)
+    return None
+
+
+def _lookup_blocks(
+    chunk_blocks: list[dict],
+    accepted: list[dict | None],
+    target_language: str,
+    provider: str,
+    params: dict,
+    tone: str | None,
+    vision_context: bool,
+) -> tuple[list[dict | None], list[int]]:
+    """Blocks already translated for this chunk, and the indices to send.
+
+    ``accepted`` holds the blocks checkpointed by earlier attempts. With
+    ``refresh`` the cache is bypassed, so only those are reused.
+    """
+    if params.get("refresh", False):
+        final_blocks = list(accepted)
+    else:
+        final_blocks, _ = get_from_cache(
+            chunk_blocks,
+            target_language,
+            provider,
+            params.get("model", "default"),
+            tone=tone,
+            vision_context=vision_context,
+        )
+        for index, block in enumerate(accepted):
+            if block is not None:
+                final_blocks[index] = block
+    missing = [index for index, block in enumerate(final_blocks) if block is None]
+    return final_blocks, missing
+
+
+def _unaccepted_blocks(
+    accepted: list[dict | None],
+) -> tuple[list[dict | None], list[int]]:
+    """Accepted blocks and the indices still missing after the retries.
+
+    The cache is not consulted: it may hold texts the language check
+    just rejected. Without partial results the whole chunk is missing.
+    """
+    failed = [index for index, block in enumerate(accepted) if block is None]
+    if not failed:
+        return [None] * len(accepted), list(range(len(accepted)))
+    return list(accepted), failed
+
+
+def _keep_accepted(
+    accepted: list[dict | None],
+    chunk_blocks: list[dict],
+    sent_indices: list[int],
+    texts: list[str | None],
+) -> None:
+    for index, text in zip(sent_indices, texts, strict=True):
+        if text is not None:
+            accepted[index] = {**chunk_blocks[index], "translated_text": text}
+
+
+def _merge_fallback(
+    result: dict,
+    final_blocks: list[dict | None],
+    failed: list[int],
+) -> dict:
+    """Put fallback translations of ``failed`` into the chunk result."""
+    for index, block in zip(failed, result["blocks"], strict=True):
+        final_blocks[index] = block
+    result["blocks"] = final_blocks
+    return result
+
+
+def _cache_retried_texts(
+    before: list[str],
+    result: dict,
+    chunk_blocks: list[dict],
+    target_language: str,
+    provider: str,
+    params: dict,
+    tone: str | None,
+    vision_context: bool,
+) -> None:
+    """Overwrite cached wrong-language texts with their retried version."""
+    after = [item.get("translated_text", "") for item in result["blocks"]]
+    texts = [
+        new if new != old else None
+        for old, new in zip(before, after, strict=True)
+    ]
+    cache_block_texts(
+        chunk_blocks,
+        texts,
+        target_language,
+        provider,
+        params,
+        tone,
+        vision_context,
+    )
+
+
 def detect_top_language(texts: list[str]) -> str | None:
     """Detect the most common language in texts."""
     counts: dict[str, int] = {}
-    for text in texts:
-        detected = detect_language((text or "").strip())
+    for detected in detect_languages([(text or "").strip() for text in texts]):
         if detected:
             counts[detected] = counts.get(detected, 0) + 1
     if not counts:
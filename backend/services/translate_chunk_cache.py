@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+from backend.services.numeric_template import slots_intact
+from backend.services.translate_partial import PartialTranslationError
 from backend.services.translation_cache import cache
 
 def get_from_cache(
@@ -36,6 +38,61 @@ def get_from_cache(
     return final_blocks, uncached_indices
 
 
+def cache_block_texts(
+    blocks: list[dict],
+    texts: list[str | None],
+    target_language: str,
+    provider: str,
+    params: dict,
+    tone: str | None,
+    vision_context: bool,
+) -> None:
+    """Store translated texts for blocks.
+
+    Skips ``None`` entries and numeric templates whose slots came back
+    lost or altered.
+    """
+    for block, text in zip(blocks, texts, strict=True):
+        if text is None or not slots_intact(block.get("source_text", ""), text):
+            continue
+        cache.set(
+            block.get("source_text", ""),
+            target_language,
+            provider,
+            params.get("model", "default"),
+            text,
+            tone=tone,
+            vision_context=vision_context,
+        )
+
+
+def _store_results(
+    result: dict,
+    blocks_to_translate: list[dict],
+    uncached_indices: list[int],
+    final_blocks: list[dict | None],
+    target_language: str,
+    provider: str,
+    params: dict,
+    tone: str | None,
+    vision_context: bool,
+) -> None:
+    """Merge translated blocks into ``final_blocks`` and cache their texts."""
+    res_blocks = result.get("blocks", [])
+    for original_idx, res_block in zip(uncached_indices, res_blocks, strict=False):
+        final_blocks[original_idx] = res_block
+    cache_block_texts(
+        blocks_to_translate[: len(res_blocks)],
+        [res_block.get("translated_text", "") for res_block in res_blocks],
+        target_language,
+        provider,
+        params,
+        tone,
+        vision_context,
+    )
+    result["blocks"] = final_blocks
+
+
 def translate_and_cache_blocks(
     translator,
     provider: str,
@@ -55,35 +112,44 @@ def translate_and_cache_blocks(
     """Translate uncached blocks and update cache."""
     blocks_to_translate = [chunk_blocks[i] for i in uncached_indices]
 
-    result = dispatch_func(
-        translator,
-        provider,
+    try:
+        result = dispatch_func(
+            translator,
+            provider,
+            blocks_to_translate,
+            target_language,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+            tone,
+            vision_context,
+            mode=mode,
+        )
+    except PartialTranslationError as exc:
+        # Checkpoint the blocks that did succeed so the next attempt only
+        # re-requests the failing ones.
+        cache_block_texts(
+            blocks_to_translate,
+            exc.texts,
+            target_language,
+            provider,
+            params,
+            tone,
+            vision_context,
+        )
+        raise
+
+    _store_results(
+        result,
         blocks_to_translate,
+        uncached_indices,
+        final_blocks,
         target_language,
-        context,
-        preferred_terms,
-        placeholder_tokens,
+        provider,
+        params,
         tone,
         vision_context,
-        mode=mode,
     )
-
-    res_blocks = result.get("blocks", [])
-    for i, res_block in enumerate(res_blocks):
-        original_idx = uncached_indices[i]
-        translated_text = res_block.get("translated_text", "")
-        final_blocks[original_idx] = res_block
-        cache.set(
-            chunk_blocks[original_idx].get("source_text", ""),
-            target_language,
-            provider,
-            params.get("model", "default"),
-            translated_text,
-            tone=tone,
-            vision_context=vision_context,
-        )
-
-    result["blocks"] = final_blocks
     return result
 
 
@@ -106,33 +172,42 @@ async def translate_and_cache_blocks_async(
     """Translate uncached blocks and update cache (Async)."""
     blocks_to_translate = [chunk_blocks[i] for i in uncached_indices]
 
-    result = await dispatch_func(
-        translator,
-        provider,
+    try:
+        result = await dispatch_func(
+            translator,
+            provider,
+            blocks_to_translate,
+            target_language,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+            tone,
+            vision_context,
+            mode=mode,
+        )
+    except PartialTranslationError as exc:
+        # Checkpoint the blocks that did succeed so the next attempt only
+        # re-requests the failing ones.
+        cache_block_texts(
+            blocks_to_translate,
+            exc.texts,
+            target_language,
+            provider,
+            params,
+            tone,
+            vision_context,
+        )
+        raise
+
+    _store_results(
+        result,
         blocks_to_translate,
+        uncached_indices,
+        final_blocks,
         target_language,
-        context,
-        preferred_terms,
-        placeholder_tokens,
+        provider,
+        params,
         tone,
         vision_context,
-        mode=mode,
     )
-
-    res_blocks = result.get("blocks", [])
-    for i, res_block in enumerate(res_blocks):
-        original_idx = uncached_indices[i]
-        translated_text = res_block.get("translated_text", "")
-        final_blocks[original_idx] = res_block
-        cache.set(
-            chunk_blocks[original_idx].get("source_text", ""),
-            target_language,
-            provider,
-            params.get("model", "default"),
-            translated_text,
-            tone=tone,
-            vision_context=vision_context,
-        )
-
-    result["blocks"] = final_blocks
     return result
@@ -6,6 +6,10 @@ providers and handling provider-specific logic.
 
 from __future__ import annotations
 
+import asyncio
+
+from backend.config import settings
+from backend.services.llm_circuit import breaker_for
 from backend.services.llm_contract import (
     build_contract,
     coerce_contract,
@@ -16,9 +20,13 @@ from backend.services.translate_config import (
     get_tone_instruction,
     get_vision_context_instruction,
 )
+from backend.services.translate_partial import (
+    fill_missing_texts,
+    fill_missing_texts_async,
+)
 from backend.services.translate_prompt import (
     build_ollama_batch_prompt,
-    parse_ollama_batch_response,
+    parse_ollama_batch_partial,
 )
 
 def dispatch_translate(
@@ -33,9 +41,19 @@ def dispatch_translate(
     vision_context,
     mode: str = "direct",
 ):
-    """Dispatch to correct translator sync."""
-    if provider == "ollama":
-        return translate_ollama(
+    """Dispatch to correct translator sync.
+
+    Requests go through the endpoint's circuit breaker, so an open
+    circuit fails fast with ``CircuitOpenError``.
+    """
+    translate_func = (
+        translate_ollama if provider == "ollama" else translate_standard
+    )
+    breaker = breaker_for(provider, translator)
+    if breaker is not None:
+        breaker.before_request()
+    try:
+        result = translate_func(
             translator,
             blocks_to_translate,
             target_language,
@@ -46,17 +64,13 @@ def dispatch_translate(
             vision_context,
             mode=mode,
         )
-    return translate_standard(
-        translator,
-        blocks_to_translate,
-        target_language,
-        context,
-        preferred_terms,
-        placeholder_tokens,
-        tone,
-        vision_context,
-        mode=mode,
-    )
+    except Exception as exc:
+        if breaker is not None:
+            breaker.record_failure(exc)
+        raise
+    if breaker is not None:
+        breaker.record_success()
+    return result
 
 
 async def dispatch_translate_async(
@@ -72,8 +86,16 @@ async def dispatch_translate_async(
     mode: str = "direct",
 ):
     """Dispatch to correct translator async."""
-    if provider == "ollama":
-        return await translate_ollama_async(
+    translate_func = (
+        translate_ollama_async
+        if provider == "ollama"
+        else translate_standard_async
+    )
+    breaker = breaker_for(provider, translator)
+    if breaker is not None:
+        breaker.before_request()
+    try:
+        result = await translate_func(
             translator,
             blocks_to_translate,
             target_language,
@@ -84,17 +106,17 @@ async def dispatch_translate_async(
             vision_context,
             mode=mode,
         )
-    return await translate_standard_async(
-        translator,
-        blocks_to_translate,
-        target_language,
-        context,
-        preferred_terms,
-        placeholder_tokens,
-        tone,
-        vision_context,
-        mode=mode,
-    )
+    except asyncio.CancelledError:
+        if breaker is not None:
+            breaker.release()
+        raise
+    except Exception as exc:
+        if breaker is not None:
+            breaker.record_failure(exc)
+        raise
+    if breaker is not None:
+        breaker.record_success()
+    return result
 
 
 def translate_ollama(
@@ -108,18 +130,24 @@ def translate_ollama(
     vision_context,
     mode: str = "direct",
 ):
-    """Handle Ollama-specific translation."""
-    prompt = build_ollama_batch_prompt(chunk_blocks, target_language)
-    text_output = translator.translate_plain(prompt)
-    translated_texts_chunk = parse_ollama_batch_response(
-        text_output,
-        len(chunk_blocks),
-    )
+    """Handle Ollama-specific translation.
+
+    Blocks parsed from the batch response are kept; only the missing ones
+    are re-requested through the JSON contract path. With structured
+    output the schema-constrained JSON request is made directly.
+    """
+    texts: list[str | None] = [None] * len(chunk_blocks)
+    if not settings.llm_structured_output:
+        prompt = build_ollama_batch_prompt(chunk_blocks, target_language)
+        text_output = translator.translate_plain(prompt)
+        parsed = parse_ollama_batch_partial(text_output, len(chunk_blocks))
+        texts = [parsed.get(i) for i in range(len(chunk_blocks))]
 
-    if translated_texts_chunk is None:
-        custom_hint = build_custom_hint(target_language, tone, vision_context)
+    custom_hint = build_custom_hint(target_language, tone, vision_context)
+
+    def request(blocks):
         result = translator.translate(
-            chunk_blocks,
+            blocks,
             target_language,
             context=context,
             preferred_terms=preferred_terms,
@@ -127,14 +155,10 @@ def translate_ollama(
             language_hint=custom_hint,
             mode=mode,
         )
-        result = coerce_contract(result, chunk_blocks, target_language)
-    else:
-        result = build_contract(
-            chunk_blocks,
-            target_language,
-            translated_texts_chunk,
-        )
+        return coerce_contract(result, blocks, target_language)
 
+    texts = fill_missing_texts(request, chunk_blocks, texts)
+    result = build_contract(chunk_blocks, target_language, texts)
     validate_contract(result)
     return result
 
@@ -151,17 +175,18 @@ async def translate_ollama_async(
     mode: str = "direct",
 ):
     """Handle Ollama-specific translation (Async)."""
-    prompt = build_ollama_batch_prompt(chunk_blocks, target_language)
-    text_output = await translator.translate_plain_async(prompt)
-    translated_texts_chunk = parse_ollama_batch_response(
-        text_output,
-        len(chunk_blocks),
-    )
+    texts: list[str | None] = [None] * len(chunk_blocks)
+    if not settings.llm_structured_output:
+        prompt = build_ollama_batch_prompt(chunk_blocks, target_language)
+        text_output = await translator.translate_plain_async(prompt)
+        parsed = parse_ollama_batch_partial(text_output, len(chunk_blocks))
+        texts = [parsed.get(i) for i in range(len(chunk_blocks))]
 
-    if translated_texts_chunk is None:
-        custom_hint = build_custom_hint(target_language, tone, vision_context)
+    custom_hint = build_custom_hint(target_language, tone, vision_context)
+
+    async def request(blocks):
         result = await translator.translate_async(
-            chunk_blocks,
+            blocks,
             target_language,
             context=context,
             preferred_terms=preferred_terms,
@@ -169,14 +194,10 @@ async def translate_ollama_async(
             language_hint=custom_hint,
             mode=mode,
         )
-        result = coerce_contract(result, chunk_blocks, target_language)
-    else:
-        result = build_contract(
-            chunk_blocks,
-            target_language,
-            translated_texts_chunk,
-        )
+        return coerce_contract(result, blocks, target_language)
 
+    texts = await fill_missing_texts_async(request, chunk_blocks, texts)
+    result = build_contract(chunk_blocks, target_language, texts)
     validate_contract(result)
     return result
 
@@ -192,18 +213,29 @@ def translate_standard(
     vision_context,
     mode: str = "direct",
 ):
-    """Handle standard translation."""
+    """Handle standard translation.
+
+    Invalid or missing blocks in the response are re-requested on their
+    own instead of retrying the whole chunk.
+    """
     custom_hint = build_custom_hint(target_language, tone, vision_context)
-    result = translator.translate(
-        chunk_blocks,
-        target_language,
-        context=context,
-        preferred_terms=preferred_terms,
-        placeholder_tokens=placeholder_tokens,
-        language_hint=custom_hint,
-        mode=mode,
+
+    def request(blocks):
+        result = translator.translate(
+            blocks,
+            target_language,
+            context=context,
+            preferred_terms=preferred_terms,
+            placeholder_tokens=placeholder_tokens,
+            language_hint=custom_hint,
+            mode=mode,
+        )
+        return coerce_contract(result, blocks, target_language)
+
+    texts = fill_missing_texts(
+        request, chunk_blocks, [None] * len(chunk_blocks)
     )
-    result = coerce_contract(result, chunk_blocks, target_language)
+    result = build_contract(chunk_blocks, target_language, texts)
     validate_contract(result)
     return result
 
@@ -221,16 +253,23 @@ async def translate_standard_async(
 ):
     """Handle standard translation (Async)."""
     custom_hint = build_custom_hint(target_language, tone, vision_context)
-    result = await translator.translate_async(
-        chunk_blocks,
-        target_language,
-        context=context,
-        preferred_terms=preferred_terms,
-        placeholder_tokens=placeholder_tokens,
-        language_hint=custom_hint,
-        mode=mode,
+
+    async def request(blocks):
+        result = await translator.translate_async(
+            blocks,
+            target_language,
+            context=context,
+            preferred_terms=preferred_terms,
+            placeholder_tokens=placeholder_tokens,
+            language_hint=custom_hint,
+            mode=mode,
+        )
+        return coerce_contract(result, blocks, target_language)
+
+    texts = await fill_missing_texts_async(
+        request, chunk_blocks, [None] * len(chunk_blocks)
     )
-    result = coerce_contract(result, chunk_blocks, target_language)
+    result = build_contract(chunk_blocks, target_language, texts)
     validate_contract(result)
     return result
 
@@ -0,0 +1,418 @@
+"""Provider failover chain and hedged dispatch.
+
+When a chunk exhausts its retries on the primary provider, the chunk is
+routed through the configured secondary providers (for example
+``ollama -> openai -> gemini``) before giving up; link timeouts apply on
+the sync and the async path. Optionally, a chunk whose primary request
+is slower than the provider's observed p95 latency is also fired at the
+first secondary and the first valid contract wins.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.config import settings
+from backend.services.llm_circuit import breaker_for
+from backend.services.llm_contract import coerce_contract, validate_contract
+from backend.services.translate_chunk_dispatch import (
+    dispatch_translate,
+    dispatch_translate_async,
+)
+from backend.services.translate_selector import select_translator
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FailoverLink:
+    """A secondary provider in the failover chain."""
+
+    provider: str
+    translator: Any
+    timeout: float | None = None
+
+
+@dataclass
+class FailoverChain:
+    """Failover configuration resolved for one translation job."""
+
+    primary: str
+    primary_timeout: float | None = None
+    links: list[FailoverLink] = field(default_factory=list)
+    hedge: bool = False
+
+
+class LatencyTracker:
+    """Rolling per-provider latency window used to derive p95."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.setdefault(
+                provider, deque(maxlen=self.window)
+            )
+            samples.append(seconds)
+
+    def p95(self, provider: str) -> float | None:
+        """Return the observed p95 latency, or None if too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = max(math.ceil(len(samples) * 0.95) - 1, 0)
+        return samples[index]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+LATENCY = LatencyTracker(min_samples=settings.llm_hedge_min_samples)
+
+
+def parse_failover_chain(spec: str | None) -> list[tuple[str, float | None]]:
+    """Parse ``"ollama:120,openai:60,gemini"`` into (provider, timeout)."""
+    links: list[tuple[str, float | None]] = []
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, timeout = item.partition(":")
+        try:
+            parsed_timeout = float(timeout) if timeout.strip() else None
+        except ValueError as exc:
+            raise ValueError(f"無效的 failover 設定: {item}") from exc
+        links.append((name.strip().lower(), parsed_timeout))
+    return links
+
+
+def build_failover_chain(
+    primary_provider: str,
+    spec: str | None = None,
+    hedge: bool | None = None,
+) -> FailoverChain | None:
+    """Resolve the failover chain for ``primary_provider``.
+
+    Providers without credentials are skipped with a warning, as is the
+    primary itself (its timeout entry, if any, still applies).
+    """
+    entries = parse_failover_chain(
+        settings.llm_failover_chain if spec is None else spec
+    )
+    if not entries:
+        return None
+
+    chain = FailoverChain(
+        primary=primary_provider,
+        hedge=settings.llm_hedge_enabled if hedge is None else hedge,
+    )
+    for name, timeout in entries:
+        try:
+            resolved, translator = select_translator(
+                name, None, None, None, fallback_on_error=False
+            )
+        except OSError as exc:
+            LOGGER.warning("Skipping failover provider %s: %s", name, exc)
+            continue
+        if resolved == primary_provider:
+            chain.primary_timeout = timeout
+            continue
+        if resolved == "mock":
+            continue
+        chain.links.append(FailoverLink(resolved, translator, timeout))
+    return chain
+
+
+def _available_links(chain: FailoverChain) -> list[FailoverLink]:
+    """Return the secondary links whose circuit is not open."""
+    available = []
+    for link in chain.links:
+        breaker = breaker_for(link.provider, link.translator)
+        if breaker is not None and not breaker.is_available():
+            LOGGER.info("Skipping failover provider %s (circuit open)", link.provider)
+            continue
+        available.append(link)
+    return available
+
+
+def _checked_result(result, blocks: list[dict], target_language: str) -> dict:
+    """Coerce ``result`` and reject it unless every block came back."""
+    result = coerce_contract(result, blocks, target_language)
+    validate_contract(result)
+    if len(result["blocks"]) != len(blocks):
+        raise ValueError("LLM response block count mismatch")
+    return result
+
+
+def _call_with_timeout(timeout: float | None, func: Callable, *args, **kwargs):
+    """Run a blocking call, giving up after ``timeout`` seconds.
+
+    The worker thread of a timed-out call is abandoned; it ends when the
+    provider client's own timeout fires.
+    """
+    if timeout is None:
+        return func(*args, **kwargs)
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(func, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError as exc:
+        raise TimeoutError(f"LLM request exceeded {timeout}s") from exc
+    finally:
+        executor.shutdown(wait=False)
+
+
+def make_timed_dispatch(chain: FailoverChain) -> Callable:
+    """Return a sync dispatch function for the primary provider.
+
+    Applies the primary link timeout, records latency samples and
+    validates the result like the async (hedged) dispatch does.
+    """
+
+    def timed_dispatch(
+        translator, provider, blocks_to_translate, target_language, *args,
+        mode: str = "direct",
+    ):
+        started = time.perf_counter()
+        result = _call_with_timeout(
+            chain.primary_timeout,
+            dispatch_translate,
+            translator,
+            provider,
+            blocks_to_translate,
+            target_language,
+            *args,
+            mode=mode,
+        )
+        LATENCY.record(provider, time.perf_counter() - started)
+        return _checked_result(result, blocks_to_translate, target_language)
+
+    return timed_dispatch
+
+
+def make_failover_dispatch(chain: FailoverChain) -> Callable:
+    """Return a dispatch function that walks the secondary providers."""
+
+    def failover_dispatch(
+        translator,
+        provider,
+        blocks_to_translate,
+        target_language,
+        context,
+        preferred_terms,
+        placeholder_tokens,
+        tone,
+        vision_context,
+        mode: str = "direct",
+    ):
+        last_exc: Exception | None = None
+        for link in _available_links(chain):
+            try:
+                result = _call_with_timeout(
+                    link.timeout,
+                    dispatch_translate,
+                    link.translator,
+                    link.provider,
+                    blocks_to_translate,
+                    target_language,
+                    context,
+                    preferred_terms,
+                    placeholder_tokens,
+                    tone,
+                    vision_context,
+                    mode=mode,
+                )
+                result = _checked_result(
+                    result, blocks_to_translate, target_language
+                )
+            except Exception as exc:
+                LOGGER.warning("Failover to %s failed: %s", link.provider, exc)
+                last_exc = exc
+                continue
+            LOGGER.warning(
+                "Chunk served by failover provider %s (primary %s)",
+                link.provider,
+                provider,
+            )
+            return result
+        raise ValueError("所有備援供應商皆翻譯失敗") from last_exc
+
+    return failover_dispatch
+
+
+def make_failover_dispatch_async(chain: FailoverChain) -> Callable:
+    """Async variant of :func:`make_failover_dispatch` with link timeouts."""
+
+    async def failover_dispatch(
+        translator,
+        provider,
+        blocks_to_translate,
+        target_language,
+        context,
+        preferred_terms,
+        placeholder_tokens,
+        tone,
+        vision_context,
+        mode: str = "direct",
+    ):
+        last_exc: Exception | None = None
+        for link in _available_links(chain):
+            try:
+                result = await asyncio.wait_for(
+                    dispatch_translate_async(
+                        link.translator,
+                        link.provider,
+                        blocks_to_translate,
+                        target_language,
+                        context,
+                        preferred_terms,
+                        placeholder_tokens,
+                        tone,
+                        vision_context,
+                        mode=mode,
+                    ),
+                    timeout=link.timeout,
+                )
+                result = _checked_result(
+                    result, blocks_to_translate, target_language
+                )
+            except Exception as exc:
+                LOGGER.warning("Failover to %s failed: %r", link.provider, exc)
+                last_exc = exc
+                continue
+            LOGGER.warning(
+                "Chunk served by failover provider %s (primary %s)",
+                link.provider,
+                provider,
+            )
+            return result
+        raise ValueError("所有備援供應商皆翻譯失敗") from last_exc
+
+    return failover_dispatch
+
+
+async def _first_valid(
+    pending: set[asyncio.Future],
+    blocks: list[dict],
+    target_language: str,
+) -> dict:
+    """Return the first complete, valid contract among racing requests.
+
+    A request that fails or returns an invalid contract does not win;
+    the remaining ones are awaited. Losers are cancelled.
+    """
+    errors: list[BaseException] = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is not None:
+                    errors.append(task.exception())
+                    continue
+                try:
+                    return _checked_result(task.result(), blocks, target_language)
+                except ValueError as exc:
+                    errors.append(exc)
+        raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def make_hedged_dispatch_async(chain: FailoverChain) -> Callable:
+    """Return an async dispatch function for the primary provider.
+
+    Applies the primary link timeout, records latency samples and, when
+    hedging is enabled, races the first secondary once the primary has
+    exceeded its observed p95 latency.
+    """
+
+    async def _timed(provider: str, timeout: float | None, coro) -> dict:
+        started = time.perf_counter()
+        result = await asyncio.wait_for(coro, timeout=timeout)
+        LATENCY.record(provider, time.perf_counter() - started)
+        return result
+
+    async def hedged_dispatch(
+        translator,
+        provider,
+        blocks_to_translate,
+        target_language,
+        context,
+        preferred_terms,
+        placeholder_tokens,
+        tone,
+        vision_context,
+        mode: str = "direct",
+    ):
+        args = (
+            blocks_to_translate,
+            target_language,
+            context,
+            preferred_terms,
+            placeholder_tokens,
+            tone,
+            vision_context,
+        )
+        primary = asyncio.ensure_future(
+            _timed(
+                provider,
+                chain.primary_timeout,
+                dispatch_translate_async(translator, provider, *args, mode=mode),
+            )
+        )
+        delay = LATENCY.p95(provider) if chain.hedge else None
+        links = _available_links(chain)
+        if delay is None or not links:
+            return _checked_result(
+                await primary, blocks_to_translate, target_language
+            )
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            return _checked_result(
+                primary.result(), blocks_to_translate, target_language
+            )
+
+        link = links[0]
+        LOGGER.info(
+            "Hedging chunk to %s after %.1fs (p95 of %s)",
+            link.provider,
+            delay,
+            provider,
+        )
+        secondary = asyncio.ensure_future(
+            _timed(
+                link.provider,
+                link.timeout,
+                dispatch_translate_async(
+                    link.translator, link.provider, *args, mode=mode
+                ),
+            )
+        )
+        return await _first_valid(
+            {primary, secondary}, blocks_to_translate, target_language
+        )
+
+    return hedged_dispatch
@@ -8,24 +8,38 @@ import time
 from collections.abc import Callable
 from typing import Any
 
-import httpx
-
 from backend.config import settings
 from backend.services.bilingual_alignment import align_bilingual_blocks
+from backend.services.llm_autotune import (
+    ChunkAutotuner,
+    iter_adaptive_chunks,
+    load_autotuner,
+)
 from backend.services.llm_clients import MockTranslator
-from backend.services.llm_context import build_context
+from backend.services.llm_context import DocumentContextIndex, build_context
 from backend.services.llm_contract import build_contract
+from backend.services.llm_deck_summary import get_deck_summary
 from backend.services.llm_glossary import load_glossary
-from backend.services.llm_utils import chunked
+from backend.services.llm_utils import chunked, chunked_by_tokens
+from backend.services.numeric_template import NumericTemplates
+from backend.services.token_estimator import estimate_block_tokens
+from backend.services.translate_cancel import CancellationToken
 from backend.services.translate_chunk import (
     prepare_chunk,
     translate_chunk,
 )
+from backend.services.translate_failover import build_failover_chain
 from backend.services.translate_llm_helpers import (
     create_async_chunk_tasks,
     load_preferred_terms,
     prepare_pending_blocks,
 )
+from backend.services.translate_passthrough import split_target_language
+from backend.services.translate_priority import (
+    PriorityHint,
+    order_pending,
+    run_prioritized,
+)
 from backend.services.translate_retry import apply_translation_results
 from backend.services.translate_selector import (
     get_translation_params,
@@ -49,6 +63,7 @@ def translate_blocks(
     smart_layout: bool = True,
     param_overrides: dict | None = None,
     mode: str | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> dict:
     """Translate text blocks using LLM (Synchronous)."""
     resolved_mode = (mode or settings.translate_llm_mode).lower()
@@ -64,6 +79,7 @@ def translate_blocks(
             blocks_list,
             source_lang,
             target_language,
+            within_slide=_align_within_slide(param_overrides),
         )
 
     preferred_terms = load_preferred_terms(
@@ -83,8 +99,16 @@ def translate_blocks(
         "vision_context": vision_context,
     }
 
+    params = _prepare_params(
+        resolved_provider,
+        param_overrides,
+        model,
+        tone,
+        vision_context,
+    )
+    templates = NumericTemplates() if params["numeric_templates"] else None
     translated_texts, pending, local_cache = prepare_pending_blocks(
-        blocks_list,
+        templates.apply(blocks_list) if templates else blocks_list,
         target_language,
         source_lang,
         use_tm,
@@ -93,14 +117,11 @@ def translate_blocks(
         refresh=refresh,
         llm_context=llm_context,
     )
-
-    params = _prepare_params(
-        resolved_provider,
-        param_overrides,
-        model,
-        tone,
-        vision_context,
+    pending, skipped = _pass_through_target_language(
+        pending, target_language, params, resolved_mode, translated_texts
     )
+    pending = _share_numeric_templates(pending, templates, params, translated_texts)
+    _attach_context_index(params, blocks_list, translator, resolved_provider)
     chunk_size = _determine_chunk_size(pending, params)
 
     glossary = load_glossary(params["glossary_path"])
@@ -113,7 +134,16 @@ def translate_blocks(
         chunk_size,
     )
 
-    for chunk_index, chunk in enumerate(chunked(pending, chunk_size), start=1):
+    tuner = params.get("autotune")
+    chunks = (
+        iter_adaptive_chunks(pending, tuner)
+        if tuner is not None
+        else _plan_chunks(pending, chunk_size, params)
+    )
+    chunks = _with_numeric_fallback(chunks, templates, blocks_list, params)
+    for chunk_index, chunk in enumerate(chunks, start=1):
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         chunk_started = time.perf_counter()
         _translate_chunk_sync(
             translator,
@@ -144,11 +174,16 @@ def translate_blocks(
         if params["chunk_delay"]:
             time.sleep(params["chunk_delay"])
 
+    if tuner is not None:
+        tuner.save()
     final_texts = _finalize_texts(blocks_list, translated_texts)
-    return build_contract(
-        blocks=blocks_list,
-        translated_texts=final_texts,
-        target_language=target_language,
+    return _mark_pass_through(
+        build_contract(
+            blocks=blocks_list,
+            translated_texts=final_texts,
+            target_language=target_language,
+        ),
+        skipped,
     )
 
 
@@ -167,8 +202,18 @@ async def translate_blocks_async(
     param_overrides: dict | None = None,
     on_progress: Callable[[dict], Any] | None = None,
     mode: str | None = None,
+    cancel_token: CancellationToken | None = None,
+    priority: PriorityHint | None = None,
 ) -> dict:
-    """Translate text blocks using LLM (Asynchronous)."""
+    """Translate text blocks using LLM (Asynchronous).
+
+    When ``cancel_token`` fires, pending chunks are skipped, in-flight
+    requests are aborted and ``TranslationCancelled`` is raised. Chunks
+    that completed before that point stay in the cache and TM.
+
+    With a ``priority`` hint, chunks holding the prioritized blocks are
+    started first; the hint may be updated while the job runs.
+    """
     resolved_mode = (mode or settings.translate_llm_mode).lower()
     fallback_on_error = settings.llm_fallback_on_error
     resolved_provider, translator = _resolve_translator(
@@ -182,6 +227,7 @@ async def translate_blocks_async(
             blocks_list,
             source_lang,
             target_language,
+            within_slide=_align_within_slide(param_overrides),
         )
 
     preferred_terms = load_preferred_terms(
@@ -201,8 +247,16 @@ async def translate_blocks_async(
         "vision_context": vision_context,
     }
 
+    params = _prepare_params(
+        resolved_provider,
+        param_overrides,
+        model,
+        tone,
+        vision_context,
+    )
+    templates = NumericTemplates() if params["numeric_templates"] else None
     translated_texts, pending, local_cache = prepare_pending_blocks(
-        blocks_list,
+        templates.apply(blocks_list) if templates else blocks_list,
         target_language,
         source_lang,
         use_tm,
@@ -211,13 +265,14 @@ async def translate_blocks_async(
         refresh=refresh,
         llm_context=llm_context,
     )
-
-    params = _prepare_params(
-        resolved_provider,
-        param_overrides,
-        model,
-        tone,
-        vision_context,
+    pending, skipped = _pass_through_target_language(
+        pending, target_language, params, resolved_mode, translated_texts
+    )
+    pending = _share_numeric_templates(pending, templates, params, translated_texts)
+    if skipped and on_progress:
+        await _report_pass_through(on_progress, skipped, translated_texts)
+    await asyncio.to_thread(
+        _attach_context_index, params, blocks_list, translator, resolved_provider
     )
     chunk_size = _determine_chunk_size(pending, params)
 
@@ -231,48 +286,42 @@ async def translate_blocks_async(
         chunk_size,
     )
 
-    chunk_list = list(chunked(pending, chunk_size))
-    tasks = create_async_chunk_tasks(
-        chunk_list,
-        translator,
-        resolved_provider,
-        blocks_list,
-        target_language,
-        preferred_terms,
-        use_placeholders,
-        params,
-        fallback_on_error,
-        resolved_mode,
-        translated_texts,
-        local_cache,
-        glossary,
-        use_tm,
-        tone,
-        vision_context,
-        on_progress,
-        llm_context=llm_context,
-    )
-
-    if tasks:
-        # Wrap tasks with a semaphore if it's Ollama to prevent overloading
-        final_tasks = tasks
-        if resolved_provider == "ollama":
-            sem = asyncio.Semaphore(2)
-
-            async def sem_wrapped_task(task):
-                async with sem:
-                    return await task
-
-            final_tasks = [sem_wrapped_task(t) for t in tasks]
+    chunk_list = _chunk_pending(pending, chunk_size, params, priority)
+    tuner = params.get("autotune")
+    while chunk_list:
+        tasks = create_async_chunk_tasks(
+            chunk_list,
+            translator,
+            resolved_provider,
+            blocks_list,
+            target_language,
+            preferred_terms,
+            use_placeholders,
+            params,
+            fallback_on_error,
+            resolved_mode,
+            translated_texts,
+            local_cache,
+            glossary,
+            use_tm,
+            tone,
+            vision_context,
+            on_progress,
+            llm_context=llm_context,
+            cancel_token=cancel_token,
+        )
+        await _run_chunk_tasks(
+            chunk_list, tasks, resolved_provider, priority, tuner
+        )
+        # Blocks whose template translation lost a slot go once more,
+        # untemplated.
+        failed = templates.take_failed(blocks_list) if templates else []
+        chunk_list = _plan_chunks(
+            failed, _determine_chunk_size(failed, params), params
+        )
 
-        if hasattr(translator, "set_async_client"):
-            async with httpx.AsyncClient(
-                timeout=settings.ollama_timeout
-            ) as client:
-                translator.set_async_client(client)
-                await asyncio.gather(*final_tasks)
-        else:
-            await asyncio.gather(*final_tasks)
+    if tuner is not None:
+        tuner.save()
 
     final_texts = [
         text if text is not None else ""
@@ -286,10 +335,13 @@ async def translate_blocks_async(
             # prevent redundant output items.
             final_texts[i] = block.get("source_text", "")
 
-    return build_contract(
-        blocks=blocks_list,
-        translated_texts=final_texts,
-        target_language=target_language,
+    return _mark_pass_through(
+        build_contract(
+            blocks=blocks_list,
+            translated_texts=final_texts,
+            target_language=target_language,
+        ),
+        skipped,
     )
 
 
@@ -312,6 +364,14 @@ def _resolve_translator(
     )
 
 
+def _align_within_slide(param_overrides: dict | None) -> bool:
+    """Region check for bilingual pairs; callers turn it off for documents
+    whose ``slide_index`` is not a slide (DOCX paragraphs)."""
+    return (param_overrides or {}).get(
+        "align_within_slide", settings.llm_align_within_slide
+    )
+
+
 def _prepare_params(
     resolved_provider: str,
     overrides: dict[str, Any],
@@ -319,15 +379,235 @@ def _prepare_params(
     tone: str | None,
     vision_context: bool,
 ) -> dict[str, Any]:
+    fixed_chunk_size = "chunk_size" in overrides
     overrides.update(
         {"model": model, "tone": tone, "vision_context": vision_context}
     )
     params = get_translation_params(resolved_provider, overrides=overrides)
     if params["single_request"]:
         params["chunk_delay"] = 0.0
+    elif (
+        settings.llm_autotune_enabled
+        and resolved_provider != "mock"
+        and not fixed_chunk_size
+    ):
+        tuner = load_autotuner(
+            resolved_provider,
+            params["model"] or "default",
+            params["chunk_size"],
+            _base_concurrency(resolved_provider),
+        )
+        params["autotune"] = tuner
+        params["chunk_size"] = tuner.chunk_size
+    if resolved_provider != "mock":
+        params["failover"] = build_failover_chain(
+            resolved_provider,
+            params["failover_chain"],
+            hedge=params["hedge"],
+        )
     return params
 
 
+async def _run_chunk_tasks(
+    chunk_list: list[list],
+    tasks: list,
+    resolved_provider: str,
+    priority: PriorityHint | None,
+    tuner: ChunkAutotuner | None,
+) -> None:
+    """Run chunk coroutines with the provider's concurrency limit.
+
+    The autotuner's concurrency is read live, so it can change mid-run.
+    """
+    if priority is not None:
+        concurrency = (
+            tuner.concurrency
+            if tuner is not None
+            else _base_concurrency(resolved_provider)
+        )
+        await run_prioritized(chunk_list, tasks, priority, concurrency)
+        return
+    if tuner is not None:
+
+        async def tuned_task(task):
+            async with tuner.slot():
+                return await task
+
+        await asyncio.gather(*(tuned_task(t) for t in tasks))
+        return
+    # Wrap tasks with a semaphore if it's Ollama to prevent overloading
+    final_tasks = tasks
+    if resolved_provider == "ollama":
+        sem = asyncio.Semaphore(2)
+
+        async def sem_wrapped_task(task):
+            async with sem:
+                return await task
+
+        final_tasks = [sem_wrapped_task(t) for t in tasks]
+
+    await asyncio.gather(*final_tasks)
+
+
+def _pass_through_target_language(
+    pending: list,
+    target_language: str,
+    params: dict[str, Any],
+    resolved_mode: str,
+    translated_texts: list[str | None],
+) -> tuple[list, list]:
+    """Fill in blocks already in the target language without the LLM."""
+    if resolved_mode == "mock" or not params["skip_target_language"] or not pending:
+        return pending, []
+    pending, skipped = split_target_language(
+        pending, target_language, params["skip_target_confidence"]
+    )
+    for index, block in skipped:
+        translated_texts[index] = block.get("source_text", "")
+    if skipped:
+        LOGGER.info(
+            "Passing through %s blocks already in %s",
+            len(skipped),
+            target_language,
+        )
+    return pending, skipped
+
+
+async def _report_pass_through(
+    on_progress: Callable[[dict], Any],
+    skipped: list,
+    translated_texts: list[str | None],
+) -> None:
+    try:
+        val = on_progress(
+            {
+                "chunk_index": 0,
+                "completed_indices": [idx for idx, _ in skipped],
+                "completed_ids": [
+                    b.get("client_id") for _, b in skipped if b.get("client_id")
+                ],
+                "completed_blocks": [
+                    {
+                        "client_id": b.get("client_id"),
+                        "translated_text": translated_texts[idx],
+                    }
+                    for idx, b in skipped
+                ],
+                "chunk_size": len(skipped),
+                "total_pending": len(translated_texts),
+                "skipped_target_language": len(skipped),
+                "timestamp": time.time(),
+            }
+        )
+        if asyncio.iscoroutine(val):
+            await val
+    except Exception:
+        LOGGER.exception("Error in progress callback")
+
+
+def _mark_pass_through(result: dict, skipped: list) -> dict:
+    for index, _ in skipped:
+        result["blocks"][index]["pass_through"] = True
+    result["skipped_target_language"] = len(skipped)
+    return result
+
+
+def _share_numeric_templates(
+    pending: list,
+    templates: NumericTemplates | None,
+    params: dict[str, Any],
+    translated_texts: list[str | None],
+) -> list:
+    """Send each numeric template once; the other blocks follow it."""
+    if templates is None or not templates.templated_count:
+        return pending
+    templates.fill_cached(translated_texts)
+    before = len(pending)
+    pending = templates.dedupe(pending)
+    params["numeric_slots"] = templates
+    LOGGER.info(
+        "Numeric templates: %s blocks templated, %s pending blocks share a template",
+        templates.templated_count,
+        before - len(pending),
+    )
+    return pending
+
+
+def _with_numeric_fallback(
+    chunks,
+    templates: NumericTemplates | None,
+    blocks_list: list[dict],
+    params: dict[str, Any],
+):
+    """Yield ``chunks``, then the blocks whose template failed to fill."""
+    yield from chunks
+    if templates is not None:
+        failed = templates.take_failed(blocks_list)
+        yield from _plan_chunks(failed, _determine_chunk_size(failed, params), params)
+
+
+def _base_concurrency(resolved_provider: str) -> int:
+    return 2 if resolved_provider == "ollama" else settings.llm_stream_concurrency
+
+
+def _attach_context_index(
+    params: dict[str, Any],
+    blocks_list: list[dict],
+    translator,
+    resolved_provider: str,
+) -> None:
+    """Build the document context index (and deck summary) once."""
+    strategy = params["context_strategy"]
+    if strategy == "none":
+        return
+    index = DocumentContextIndex(blocks_list)
+    if strategy == "summary":
+        index.deck_summary = get_deck_summary(
+            index.texts_by_slide,
+            client=translator,
+            provider=resolved_provider,
+            model=params["model"] or getattr(translator, "model", None),
+        )
+    params["context_index"] = index
+
+
+def _chunk_pending(
+    pending: list,
+    chunk_size: int,
+    params: dict[str, Any],
+    priority: PriorityHint | None,
+) -> list[list]:
+    """Split pending blocks into chunks, prioritized blocks first.
+
+    In single-request mode the prioritized blocks get their own chunk so
+    they are returned before the rest of the document.
+    """
+    if priority is None or priority.is_empty:
+        return _plan_chunks(pending, chunk_size, params)
+    pending = order_pending(pending, priority)
+    if not params["single_request"]:
+        return _plan_chunks(pending, chunk_size, params)
+    first = [item for item in pending if priority.is_prioritized(*item)]
+    rest = pending[len(first):]
+    return [chunk for chunk in (first, rest) if chunk]
+
+
+def _plan_chunks(
+    pending: list,
+    chunk_size: int,
+    params: dict[str, Any],
+) -> list[list]:
+    """Chunk by block count and, if set, by estimated source tokens."""
+    max_tokens = params.get("chunk_max_tokens") or 0
+    if max_tokens <= 0:
+        return list(chunked(pending, chunk_size))
+    token_counts = estimate_block_tokens(
+        [block.get("source_text", "") for _, block in pending],
+        params.get("model"),
+    )
+    return list(chunked_by_tokens(pending, chunk_size, token_counts, max_tokens))
+
+
 def _determine_chunk_size(pending: list, params: dict[str, Any]) -> int:
     chunk_size = params["chunk_size"]
     if params["single_request"]:
@@ -359,7 +639,10 @@ def _translate_chunk_sync(
         chunk, use_placeholders, preferred_terms
     )
     context = build_context(
-        params["context_strategy"], blocks_list, chunk_blocks
+        params["context_strategy"],
+        blocks_list,
+        chunk_blocks,
+        index=params.get("context_index"),
     )
     result = translate_chunk(
         translator,
@@ -387,6 +670,9 @@ def _translate_chunk_sync(
         use_tm,
         llm_context=llm_context,
     )
+    templates = params.get("numeric_slots")
+    if templates is not None:
+        templates.fill(chunk, translated_texts)
 
 
 def _finalize_texts(
@@ -12,6 +12,7 @@ from backend.services.llm_utils import (
     cache_key,
     tm_respects_terms,
 )
+from backend.services.translate_cancel import CancellationToken
 from backend.services.translate_chunk import (
     prepare_chunk,
     translate_chunk_async,
@@ -168,14 +169,21 @@ async def process_chunk_async(
     use_tm,
     on_progress: Callable[[dict], Any] | None = None,
     llm_context: dict | None = None,
+    cancel_token: CancellationToken | None = None,
 ):
     """Helper to process a single chunk asynchronously."""
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
     chunk_started = time.perf_counter()
 
     if params.get("chunk_delay", 0) > 0:
-        await asyncio.sleep(params["chunk_delay"] * (chunk_index - 1))
+        delay = asyncio.sleep(params["chunk_delay"] * (chunk_index - 1))
+        if cancel_token is not None:
+            await cancel_token.run(delay)
+        else:
+            await delay
 
-    result = await translate_chunk_async(
+    request = translate_chunk_async(
         translator,
         provider,
         chunk_blocks,
@@ -190,6 +198,12 @@ async def process_chunk_async(
         fallback_on_error,
         mode,
     )
+    if cancel_token is not None:
+        # Cancelling the token tears down the in-flight httpx request;
+        # chunks that already finished have been checkpointed below.
+        result = await cancel_token.run(request)
+    else:
+        result = await request
 
     apply_translation_results(
         chunk,
@@ -202,42 +216,15 @@ async def process_chunk_async(
         use_tm,
         llm_context=llm_context,
     )
+    templates = params.get("numeric_slots")
+    if templates is not None:
+        # Blocks sharing a numeric template complete with this chunk.
+        chunk = templates.fill(chunk, translated_texts)
 
     if on_progress:
-        completed_indices = [idx for idx, _ in chunk]
-        completed_ids = [
-            b.get("client_id")
-            for _, b in chunk
-            if b.get("client_id")
-        ]
-        completed_blocks = []
-        for idx, block in chunk:
-            client_id = block.get("client_id")
-            translated_text = translated_texts[idx]
-            if translated_text is None:
-                continue
-            completed_blocks.append(
-                {
-                    "client_id": client_id,
-                    "translated_text": translated_text,
-                }
-            )
-        try:
-            val = on_progress(
-                {
-                    "chunk_index": chunk_index,
-                    "completed_indices": completed_indices,
-                    "completed_ids": completed_ids,
-                    "completed_blocks": completed_blocks,
-                    "chunk_size": len(chunk),
-                    "total_pending": len(translated_texts),
-                    "timestamp": time.time(),
-                }
-            )
-            if asyncio.iscoroutine(val):
-                await val
-        except Exception:
-            LOGGER.exception("Error in progress callback")
+        await _report_chunk_progress(
+            on_progress, chunk, chunk_index, translated_texts
+        )
 
     chunk_duration = time.perf_counter() - chunk_started
     LOGGER.info(
@@ -247,6 +234,48 @@ async def process_chunk_async(
     )
 
 
+async def _report_chunk_progress(
+    on_progress: Callable[[dict], Any],
+    chunk: list,
+    chunk_index: int,
+    translated_texts: list[str | None],
+) -> None:
+    completed_indices = [idx for idx, _ in chunk]
+    completed_ids = [
+        b.get("client_id")
+        for _, b in chunk
+        if b.get("client_id")
+    ]
+    completed_blocks = []
+    for idx, block in chunk:
+        client_id = block.get("client_id")
+        translated_text = translated_texts[idx]
+        if translated_text is None:
+            continue
+        completed_blocks.append(
+            {
+                "client_id": client_id,
+                "translated_text": translated_text,
+            }
+        )
+    try:
+        val = on_progress(
+            {
+                "chunk_index": chunk_index,
+                "completed_indices": completed_indices,
+                "completed_ids": completed_ids,
+                "completed_blocks": completed_blocks,
+                "chunk_size": len(chunk),
+                "total_pending": len(translated_texts),
+                "timestamp": time.time(),
+            }
+        )
+        if asyncio.iscoroutine(val):
+            await val
+    except Exception:
+        LOGGER.exception("Error in progress callback")
+
+
 def create_async_chunk_tasks(
     chunk_list,
     translator,
@@ -266,6 +295,7 @@ def create_async_chunk_tasks(
     vision_context,
     on_progress,
     llm_context: dict | None = None,
+    cancel_token: CancellationToken | None = None,
 ):
     """Create async tasks for processing chunks."""
     tasks = []
@@ -277,6 +307,7 @@ def create_async_chunk_tasks(
             params["context_strategy"],
             blocks_list,
             chunk_blocks,
+            index=params.get("context_index"),
         )
 
         tasks.append(
@@ -302,6 +333,7 @@ def create_async_chunk_tasks(
                 use_tm,
                 on_progress,
                 llm_context=llm_context,
+                cancel_token=cancel_token,
             )
         )
     return tasks
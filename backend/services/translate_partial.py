@@ -0,0 +1,183 @@
+"""Partial acceptance and bisecting retry for chunk translations.
+
+A chunk response is checked block by block: blocks that came back valid
+are kept, and only the missing or invalid ones are requested again. If a
+set of blocks makes no progress, it is split in half until the offending
+block is isolated. Blocks that still fail are reported through
+:class:`PartialTranslationError`, so the caller can checkpoint the rest.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+
+from backend.services.llm_errors import is_request_error
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PartialTranslationError(ValueError):
+    """Raised when some blocks of a chunk could not be translated.
+
+    ``texts`` holds the accepted translations (``None`` for failed
+    blocks), aligned with the blocks that were sent.
+    """
+
+    def __init__(self, texts: list[str | None], failed: list[int]) -> None:
+        super().__init__(
+            f"部分區塊翻譯失敗（{len(failed)}/{len(texts)}）：索引 {failed}"
+        )
+        self.texts = texts
+        self.failed = failed
+
+
+def _valid_text(item, block: dict) -> str | None:
+    if not isinstance(item, dict):
+        return None
+    text = item.get("translated_text")
+    if not isinstance(text, str):
+        return None
+    if not text.strip() and block.get("source_text", "").strip():
+        return None
+    return text
+
+
+def _texts_by_id(items: list, blocks: list[dict]) -> list[str | None] | None:
+    """Match compact-prompt responses by their echoed ``id``."""
+    if not items or not all(
+        isinstance(item, dict) and isinstance(item.get("id"), int)
+        for item in items
+    ):
+        return None
+    texts: list[str | None] = [None] * len(blocks)
+    for item in items:
+        i = item["id"]
+        if 0 <= i < len(blocks):
+            texts[i] = _valid_text(item, blocks[i])
+    return texts
+
+
+def collect_valid_texts(result, blocks: list[dict]) -> list[str | None]:
+    """Return the valid translated text per block, ``None`` if invalid.
+
+    Blocks are matched by ``id`` when every item carries one (compact
+    prompts), by position when the response has the expected length, and
+    otherwise by their echoed ``source_text``.
+    """
+    texts: list[str | None] = [None] * len(blocks)
+    items = result.get("blocks") if isinstance(result, dict) else None
+    if not isinstance(items, list):
+        return texts
+
+    by_id = _texts_by_id(items, blocks)
+    if by_id is not None:
+        return by_id
+
+    if len(items) == len(blocks):
+        for i, item in enumerate(items):
+            texts[i] = _valid_text(item, blocks[i])
+        return texts
+
+    unmatched: dict[str, list[int]] = {}
+    for i, block in enumerate(blocks):
+        unmatched.setdefault(block.get("source_text", ""), []).append(i)
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        indices = unmatched.get(item.get("source_text"))
+        if indices:
+            i = indices.pop(0)
+            texts[i] = _valid_text(item, blocks[i])
+    return texts
+
+
+def _next_round(
+    indices: list[int],
+    texts: list[str | None],
+    depth: int,
+) -> list[tuple[list[int], int]]:
+    """Decide which index groups to request next."""
+    still = [i for i in indices if texts[i] is None]
+    if not still or len(indices) == 1:
+        return []
+    if len(still) < len(indices):
+        # Progress was made: re-request only what is missing.
+        return [(still, depth + 1)]
+    if depth > 0 and all(text is None for text in texts):
+        # Nothing in the chunk ever succeeded; the model or prompt is the
+        # problem, not a single block, so stop splitting.
+        return []
+    mid = len(still) // 2
+    return [(still[:mid], depth + 1), (still[mid:], depth + 1)]
+
+
+def fill_missing_texts(
+    request_func: Callable[[list[dict]], dict],
+    blocks: list[dict],
+    texts: list[str | None],
+) -> list[str]:
+    """Request every ``None`` entry in ``texts``, bisecting on failure."""
+    last_error: Exception | None = None
+    queue = [([i for i, text in enumerate(texts) if text is None], 0)]
+    while queue:
+        indices, depth = queue.pop(0)
+        if not indices:
+            continue
+        subset = [blocks[i] for i in indices]
+        try:
+            sub_texts = collect_valid_texts(request_func(subset), subset)
+        except Exception as exc:
+            if is_request_error(exc):
+                raise
+            LOGGER.warning(
+                "Chunk request for %s blocks failed: %s", len(indices), exc
+            )
+            last_error = exc
+            sub_texts = [None] * len(indices)
+        for i, text in zip(indices, sub_texts, strict=True):
+            if text is not None:
+                texts[i] = text
+        queue.extend(_next_round(indices, texts, depth))
+
+    return _finish(texts, last_error)
+
+
+async def fill_missing_texts_async(
+    request_func: Callable[[list[dict]], Awaitable[dict]],
+    blocks: list[dict],
+    texts: list[str | None],
+) -> list[str]:
+    """Async variant of :func:`fill_missing_texts`."""
+    last_error: Exception | None = None
+    queue = [([i for i, text in enumerate(texts) if text is None], 0)]
+    while queue:
+        indices, depth = queue.pop(0)
+        if not indices:
+            continue
+        subset = [blocks[i] for i in indices]
+        try:
+            sub_texts = collect_valid_texts(await request_func(subset), subset)
+        except Exception as exc:
+            if is_request_error(exc):
+                raise
+            LOGGER.warning(
+                "Chunk request for %s blocks failed: %s", len(indices), exc
+            )
+            last_error = exc
+            sub_texts = [None] * len(indices)
+        for i, text in zip(indices, sub_texts, strict=True):
+            if text is not None:
+                texts[i] = text
+        queue.extend(_next_round(indices, texts, depth))
+
+    return _finish(texts, last_error)
+
+
+def _finish(texts: list[str | None], last_error: Exception | None) -> list[str]:
+    failed = [i for i, text in enumerate(texts) if text is None]
+    if not failed:
+        return texts  # type: ignore[return-value]
+    if len(failed) == len(texts) and last_error is not None:
+        raise last_error
+    raise PartialTranslationError(texts, failed) from last_error
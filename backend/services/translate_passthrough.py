@@ -0,0 +1,90 @@
+"""Pass-through for blocks already written in the target language.
+
+Before chunks are dispatched, each pending block is scored with the block
+analysis (cached language plus script histogram). A block is passed
+through untranslated when its detected language is the target and the
+target's script makes up at least ``LLM_SKIP_TARGET_CONFIDENCE`` of its
+letters. Mixed blocks, e.g. Vietnamese with Chinese, stay below the
+threshold and are still translated.
+
+For zh-TW / zh-CN the block must also contain characters specific to
+the requested variant (and none of the other). Otherwise a Simplified
+block could pass through to a Traditional target.
+"""
+
+from __future__ import annotations
+
+from backend.services.block_analysis import block_analyses
+from backend.services.language_detect import zh_variant_scores
+
+# Blocks with fewer letters than this are too short to judge.
+MIN_LETTERS = 4
+
+_LETTER_SCRIPTS = ("han", "kana", "hangul", "thai", "vi", "latin")
+_TARGET_SCRIPTS = {
+    "zh": ("han",),
+    "ja": ("han", "kana"),
+    "ko": ("hangul",),
+    "th": ("thai",),
+}
+_LATIN_SCRIPTS = ("latin", "vi")
+
+
+def _language_family(code: str) -> str:
+    return code.split("-")[0].lower()
+
+
+def _script_share(scripts: dict, target_language: str) -> float:
+    letters = sum(scripts.get(name, 0) for name in _LETTER_SCRIPTS)
+    if letters < MIN_LETTERS:
+        return 0.0
+    names = _TARGET_SCRIPTS.get(_language_family(target_language), _LATIN_SCRIPTS)
+    return sum(scripts.get(name, 0) for name in names) / letters
+
+
+def _has_variant_evidence(text: str, target_language: str) -> bool:
+    trad, simp = zh_variant_scores(text)
+    if target_language == "zh-TW":
+        return trad > 0 and simp == 0
+    if target_language == "zh-CN":
+        return simp > 0 and trad == 0
+    return True
+
+
+def target_language_confidence(block: dict, target_language: str) -> float:
+    """Confidence (0-1) that ``block`` is already in ``target_language``."""
+    analysis = block_analyses([block])[0]
+    detected = analysis["language"]
+    target = (target_language or "").strip()
+    if not detected or not target or target == "auto":
+        return 0.0
+    if target == "zh":
+        if not detected.startswith("zh"):
+            return 0.0
+    elif detected != target:
+        return 0.0
+    if not _has_variant_evidence(block.get("source_text", ""), target):
+        return 0.0
+    return _script_share(analysis["scripts"], target)
+
+
+def split_target_language(
+    pending: list[tuple[int, dict]],
+    target_language: str,
+    threshold: float,
+) -> tuple[list[tuple[int, dict]], list[tuple[int, dict]]]:
+    """Split pending blocks into (to translate, pass through)."""
+    # Analyse every block not analysed yet in one batch.
+    block_analyses([block for _, block in pending])
+    keep: list[tuple[int, dict]] = []
+    skipped: list[tuple[int, dict]] = []
+    for item in pending:
+        _, block = item
+        if block.get("alignment_role"):
+            # Bilingual pairs are handled by the alignment pass.
+            keep.append(item)
+        elif target_language_confidence(block, target_language) >= threshold:
+            skipped.append(item)
+        else:
+            keep.append(item)
+    return keep, skipped
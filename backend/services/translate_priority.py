@@ -0,0 +1,190 @@
+"""Priority scheduling for streaming translation jobs.
+
+A reviewer usually looks at a few slides while a long job runs. The
+client sends a :class:`PriorityHint` (a slide range and/or an ordered
+list of client_ids); chunks that contain those blocks are started first.
+The hint can be updated mid-job, and chunks that have not started yet are
+re-ranked before the next one is picked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+from collections.abc import Coroutine
+from typing import Any
+
+_CLIENT_ID_TIER = 0
+_SLIDE_TIER = 1
+_DEFAULT_TIER = 2
+
+
+class PriorityHint:
+    """Mutable priority hint shared between the API and the scheduler."""
+
+    def __init__(
+        self,
+        slide_range: tuple[int, int] | None = None,
+        client_ids: list[str] | None = None,
+    ) -> None:
+        self.version = 0
+        self.slide_range: tuple[int, int] | None = None
+        self.client_ids: dict[str, int] = {}
+        self.update(slide_range, client_ids)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.slide_range is None and not self.client_ids
+
+    def update(
+        self,
+        slide_range: tuple[int, int] | None = None,
+        client_ids: list[str] | None = None,
+    ) -> None:
+        if slide_range is not None:
+            start, end = slide_range
+            slide_range = (min(start, end), max(start, end))
+        self.slide_range = slide_range
+        self.client_ids = {
+            client_id: position
+            for position, client_id in enumerate(dict.fromkeys(client_ids or []))
+        }
+        self.version += 1
+
+    def block_rank(self, index: int, block: dict) -> tuple[int, int]:
+        """Lower ranks are translated first."""
+        position = self.client_ids.get(block.get("client_id"))
+        if position is not None:
+            return (_CLIENT_ID_TIER, position)
+        slide_index = block.get("slide_index")
+        if self.slide_range is not None and isinstance(slide_index, int):
+            start, end = self.slide_range
+            if start <= slide_index <= end:
+                return (_SLIDE_TIER, slide_index - start)
+        return (_DEFAULT_TIER, index)
+
+    def is_prioritized(self, index: int, block: dict) -> bool:
+        return self.block_rank(index, block)[0] != _DEFAULT_TIER
+
+    def chunk_rank(self, chunk: list[tuple[int, dict]]) -> tuple[int, int]:
+        if not chunk:
+            return (_DEFAULT_TIER, 0)
+        return min(self.block_rank(index, block) for index, block in chunk)
+
+
+def parse_priority_hint(raw: str | None) -> PriorityHint | None:
+    """Parse the ``priority`` form field.
+
+    Accepts ``{"slides": [start, end], "client_ids": [...]}``; either key
+    may be omitted. Raises ValueError on malformed input.
+    """
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError("priority JSON 無效") from exc
+    if not isinstance(data, dict):
+        raise ValueError("priority 必須為物件")
+    slide_range, client_ids = _parse_fields(data)
+    return PriorityHint(slide_range, client_ids)
+
+
+def update_priority_hint(hint: PriorityHint, raw: str) -> None:
+    """Replace ``hint`` with the values parsed from ``raw``."""
+    parsed = parse_priority_hint(raw)
+    if parsed is None:
+        hint.update()
+        return
+    hint.update(parsed.slide_range, list(parsed.client_ids))
+
+
+def _parse_fields(data: dict) -> tuple[tuple[int, int] | None, list[str]]:
+    slides = data.get("slides")
+    slide_range = None
+    if slides is not None:
+        if (
+            not isinstance(slides, list)
+            or len(slides) not in (1, 2)
+            or not all(isinstance(value, int) for value in slides)
+        ):
+            raise ValueError("priority.slides 必須為 [起始, 結束]")
+        slide_range = (slides[0], slides[-1])
+    client_ids = data.get("client_ids") or []
+    if not isinstance(client_ids, list):
+        raise ValueError("priority.client_ids 必須為陣列")
+    return slide_range, [str(client_id) for client_id in client_ids]
+
+
+def order_pending(
+    pending: list[tuple[int, dict]],
+    hint: PriorityHint | None,
+) -> list[tuple[int, dict]]:
+    """Stable-sort pending blocks so prioritized ones are chunked first."""
+    if hint is None or hint.is_empty:
+        return pending
+    return sorted(pending, key=lambda item: hint.block_rank(*item))
+
+
+class ChunkScheduler:
+    """Priority queue of chunk indices, re-ranked when the hint changes."""
+
+    def __init__(
+        self,
+        chunks: list[list[tuple[int, dict]]],
+        hint: PriorityHint,
+    ) -> None:
+        self.chunks = chunks
+        self.hint = hint
+        self._pending = set(range(len(chunks)))
+        self._version = -1
+        self._heap: list[tuple[tuple[int, int], int]] = []
+
+    def _rebuild(self) -> None:
+        self._heap = [
+            (self.hint.chunk_rank(self.chunks[i]), i) for i in self._pending
+        ]
+        heapq.heapify(self._heap)
+        self._version = self.hint.version
+
+    def pop(self) -> int | None:
+        if self._version != self.hint.version:
+            self._rebuild()
+        if not self._heap:
+            return None
+        _, chunk_index = heapq.heappop(self._heap)
+        self._pending.discard(chunk_index)
+        return chunk_index
+
+
+async def run_prioritized(
+    chunks: list[list[tuple[int, dict]]],
+    tasks: list[Coroutine[Any, Any, Any]],
+    hint: PriorityHint,
+    concurrency: int,
+) -> None:
+    """Run chunk coroutines, ``concurrency`` at a time, in priority order."""
+    scheduler = ChunkScheduler(chunks, hint)
+    started: set[int] = set()
+
+    async def worker() -> None:
+        while True:
+            chunk_index = scheduler.pop()
+            if chunk_index is None:
+                return
+            started.add(chunk_index)
+            await tasks[chunk_index]
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(max(1, min(concurrency, len(tasks))))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for worker_task in workers:
+            worker_task.cancel()
+        for chunk_index, task in enumerate(tasks):
+            if chunk_index not in started:
+                task.close()
@@ -85,25 +85,34 @@ def build_ollama_batch_prompt(
         )
 
 
-def parse_ollama_batch_response(text: str, count: int) -> list[str] | None:
-    """Parse Ollama batch translation response."""
-    matches = BLOCK_RESPONSE_PATTERN.findall(text)
-    if not matches:
-        return None
+def parse_ollama_batch_partial(text: str, count: int) -> dict[int, str]:
+    """Parse the blocks that are present in an Ollama batch response.
 
-    translated = [""] * count
-    for idx_str, content in matches:
+    Returns a mapping of block index to cleaned text; missing or empty
+    blocks are simply absent so callers can re-request only those.
+    """
+    translated: dict[int, str] = {}
+    for idx_str, content in BLOCK_RESPONSE_PATTERN.findall(text or ""):
         if not idx_str.isdigit():
             continue
         idx = int(idx_str)
         if 0 <= idx < count:
             cleaned = TAG_PATTERN.sub("", content).strip()
             cleaned = re.sub(r"<<<BLOCK:\d+>>>|<<<END>>>", "", cleaned).strip()
-            translated[idx] = cleaned
+            if cleaned:
+                translated[idx] = cleaned
+    return translated
+
 
-    if any(item == "" for item in translated):
+def parse_ollama_batch_response(text: str, count: int) -> list[str] | None:
+    """Parse Ollama batch translation response.
+
+    Returns None unless every block is present.
+    """
+    parsed = parse_ollama_batch_partial(text, count)
+    if len(parsed) < count:
         return None
-    return translated
+    return [parsed[idx] for idx in range(count)]
 
 
 def _render_blocks(blocks: list[dict]) -> str:
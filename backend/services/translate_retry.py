@@ -6,10 +6,12 @@ result post-processing.
 
 from __future__ import annotations
 
+import logging
+
 from backend.services.language_detect import (
     _CJK_RE,
     _VI_DIACRITIC_RE,
-    detect_language,
+    detect_languages,
 )
 from backend.services.llm_glossary import apply_glossary
 from backend.services.llm_placeholders import (
@@ -17,15 +19,14 @@ from backend.services.llm_placeholders import (
     restore_placeholders,
 )
 from backend.services.llm_utils import cache_key
+from backend.services.numeric_template import slot_tokens, slots_intact, strip_slots
 from backend.services.translate_config import get_language_hint
 from backend.services.translation_memory import save_tm
 
-def matches_target_language(text: str, target_language: str) -> bool:
-    """Return True when the detected language matches the expectation."""
-    cleaned = (text or "").strip()
-    if not cleaned:
-        return True
-    detected = detect_language(cleaned)
+LOGGER = logging.getLogger(__name__)
+
+
+def _language_matches(detected: str | None, target_language: str) -> bool:
     if not detected:
         return True
     target = (target_language or "").strip()
@@ -38,6 +39,15 @@ def matches_target_language(text: str, target_language: str) -> bool:
     return detected == target
 
 
+def _detect_stripped(texts: list[str]) -> list[str | None]:
+    return detect_languages([strip_slots(text).strip() for text in texts])
+
+
+def matches_target_language(text: str, target_language: str) -> bool:
+    """Return True when the detected language matches the expectation."""
+    return _language_matches(_detect_stripped([text])[0], target_language)
+
+
 def has_language_mismatch(texts: list[str], target_language: str) -> bool:
     """Return True if majority of texts do not match the target language."""
     if not target_language or target_language == "auto":
@@ -45,15 +55,11 @@ def has_language_mismatch(texts: list[str], target_language: str) -> bool:
     if not texts:
         return False
 
-    total = len(texts)
-    threshold = total * 0.5
-    matching_count = 0
-    for text in texts:
-        if matches_target_language(text, target_language):
-            matching_count += 1
-            if matching_count >= threshold:
-                return False
-    return matching_count < threshold
+    matching_count = sum(
+        _language_matches(detected, target_language)
+        for detected in _detect_stripped(texts)
+    )
+    return matching_count < len(texts) * 0.5
 
 
 def build_language_retry_context(
@@ -62,8 +68,7 @@ def build_language_retry_context(
     """Build context payload when LLM outputs the wrong language."""
     updated = dict(context or {})
     detected_counts: dict[str, int] = {}
-    for text in texts:
-        detected = detect_language((text or "").strip())
+    for detected in _detect_stripped(texts):
         if detected:
             detected_counts[detected] = detected_counts.get(detected, 0) + 1
 
@@ -101,15 +106,22 @@ def _apply_vi_preservation(source_text: str, translated_text: str) -> str:
     return translated_text
 
 
-def _should_save_tm(
-    translated_text: str, target_language: str, use_tm: bool
+def _should_cache(
+    source_text: str, translated_text: str, target_language: str
 ) -> bool:
     return (
         not has_placeholder(translated_text)
+        and slots_intact(source_text, translated_text)
         and matches_target_language(translated_text, target_language)
     )
 
 
+def _should_save_tm(source_text: str, use_tm: bool) -> bool:
+    # Numeric templates only mean something within their job; the filled
+    # per-block texts are not known here, so nothing is stored for them.
+    return not slot_tokens(source_text)
+
+
 def apply_translation_results(
     chunk: list[tuple[int, dict]],
     placeholder_maps: list[dict[str, str]],
@@ -142,10 +154,11 @@ def apply_translation_results(
             translated_text = apply_glossary(translated_text, glossary)
 
         translated_texts[original[0]] = translated_text
-        key = cache_key(original[1], context=llm_context)
+        if not _should_cache(source_text, translated_text, target_language):
+            continue
+        cache[cache_key(original[1], context=llm_context)] = translated_text
 
-        if _should_save_tm(translated_text, target_language, use_tm):
-            cache[key] = translated_text
+        if _should_save_tm(source_text, use_tm):
             save_tm(
                 source_lang=settings.source_language
                 if settings.source_language != "auto"
@@ -157,6 +170,96 @@ def apply_translation_results(
             )
 
 
+def find_language_mismatches(
+    texts: list[str],
+    target_language: str,
+) -> list[int]:
+    """Return the indices of texts that are not in the target language."""
+    if not target_language or target_language == "auto":
+        return []
+    return [
+        i
+        for i, detected in enumerate(_detect_stripped(texts))
+        if not _language_matches(detected, target_language)
+    ]
+
+
+def _is_language_neutral(source_text: str, translated_text: str) -> bool:
+    """True for blocks whose language cannot be judged.
+
+    Sources without letters, and blocks the model kept verbatim (brand
+    names, codes, short Latin labels), are not language mismatches.
+    """
+    source = strip_slots(source_text).strip()
+    if not any(char.isalpha() for char in source):
+        return True
+    return source.casefold() == strip_slots(translated_text).strip().casefold()
+
+
+def language_retry_indices(
+    chunk_blocks: list[dict],
+    texts: list[str],
+    target_language: str,
+) -> list[int]:
+    """Indices of blocks worth a strict language retry.
+
+    Language-neutral blocks are ignored. Returns [] unless at least
+    ``LLM_LANGUAGE_RETRY_MIN_RATIO`` of the remaining blocks came back in
+    the wrong language, so one stray label does not cost a request.
+    """
+    from backend.config import settings
+
+    candidates = [
+        i
+        for i, (block, text) in enumerate(zip(chunk_blocks, texts, strict=True))
+        if not _is_language_neutral(block.get("source_text", ""), text)
+    ]
+    if not candidates:
+        return []
+    mismatched = [
+        candidates[i]
+        for i in find_language_mismatches(
+            [texts[i] for i in candidates], target_language
+        )
+    ]
+    if len(mismatched) < settings.llm_language_retry_min_ratio * len(candidates):
+        return []
+    return mismatched
+
+
+def _merge_language_retry(
+    result: dict,
+    mismatched: list[int],
+    retry_texts: list[str | None],
+    target_language: str,
+) -> dict:
+    """Replace mismatched blocks with their retried text.
+
+    Raises only when the merged chunk is still mostly in the wrong
+    language; a few stubborn blocks are kept and logged instead.
+    """
+    blocks = [dict(item) for item in result["blocks"]]
+    for i, text in zip(mismatched, retry_texts, strict=True):
+        if text is not None:
+            blocks[i]["translated_text"] = text
+    merged = {**result, "blocks": blocks}
+
+    merged_texts = [item.get("translated_text", "") for item in blocks]
+    if has_language_mismatch(merged_texts, target_language):
+        raise ValueError(
+            f"重試翻譯後語言仍不符合目標語言 ({target_language})"
+        )
+    remaining = find_language_mismatches(merged_texts, target_language)
+    if remaining:
+        LOGGER.warning(
+            "Language retry left %s/%s blocks not in %s",
+            len(remaining),
+            len(blocks),
+            target_language,
+        )
+    return merged
+
+
 def retry_for_language(
     translator,
     provider,
@@ -165,60 +268,50 @@ def retry_for_language(
     context,
     preferred_terms,
     placeholder_tokens,
-    chunk_texts,
+    result,
 ):
-    """Retry translation synchronously with stricter language guard."""
-    from backend.services.llm_contract import (
-        build_contract,
-        coerce_contract,
-        validate_contract,
-    )
+    """Retry only the mismatched blocks with a stricter language guard.
+
+    The blocks picked by :func:`language_retry_indices` are sent in one
+    strict request; blocks that were already correct are kept.
+    """
+    from backend.services.llm_contract import coerce_contract
+    from backend.services.translate_partial import collect_valid_texts
     from backend.services.translate_prompt import (
         build_ollama_batch_prompt,
-        parse_ollama_batch_response,
+        parse_ollama_batch_partial,
     )
 
+    texts = [item.get("translated_text", "") for item in result["blocks"]]
+    mismatched = language_retry_indices(chunk_blocks, texts, target_language)
+    if not mismatched:
+        return result
+    subset = [chunk_blocks[i] for i in mismatched]
+
     if provider == "ollama":
         strict_prompt = build_ollama_batch_prompt(
-            chunk_blocks, target_language, strict=True
+            subset, target_language, strict=True
         )
         strict_output = translator.translate_plain(strict_prompt)
-        strict_texts = parse_ollama_batch_response(
-            strict_output, len(chunk_blocks)
+        parsed = parse_ollama_batch_partial(strict_output, len(subset))
+        retry_texts = [parsed.get(i) for i in range(len(subset))]
+    else:
+        strict_context = build_language_retry_context(
+            context, [texts[i] for i in mismatched], target_language
         )
-        if strict_texts is not None:
-            result = build_contract(
-                chunk_blocks,
-                target_language,
-                strict_texts,
-            )
-            validate_contract(result)
-            return result
-        raise ValueError("Ollama 重試語言失敗")
-
-    strict_context = build_language_retry_context(
-        context, chunk_texts, target_language
-    )
-    result = translator.translate(
-        chunk_blocks,
-        target_language,
-        context=strict_context,
-        preferred_terms=preferred_terms,
-        placeholder_tokens=placeholder_tokens,
-    )
-    result = coerce_contract(result, chunk_blocks, target_language)
-    validate_contract(result)
-
-    new_texts = [
-        item.get("translated_text", "")
-        for item in result["blocks"]
-    ]
-    if has_language_mismatch(new_texts, target_language):
-        raise ValueError(
-            f"重試翻譯後語言仍不符合目標語言 ({target_language})"
+        retry_result = translator.translate(
+            subset,
+            target_language,
+            context=strict_context,
+            preferred_terms=preferred_terms,
+            placeholder_tokens=placeholder_tokens,
         )
+        retry_result = coerce_contract(retry_result, subset, target_language)
+        retry_texts = collect_valid_texts(retry_result, subset)
 
-    return result
+    return _merge_language_retry(
+        result, mismatched, retry_texts, target_language
+    )
 
 
 async def retry_for_language_async(
@@ -229,60 +322,46 @@ async def retry_for_language_async(
     context,
     preferred_terms,
     placeholder_tokens,
-    chunk_texts,
+    result,
 ):
-    """Retry translation asynchronously with stricter language guard."""
-    from backend.services.llm_contract import (
-        build_contract,
-        coerce_contract,
-        validate_contract,
-    )
+    """Async variant of :func:`retry_for_language`."""
+    from backend.services.llm_contract import coerce_contract
+    from backend.services.translate_partial import collect_valid_texts
     from backend.services.translate_prompt import (
         build_ollama_batch_prompt,
-        parse_ollama_batch_response,
+        parse_ollama_batch_partial,
     )
 
+    texts = [item.get("translated_text", "") for item in result["blocks"]]
+    mismatched = language_retry_indices(chunk_blocks, texts, target_language)
+    if not mismatched:
+        return result
+    subset = [chunk_blocks[i] for i in mismatched]
+
     if provider == "ollama":
         strict_prompt = build_ollama_batch_prompt(
-            chunk_blocks, target_language, strict=True
+            subset, target_language, strict=True
         )
         strict_output = await translator.translate_plain_async(strict_prompt)
-        strict_texts = parse_ollama_batch_response(
-            strict_output, len(chunk_blocks)
+        parsed = parse_ollama_batch_partial(strict_output, len(subset))
+        retry_texts = [parsed.get(i) for i in range(len(subset))]
+    else:
+        strict_context = build_language_retry_context(
+            context, [texts[i] for i in mismatched], target_language
         )
-        if strict_texts is not None:
-            result = build_contract(
-                chunk_blocks,
-                target_language,
-                strict_texts,
-            )
-            validate_contract(result)
-            return result
-        raise ValueError("Ollama 重試語言失敗 (async)")
-
-    strict_context = build_language_retry_context(
-        context, chunk_texts, target_language
-    )
-    result = await translator.translate_async(
-        chunk_blocks,
-        target_language,
-        context=strict_context,
-        preferred_terms=preferred_terms,
-        placeholder_tokens=placeholder_tokens,
-    )
-    result = coerce_contract(result, chunk_blocks, target_language)
-    validate_contract(result)
-
-    new_texts = [
-        item.get("translated_text", "")
-        for item in result["blocks"]
-    ]
-    if has_language_mismatch(new_texts, target_language):
-        raise ValueError(
-            f"重試翻譯後語言仍不符合目標語言 ({target_language})"
+        retry_result = await translator.translate_async(
+            subset,
+            target_language,
+            context=strict_context,
+            preferred_terms=preferred_terms,
+            placeholder_tokens=placeholder_tokens,
         )
+        retry_result = coerce_contract(retry_result, subset, target_language)
+        retry_texts = collect_valid_texts(retry_result, subset)
 
-    return result
+    return _merge_language_retry(
+        result, mismatched, retry_texts, target_language
+    )
 
 
 def fallback_mock(
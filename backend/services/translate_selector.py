@@ -128,6 +128,10 @@ def get_translation_params(
 
     return {
         "chunk_size": chunk_size,
+        "chunk_max_tokens": overrides.get(
+            "chunk_max_tokens",
+            settings.llm_chunk_max_tokens,
+        ),
         "max_retries": max_retries,
         "chunk_delay": chunk_delay,
         "single_request": single_request,
@@ -139,4 +143,37 @@ def get_translation_params(
         "tone": overrides.get("tone"),
         "vision_context": overrides.get("vision_context", True),
         "refresh": overrides.get("refresh", False),
+        "failover_chain": overrides.get(
+            "failover_chain",
+            settings.llm_failover_chain,
+        ),
+        "hedge": overrides.get("hedge", settings.llm_hedge_enabled),
+        "skip_target_language": overrides.get(
+            "skip_target_language",
+            settings.llm_skip_target_language,
+        ),
+        "skip_target_confidence": overrides.get(
+            "skip_target_confidence",
+            settings.llm_skip_target_confidence,
+        ),
+        "numeric_templates": overrides.get(
+            "numeric_templates",
+            settings.llm_numeric_templates,
+        ),
     }
+
+
+def apply_skip_target_override(
+    param_overrides: dict,
+    mode: str,
+    skip_target_language: bool | None,
+) -> None:
+    """Per-request switch for the target-language pass-through.
+
+    Correction mode handles target-language blocks itself, so the
+    pass-through is always off there.
+    """
+    if mode == "correction":
+        param_overrides["skip_target_language"] = False
+    elif skip_target_language is not None:
+        param_overrides["skip_target_language"] = skip_target_language
@@ -2,6 +2,24 @@ from copy import copy
 
 import openpyxl
 
+from backend.contracts import is_pass_through
+
+def _cell_targets(block: dict) -> list[tuple[str, str]]:
+    """(sheet_name, cell_address) of every cell a block fills.
+
+    Streaming extraction emits one block per distinct text with all its
+    cells in ``cells``; per-cell blocks only carry their own address.
+    """
+    cells = block.get("cells")
+    if cells:
+        return [(sheet_name, address) for sheet_name, address in cells]
+    sheet_name = block.get("sheet_name")
+    cell_address = block.get("cell_address")
+    if sheet_name and cell_address:
+        return [(sheet_name, cell_address)]
+    return []
+
+
 def apply_translations(input_path: str, output_path: str, blocks: list[dict]):
     """Apply translations to the Excel file."""
     # Load with data_only=False to keep formulas
@@ -10,11 +28,9 @@ def apply_translations(input_path: str, output_path: str, blocks: list[dict]):
     # Map (sheet_name, cell_address) -> translated_text.
     translations = {}
     for block in blocks:
-        sheet_name = block.get("sheet_name")
-        cell_address = block.get("cell_address")
         translated_text = block.get("translated_text", "")
-        if sheet_name and cell_address:
-            translations[(sheet_name, cell_address)] = translated_text
+        for target in _cell_targets(block):
+            translations[target] = translated_text
 
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
@@ -45,15 +61,14 @@ def apply_bilingual(
 
     translations = {}
     for block in blocks:
-        sheet_name = block.get("sheet_name")
-        cell_address = block.get("cell_address")
+        # Pass-through blocks are already in the target language.
+        if is_pass_through(block):
+            continue
         source_text = block.get("source_text", "")
         translated_text = block.get("translated_text", "")
-        if sheet_name and cell_address:
+        for target in _cell_targets(block):
             # Simple bilingual: Source \n Translated
-            translations[(sheet_name, cell_address)] = (
-                f"{source_text}\n{translated_text}"
-            )
+            translations[target] = f"{source_text}\n{translated_text}"
 
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
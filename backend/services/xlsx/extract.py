@@ -1,94 +1,139 @@
 from __future__ import annotations
 
+import logging
+
 import openpyxl
 
+from backend.config import settings
 from backend.contracts import make_block
-from backend.services.extract_utils import (
-    is_garbage_text,
-    is_numeric_only,
-    is_technical_terms_only,
-)
+from backend.services.block_analysis import annotate_blocks
+from backend.services.extract_utils import classify_blocks
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _sheet_cells(ws) -> list[tuple[str, str, bool]]:
+    """(cell_address, text, is_hidden) for every non-empty cell of ``ws``."""
+    is_sheet_hidden = ws.sheet_state != "visible"
+    cells: list[tuple[str, str, bool]] = []
+
+    # Iterate through all cells that have values
+    for row_idx, row in enumerate(ws.iter_rows(), start=1):
+        # Check if row is hidden
+        is_row_hidden = (
+            ws.row_dimensions[row_idx].hidden
+            if row_idx in ws.row_dimensions
+            else False
+        )
+
+        for cell in row:
+            if cell.value is None:
+                continue
+
+            # Check if column is hidden
+            col_letter = cell.column_letter
+            is_col_hidden = (
+                ws.column_dimensions[col_letter].hidden
+                if col_letter in ws.column_dimensions
+                else False
+            )
 
-def extract_blocks(xlsx_path: str) -> dict:
-    """
-    Extract text blocks from an Excel file.
+            # Convert to string and clean
+            text = str(cell.value).strip()
+            if not text:
+                continue
+            cells.append(
+                (
+                    cell.coordinate,
+                    text,
+                    is_sheet_hidden or is_row_hidden or is_col_hidden,
+                )
+            )
+    return cells
 
-    Returns standard block format compatible with the translation pipeline.
-    Uses read_only mode for performance with large files.
-    """
+
+def _sheet_blocks(ws, sheet_index: int, sheet_name: str) -> list[dict]:
+    cells = _sheet_cells(ws)
+    # Filter numeric-only, technical-term-only and garbage content in one
+    # batch; repeated cell values are classified once.
+    reasons = classify_blocks(text for _, text, _ in cells)
+    blocks: list[dict] = []
+    # Unique ID counter for blocks in the sheet
+    shape_id = 0
+    for (address, text, is_hidden), reason in zip(cells, reasons, strict=True):
+        if reason:
+            continue
+        shape_id += 1
+
+        # Standard block with extra Excel-specific fields
+        block = make_block(
+            slide_index=sheet_index,
+            shape_id=shape_id,
+            block_type="spreadsheet_cell",
+            source_text=text,
+        )
+
+        # Assign a unique client_id for correction mode tracking
+        block["client_id"] = f"xlsx-{sheet_index}-{shape_id}"
+
+        # Add Excel-specific metadata for reconstruction
+        block["sheet_name"] = sheet_name
+        block["cell_address"] = address
+        block["is_hidden"] = is_hidden
+
+        blocks.append(block)
+    return blocks
+
+
+def _sheet_units(xlsx_path: str) -> list[list[dict]]:
+    """Blocks of every sheet, one list per sheet."""
     # Use read_only=False if we need dimensions/hidden status reliably,
     # but read_only=True is much faster for large files.
     # To get hidden status, we must use read_only=False or accept it
     # might be missing.
     wb = openpyxl.load_workbook(xlsx_path, data_only=True)
-    blocks: list[dict] = []
+    sheet_names = wb.sheetnames
+    return [
+        _sheet_blocks(wb[sheet_names[index]], index, sheet_names[index])
+        for index in range(len(sheet_names))
+    ]
 
-    # Track metadata for the whole document
-    for sheet_index, sheet_name in enumerate(wb.sheetnames):
-        ws = wb[sheet_name]
-        is_sheet_hidden = ws.sheet_state != "visible"
-
-        # Unique ID counter for blocks in this sheet
-        block_id_counter = 0
-
-        # Iterate through all cells that have values
-        # Filter numeric-only and technical-term-only content.
-        for row_idx, row in enumerate(ws.iter_rows(), start=1):
-            # Check if row is hidden
-            is_row_hidden = (
-                ws.row_dimensions[row_idx].hidden
-                if row_idx in ws.row_dimensions
-                else False
-            )
-
-            for cell in row:
-                if cell.value is None:
-                    continue
-
-                # Check if column is hidden
-                col_letter = cell.column_letter
-                is_col_hidden = (
-                    ws.column_dimensions[col_letter].hidden
-                    if col_letter in ws.column_dimensions
-                    else False
-                )
 
-                # Convert to string and clean
-                text = str(cell.value).strip()
-
-                # Use heuristics to filter non-translatable content
-                if (
-                    not text
-                    or is_numeric_only(text)
-                    or is_technical_terms_only(text)
-                    or is_garbage_text(text)
-                ):
-                    continue
-
-                block_id_counter += 1
-                shape_id = block_id_counter
-
-                # Standard block with extra Excel-specific fields
-                block = make_block(
-                    slide_index=sheet_index,
-                    shape_id=shape_id,
-                    block_type="spreadsheet_cell",
-                    source_text=text,
-                )
+def extract_blocks(xlsx_path: str, engine: str | None = None) -> dict:
+    """Extract text blocks with the configured engine.
 
-                # Assign a unique client_id for correction mode tracking
-                block["client_id"] = f"xlsx-{sheet_index}-{shape_id}"
+    ``openpyxl`` (default) loads the workbook and emits one block per
+    cell; ``stream`` (opt-in, see ``extract_stream``) iterparses the sheet
+    XML and emits one block per distinct text. A workbook the stream
+    engine cannot read falls back to openpyxl.
+    """
+    engine = (engine or settings.xlsx_extract_engine).lower()
+    if engine == "stream":
+        from backend.services.xlsx.extract_stream import extract_blocks_stream
+
+        try:
+            return extract_blocks_stream(xlsx_path)
+        except Exception:
+            LOGGER.warning(
+                "Streaming XLSX extraction failed, using openpyxl", exc_info=True
+            )
+            if hasattr(xlsx_path, "seek"):
+                xlsx_path.seek(0)
+    return _extract_blocks_openpyxl(xlsx_path)
 
-                # Add Excel-specific metadata for reconstruction
-                block["sheet_name"] = sheet_name
-                block["cell_address"] = cell.coordinate
-                block["is_hidden"] = (
-                    is_sheet_hidden or is_row_hidden or is_col_hidden
-                )
 
-                blocks.append(block)
+def _extract_blocks_openpyxl(xlsx_path: str) -> dict:
+    """
+    Extract text blocks from an Excel file.
 
+    Returns standard block format compatible with the translation pipeline.
+    Runs in-process: a full openpyxl load parses every sheet, so worker
+    processes would each pay for the whole workbook (only the stream
+    engine reads sheets independently).
+    """
+    units = _sheet_units(xlsx_path)
+    sheet_count = len(units)
     return {
-        "blocks": blocks,
-        "sheet_count": len(wb.sheetnames),
+        "blocks": annotate_blocks([block for unit in units for block in unit]),
+        "sheet_count": sheet_count,
     }
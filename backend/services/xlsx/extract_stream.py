@@ -0,0 +1,236 @@
+"""Streaming XLSX extraction straight from the package zip.
+
+``openpyxl.load_workbook`` in full mode builds a cell object (with
+style) for every cell of every sheet before the first value can be
+read. This engine iterparses ``xl/sharedStrings.xml`` and the worksheet
+parts instead, keeping only the text cells. Sheet states and hidden
+columns come from a light pass over ``workbook.xml`` and the ``<cols>``
+header of each sheet; hidden rows are read off ``<row>`` while streaming.
+
+Cells are grouped by their text: each distinct string becomes one block
+that lists every cell it occurs in (``cells``: ``[sheet_name,
+cell_address]`` pairs), so a label repeated in 10k rows is translated
+once. ``sheet_name``/``cell_address`` of a block are its first
+occurrence. Only string cells (shared, inline and formula results) are
+read; numbers, dates and booleans are never translated.
+"""
+
+from __future__ import annotations
+
+import re
+import zipfile
+
+from lxml import etree
+
+from backend.contracts import make_block
+from backend.services.block_analysis import annotate_blocks
+from backend.services.extract_utils import classify_blocks
+from backend.services.parallel_extract import run_units
+from backend.services.pptx.extract_stream import _Package
+
+_NS_S = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_SI = f"{{{_NS_S}}}si"
+_T = f"{{{_NS_S}}}t"
+_R = f"{{{_NS_S}}}r"
+_IS = f"{{{_NS_S}}}is"
+_V = f"{{{_NS_S}}}v"
+_ROW = f"{{{_NS_S}}}row"
+_CELL = f"{{{_NS_S}}}c"
+_COL = f"{{{_NS_S}}}col"
+_SHEET = f"{{{_NS_S}}}sheet"
+_SHEET_DATA = f"{{{_NS_S}}}sheetData"
+_R_ID = f"{{{_NS_R}}}id"
+
+_WORKBOOK_PART = "xl/workbook.xml"
+_TRUE = ("1", "true")
+_CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+# Uploaded XML is untrusted: no entity expansion, no network access.
+_SAFE = {"resolve_entities": False, "no_network": True, "huge_tree": True}
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _rich_text(elem: etree._Element) -> str:
+    """Text of an ``<si>`` or ``<is>``; phonetic runs are skipped."""
+    plain = elem.find(_T)
+    if plain is not None:
+        return plain.text or ""
+    return "".join(run.findtext(_T) or "" for run in elem.iterfind(_R))
+
+
+def _clear(elem: etree._Element) -> None:
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+class _Workbook:
+    """Sheet list and shared strings of an XLSX package."""
+
+    def __init__(self, archive: zipfile.ZipFile):
+        self._zip = archive
+        self._package = _Package(archive)
+        # (name, worksheet part or None for chartsheets, hidden)
+        self.sheets: list[tuple[str, str | None, bool]] = []
+        root = self._package.xml(_WORKBOOK_PART)
+        rels = self._package.rels(_WORKBOOK_PART)
+        for sheet in root.iter(_SHEET):
+            rel_type, part = rels.get(sheet.get(_R_ID, ""), ("", None))
+            self.sheets.append(
+                (
+                    sheet.get("name", ""),
+                    part if rel_type == "worksheet" else None,
+                    sheet.get("state", "visible") != "visible",
+                )
+            )
+        self._shared_part = self._package.related(_WORKBOOK_PART, "sharedStrings")
+        self._shared: list[str] | None = None
+
+    @property
+    def shared_strings(self) -> list[str]:
+        if self._shared is None:
+            self._shared = []
+            if self._shared_part in self._zip.namelist():
+                with self._zip.open(self._shared_part) as handle:
+                    for _, si in etree.iterparse(handle, tag=_SI, **_SAFE):
+                        self._shared.append(_rich_text(si))
+                        _clear(si)
+        return self._shared
+
+    def hidden_columns(self, part: str) -> set[str]:
+        """Letters of hidden columns; stops reading at ``<sheetData>``."""
+        hidden: set[str] = set()
+        with self._zip.open(part) as handle:
+            for event, elem in etree.iterparse(
+                handle, events=("start", "end"), tag=(_COL, _SHEET_DATA), **_SAFE
+            ):
+                if elem.tag == _SHEET_DATA:
+                    break
+                if event == "end" and elem.get("hidden") in _TRUE:
+                    first, last = int(elem.get("min", 0)), int(elem.get("max", 0))
+                    hidden.update(_column_letter(i) for i in range(first, last + 1))
+        return hidden
+
+    def _cell_text(self, cell: etree._Element) -> str | None:
+        cell_type = cell.get("t")
+        if cell_type == "s":
+            value = cell.findtext(_V)
+            if value is None:
+                return None
+            return self.shared_strings[int(value)]
+        if cell_type == "inlineStr":
+            inline = cell.find(_IS)
+            return _rich_text(inline) if inline is not None else None
+        if cell_type == "str":
+            return cell.findtext(_V)
+        return None
+
+    def sheet_groups(self, index: int) -> list[dict]:
+        """Distinct texts of one sheet with the cells they occur in."""
+        name, part, sheet_hidden = self.sheets[index]
+        if part is None:
+            return []
+        hidden_columns = self.hidden_columns(part)
+        groups: dict[str, dict] = {}
+        row_hidden = False
+        row_number = 0
+        column = 0
+        with self._zip.open(part) as handle:
+            for event, elem in etree.iterparse(
+                handle, events=("start", "end"), tag=(_ROW, _CELL), **_SAFE
+            ):
+                if elem.tag == _ROW:
+                    if event == "start":
+                        row_hidden = elem.get("hidden") in _TRUE
+                        row_number = int(elem.get("r", row_number + 1))
+                        column = 0
+                    else:
+                        _clear(elem)
+                    continue
+                if event == "start":
+                    continue
+                column += 1
+                match = _CELL_REF_RE.fullmatch(elem.get("r", ""))
+                if match:
+                    letter, address = match.group(1), match.group(0)
+                else:
+                    letter = _column_letter(column)
+                    address = f"{letter}{row_number}"
+                text = (self._cell_text(elem) or "").strip()
+                if not text:
+                    continue
+                hidden = sheet_hidden or row_hidden or letter in hidden_columns
+                group = groups.get(text)
+                if group is None:
+                    groups[text] = {
+                        "source_text": text,
+                        "cells": [[name, address]],
+                        "is_hidden": hidden,
+                    }
+                else:
+                    group["cells"].append([name, address])
+                    group["is_hidden"] = group["is_hidden"] and hidden
+        return list(groups.values())
+
+
+def extract_sheet_groups(xlsx_path: str, indices: list[int]) -> list[list[dict]]:
+    """Grouped text cells of the sheets at ``indices``."""
+    with zipfile.ZipFile(xlsx_path) as archive:
+        workbook = _Workbook(archive)
+        return [workbook.sheet_groups(index) for index in indices]
+
+
+def _merge_groups(units: list[list[dict]]) -> list[tuple[int, dict]]:
+    """(first sheet index, group) per distinct text across all sheets."""
+    merged: dict[str, tuple[int, dict]] = {}
+    for sheet_index, groups in enumerate(units):
+        for group in groups:
+            found = merged.get(group["source_text"])
+            if found is None:
+                merged[group["source_text"]] = (sheet_index, group)
+                continue
+            first = found[1]
+            first["cells"].extend(group["cells"])
+            first["is_hidden"] = first["is_hidden"] and group["is_hidden"]
+    return list(merged.values())
+
+
+def extract_blocks_stream(xlsx_path) -> dict:
+    """Extract one block per distinct cell text without loading the workbook.
+
+    ``xlsx_path`` may be a path or a binary file object. Sheets of large
+    workbooks are read in parallel (see ``parallel_extract``).
+    """
+    with zipfile.ZipFile(xlsx_path) as archive:
+        sheet_count = len(_Workbook(archive).sheets)
+    units = run_units(extract_sheet_groups, xlsx_path, sheet_count)
+    groups = _merge_groups(units)
+    reasons = classify_blocks(group["source_text"] for _, group in groups)
+
+    blocks: list[dict] = []
+    shape_ids: dict[int, int] = {}
+    for (sheet_index, group), reason in zip(groups, reasons, strict=True):
+        if reason:
+            continue
+        shape_id = shape_ids[sheet_index] = shape_ids.get(sheet_index, 0) + 1
+        block = make_block(
+            slide_index=sheet_index,
+            shape_id=shape_id,
+            block_type="spreadsheet_cell",
+            source_text=group["source_text"],
+        )
+        block["client_id"] = f"xlsx-{sheet_index}-{shape_id}"
+        block["sheet_name"], block["cell_address"] = group["cells"][0]
+        block["is_hidden"] = group["is_hidden"]
+        block["cells"] = group["cells"]
+        blocks.append(block)
+
+    return {"blocks": annotate_blocks(blocks), "sheet_count": sheet_count}
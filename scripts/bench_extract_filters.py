@@ -0,0 +1,109 @@
+"""Benchmark the extraction filters on a synthetic 200k-cell workbook.
+
+Compares the per-cell filter chain (is_numeric_only / is_technical_terms_only
+/ is_garbage_text) with the batch classify_blocks, and optionally times the
+full XLSX extraction.
+
+Usage:
+    python scripts/bench_extract_filters.py [--cells 200000] [--workbook]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.services.extract_utils import (  # noqa: E402
+    classify_blocks,
+    is_garbage_text,
+    is_numeric_only,
+    is_technical_terms_only,
+)
+
+# Values typical of finance workbooks: numbers, dates, codes, repeated
+# labels and some free text.
+_SAMPLES = (
+    "Revenue",
+    "營業收入",
+    "Cost of goods sold",
+    "銷貨成本",
+    "Q1 2024",
+    "FY2023",
+    "USD",
+    "N/A",
+    "ACC-10023",
+    "Operating expenses for the northern region",
+    "本季營運費用較去年同期增加",
+    "Chi phí hoạt động",
+    "3f2a9c1e-4b7d-4e0a-9b1c-2d3e4f5a6b7c",
+)
+
+
+def build_cells(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    cells = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.55:
+            cells.append(f"{rng.uniform(-1e6, 1e6):,.2f}")
+        elif roll < 0.65:
+            cells.append(f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+        else:
+            cells.append(rng.choice(_SAMPLES))
+    return cells
+
+
+def _per_cell(cells: list[str]) -> list[bool]:
+    return [
+        is_numeric_only(text) or is_technical_terms_only(text) or is_garbage_text(text)
+        for text in cells
+    ]
+
+
+def _timed(label: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:<28}{time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def bench_workbook(cells: list[str]) -> None:
+    import openpyxl
+
+    from backend.services.xlsx.extract import extract_blocks
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    width = 20
+    for offset in range(0, len(cells), width):
+        ws.append(cells[offset : offset + width])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "bench.xlsx"
+        wb.save(path)
+        result = _timed("extract_blocks (xlsx)", extract_blocks, str(path))
+    print(f"translatable blocks: {len(result['blocks'])}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, default=200_000)
+    parser.add_argument("--workbook", action="store_true", help="also time extract_blocks")
+    args = parser.parse_args()
+
+    cells = build_cells(args.cells)
+    print(f"cells: {len(cells)}, distinct: {len(set(cells))}")
+    legacy = _timed("per-cell filter chain", _per_cell, cells)
+    batch = _timed("classify_blocks", classify_blocks, cells)
+    assert legacy == [reason is not None for reason in batch], "filter results differ"
+    if args.workbook:
+        bench_workbook(cells)
+
+
+if __name__ == "__main__":
+    main()
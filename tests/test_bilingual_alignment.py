@@ -0,0 +1,61 @@
+from backend.contracts import make_block
+from backend.services import translate_llm
+from backend.services.bilingual_alignment import align_bilingual_blocks
+
+def _block(text: str, slide: int = 0, **box) -> dict:
+    return {"source_text": text, "slide_index": slide, **box}
+
+
+def test_pairs_source_followed_by_target() -> None:
+    blocks = [_block("a"), _block("b"), _block("c"), _block("d"), _block("e")]
+    languages = ["vi", "zh-TW", "en", "vi", "zh-TW"]
+    result = align_bilingual_blocks(blocks, "vi", "zh-TW", languages=languages)
+    assert [b.get("alignment_role") for b in result] == [
+        "source",
+        "target",
+        None,
+        "source",
+        "target",
+    ]
+    assert [b.get("alignment_pair_id") for b in result] == ["p0", "p0", None, "p3", "p3"]
+    assert result[1]["alignment_source"] == "a"
+    # Inputs are not modified.
+    assert "alignment_role" not in blocks[0]
+
+
+def test_within_slide_respects_slides_and_geometry() -> None:
+    languages = ["vi", "zh-TW"]
+    across = [_block("a", slide=0), _block("b", slide=1)]
+    assert "alignment_role" not in align_bilingual_blocks(
+        across, "vi", "zh-TW", languages=languages, within_slide=True
+    )[0]
+    assert align_bilingual_blocks(
+        across, "vi", "zh-TW", languages=languages, within_slide=False
+    )[0]["alignment_role"] == "source"
+
+    box = {"width": 100.0, "height": 20.0}
+    stacked = [_block("a", x=10.0, y=0.0, **box), _block("b", x=30.0, y=40.0, **box)]
+    paired = align_bilingual_blocks(
+        stacked, "vi", "zh-TW", languages=languages, within_slide=True
+    )
+    assert paired[0]["alignment_role"] == "source"
+    diagonal = [_block("a", x=0.0, y=0.0, **box), _block("b", x=300.0, y=200.0, **box)]
+    assert "alignment_role" not in align_bilingual_blocks(
+        diagonal, "vi", "zh-TW", languages=languages, within_slide=True
+    )[0]
+
+
+def test_docx_paragraph_pairs_align_with_region_check_off() -> None:
+    # DOCX blocks store the paragraph index in slide_index.
+    blocks = [
+        make_block(i, i, "textbox", text, x=0, y=0, width=500, height=20)
+        for i, text in enumerate(["Xin chào", "你好"])
+    ]
+    within_slide = translate_llm._align_within_slide({"align_within_slide": False})
+    result = align_bilingual_blocks(
+        blocks, "vi", "zh-TW", languages=["vi", "zh-TW"], within_slide=within_slide
+    )
+    assert [b.get("alignment_role") for b in result] == ["source", "target"]
+    assert translate_llm._align_within_slide({"refresh": True}) is (
+        translate_llm.settings.llm_align_within_slide
+    )
@@ -0,0 +1,65 @@
+import openpyxl
+from docx import Document
+
+from backend.contracts import make_block
+from backend.services.docx.apply import apply_bilingual as apply_docx_bilingual
+from backend.services.xlsx.apply import apply_bilingual as apply_xlsx_bilingual
+
+def _block(slide_index, shape_id, block_type, source, translated, **extra):
+    block = make_block(slide_index, shape_id, block_type, source, translated)
+    block.update(extra)
+    return block
+
+
+def test_docx_bilingual_does_not_repeat_pass_through_blocks(tmp_path):
+    source = tmp_path / "in.docx"
+    out = tmp_path / "out.docx"
+    doc = Document()
+    doc.add_paragraph("Xin chào")
+    doc.add_paragraph("營收報告")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Doanh thu"
+    table.cell(0, 1).text = "利潤"
+    doc.save(source)
+
+    blocks = [
+        _block(0, 0, "textbox", "Xin chào", "你好"),
+        _block(1, 1, "textbox", "營收報告", "營收報告", pass_through=True),
+        _block(0, 0, "table_cell", "Doanh thu", "營收"),
+        _block(0, 1, "table_cell", "利潤", "利潤"),
+    ]
+    apply_docx_bilingual(str(source), str(out), blocks)
+
+    result = Document(out)
+    assert result.paragraphs[0].text == "Xin chào\n你好"
+    assert result.paragraphs[1].text == "營收報告"
+    cells = result.tables[0].rows[0].cells
+    assert cells[0].text == "Doanh thu\n營收"
+    assert cells[1].text == "利潤"
+
+
+def test_xlsx_bilingual_does_not_repeat_pass_through_blocks(tmp_path):
+    source = tmp_path / "in.xlsx"
+    out = tmp_path / "out.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Sheet"
+    ws["A1"] = "Doanh thu"
+    ws["A2"] = "營收報告"
+    wb.save(source)
+
+    blocks = [
+        _block(
+            0, 1, "spreadsheet_cell", "Doanh thu", "營收",
+            sheet_name="Sheet", cell_address="A1",
+        ),
+        _block(
+            0, 2, "spreadsheet_cell", "營收報告", "營收報告",
+            sheet_name="Sheet", cell_address="A2", pass_through=True,
+        ),
+    ]
+    apply_xlsx_bilingual(str(source), str(out), blocks)
+
+    result = openpyxl.load_workbook(out)["Sheet"]
+    assert result["A1"].value == "Doanh thu\n營收"
+    assert result["A2"].value == "營收報告"
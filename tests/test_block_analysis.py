@@ -0,0 +1,52 @@
+from backend.services import block_analysis
+from backend.services.bilingual_alignment import align_bilingual_blocks
+from backend.services.block_analysis import (
+    annotate_blocks,
+    block_analyses,
+    block_languages,
+    clear_analysis_cache,
+)
+from backend.services.language_detect import detect_document_languages
+
+def _count_detections(monkeypatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+    original = block_analysis.detect_languages
+
+    def counting(texts):
+        texts = list(texts)
+        calls.append(texts)
+        return original(texts)
+
+    monkeypatch.setattr(block_analysis, "detect_languages", counting)
+    return calls
+
+
+def test_annotate_blocks_stores_analysis_once(monkeypatch) -> None:
+    clear_analysis_cache()
+    calls = _count_detections(monkeypatch)
+    blocks = [
+        {"source_text": "  Quarterly   revenue report "},
+        {"source_text": "Xin chào Việt Nam\n營收報告"},
+        {"source_text": "2024-01-01"},
+    ]
+    annotate_blocks(blocks)
+    assert all("analysis" not in block for block in blocks)
+    assert len(calls) == 1
+
+    analysis = block_analyses(blocks)[1]
+    assert analysis["language"] == "vi"
+    assert analysis["line_languages"] == ["vi", "zh-TW"]
+    assert analysis["scripts"]["han"] == 4
+
+    # Downstream consumers reuse the stored analysis.
+    detect_document_languages(blocks)
+    align_bilingual_blocks(blocks, "vi", "zh-TW")
+    assert block_languages(blocks) == ["en", "vi", None]
+    assert len(calls) == 1
+
+
+def test_edited_block_is_analysed_again() -> None:
+    blocks = annotate_blocks([{"source_text": "Hello world"}])
+    assert block_languages(blocks) == ["en"]
+    blocks[0]["source_text"] = "營收成長報告"
+    assert block_languages(blocks) == ["zh-TW"]
@@ -1,4 +1,14 @@
-from backend.services.correction_mode import apply_correction_mode, prepare_blocks_for_correction
+import random
+from difflib import SequenceMatcher
+
+from backend.services.correction_mode import (
+    _is_similar_text,
+    _normalize_text,
+    _PendingIndex,
+    apply_correction_mode,
+    prepare_blocks_for_correction,
+)
+from backend.services.language_detect import _CJK_RE, _VI_DIACRITIC_RE
 
 def test_prepare_blocks_for_correction_skips_target_language():
     blocks = [
@@ -34,3 +44,46 @@ def test_apply_correction_mode_keeps_temp_when_not_similar():
     assert result[0]["temp_translated_text"] == "你好"
     assert result[0]["translated_text"] == ""
     assert result[1]["translated_text"] == ""
+
+
+def _reference_best_match(pending, source_text, threshold):
+    """The pairwise scan apply_correction_mode used before indexing."""
+    match_index, match_score = None, 0.0
+    for index, (_, candidate_text) in enumerate(pending):
+        if _is_similar_text(source_text, candidate_text, threshold):
+            score = SequenceMatcher(
+                None, _normalize_text(source_text), _normalize_text(candidate_text)
+            ).ratio()
+        elif _VI_DIACRITIC_RE.search(source_text):
+            src_cjk = "".join(_CJK_RE.findall(source_text))
+            cand_cjk = "".join(_CJK_RE.findall(candidate_text))
+            if not (src_cjk and cand_cjk and _is_similar_text(src_cjk, cand_cjk, threshold)):
+                continue
+            score = SequenceMatcher(None, src_cjk, cand_cjk).ratio()
+        else:
+            continue
+        if score > match_score:
+            match_index, match_score = index, score
+    return match_index
+
+
+def test_pending_index_picks_same_match_as_pairwise_scan():
+    rng = random.Random(3)
+    alphabet = "營收成長報告季度 ab"
+    for threshold in (0.5, 0.75, 0.9):
+        index = _PendingIndex(threshold)
+        pending = []
+        for step in range(400):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+            if rng.random() < 0.5:
+                index.add(step, text)
+                pending.append((index._next_id - 1, text))
+                continue
+            if rng.random() < 0.3:
+                text = "Việt Nam " + text
+            expected = _reference_best_match(pending, text, threshold)
+            match = index.best_match(text)
+            assert match == (None if expected is None else pending[expected][0])
+            if match is not None:
+                index.pop(match)
+                pending.pop(expected)
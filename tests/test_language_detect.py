@@ -1,4 +1,9 @@
-from backend.services.language_detect import detect_language, resolve_source_language
+from backend.services import language_detect
+from backend.services.language_detect import (
+    detect_language,
+    detect_languages,
+    resolve_source_language,
+)
 
 def test_resolve_source_language_prefers_explicit() -> None:
     blocks = [{"source_text": "Hello"}]
@@ -27,3 +32,44 @@ def test_detect_language_vietnamese_needs_multiple_diacritics() -> None:
     # Xin chào 有 2 個越南語特徵（à, o hook）
     result = detect_language("Xin chào Việt Nam")
     assert result == "vi", f"Expected 'vi', got: {result}"
+
+
+def test_detect_languages_batch_uses_script_histogram(monkeypatch) -> None:
+    calls = []
+
+    def fake_detect(text):
+        calls.append(text)
+        return "fr"
+
+    monkeypatch.setattr(language_detect, "detect", fake_detect)
+    language_detect.clear_language_cache()
+
+    texts = [
+        "這是一段中文",
+        "これは日本語です",
+        "한국어 문장입니다",
+        "ภาษาไทย",
+        "Xin chào Việt Nam",
+        "Quarterly report",
+        "12/03 - 45%",
+        "Bonjour à tous les amis",
+        "這是一段中文",
+    ]
+    assert detect_languages(texts) == [
+        "zh-TW", "ja", "ko", "th", "vi", "en", None, "fr", "zh-TW",
+    ]
+    # Only the ambiguous Latin-script text reaches the statistical model.
+    assert calls == ["Bonjour à tous les amis"]
+
+    assert detect_language("Bonjour à tous les amis") == "fr"
+    assert len(calls) == 1
+    language_detect.clear_language_cache()
+
+
+def test_language_cache_is_bounded_in_bytes() -> None:
+    cache = language_detect._ByteBoundedCache(max_bytes=1000)
+    for i in range(50):
+        cache.put(f"text {i}", "en")
+    assert cache.bytes <= 1000
+    assert cache.get("text 49") == (True, "en")
+    assert cache.get("text 0") == (False, None)
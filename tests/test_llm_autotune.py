@@ -0,0 +1,154 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.services import llm_autotune, translate_llm
+from backend.services.llm_autotune import (
+    ChunkAutotuner,
+    ModelProfile,
+    iter_adaptive_chunks,
+    load_autotuner,
+)
+
+@pytest.fixture
+def tune_file(tmp_path, monkeypatch):
+    path = tmp_path / "llm_autotune.json"
+    monkeypatch.setattr(llm_autotune, "TUNE_FILE", path)
+    return path
+
+
+def _blocks(count: int) -> list[dict]:
+    return [{"source_text": "hello world"} for _ in range(count)]
+
+
+def _timeout_error() -> ValueError:
+    request = httpx.Request("POST", "http://ollama/api/chat")
+    try:
+        raise httpx.ReadTimeout("timed out", request=request)
+    except httpx.ReadTimeout as exc:
+        try:
+            raise ValueError("無法連線至 Ollama") from exc
+        except ValueError as wrapped:
+            return wrapped
+
+
+def test_chunk_size_grows_under_ceiling_and_halves_on_timeout() -> None:
+    tuner = ChunkAutotuner("ollama", "qwen", ModelProfile(10, 1), timeout=100)
+
+    tuner.record(_blocks(10), 5.0)  # 0.5 s/block -> ceiling 50 s allows 100
+    assert tuner.chunk_size == 15
+    tuner.record(_blocks(15), 7.5)
+    assert tuner.chunk_size == 23
+
+    tuner.record(_blocks(23), 100.0, _timeout_error())
+    assert tuner.chunk_size == 11
+    assert tuner.profile.timeout_rate > 0
+
+
+def test_chunk_size_is_capped_by_timeout_risk() -> None:
+    tuner = ChunkAutotuner("ollama", "qwen", ModelProfile(40, 1), timeout=60)
+    tuner.record(_blocks(40), 80.0)  # 2 s/block -> 30 s ceiling fits 15
+    assert tuner.chunk_size == 15
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_concurrency_hill_climbs_on_throughput() -> None:
+    clock = _Clock()
+    tuner = ChunkAutotuner(
+        "openai", "gpt", ModelProfile(5, 1), timeout=100, clock=clock
+    )
+    for _ in range(3):
+        clock.now += 1.0
+        tuner.record(_blocks(5), 1.0)
+    assert tuner.concurrency == 2  # 15 blocks in 3 s
+
+    # Two chunks in flight, but each takes twice as long: no gain, step back.
+    for finished in (2.0, 2.0, 4.0):
+        clock.now = 3.0 + finished
+        tuner.record(_blocks(5), 2.0)
+    assert tuner.concurrency == 1
+
+
+def test_concurrency_keeps_climbing_when_wall_clock_throughput_grows() -> None:
+    clock = _Clock()
+    tuner = ChunkAutotuner(
+        "openai", "gpt", ModelProfile(5, 1), timeout=100, clock=clock
+    )
+    for _ in range(3):
+        clock.now += 1.0
+        tuner.record(_blocks(5), 1.0)
+
+    # Two chunks overlap: 15 blocks in 2 s beats 15 blocks in 3 s.
+    for finished in (1.0, 1.0, 2.0):
+        clock.now = 3.0 + finished
+        tuner.record(_blocks(5), 1.0)
+    assert tuner.concurrency == 3
+
+
+def test_sequential_chunks_do_not_raise_concurrency() -> None:
+    clock = _Clock()
+    tuner = ChunkAutotuner(
+        "openai", "gpt", ModelProfile(5, 1), timeout=100, clock=clock
+    )
+    for _ in range(40):
+        clock.now += 1.0
+        tuner.record(_blocks(5), 1.0)
+    assert tuner.concurrency == 1
+
+
+def test_profile_persists_between_runs(tune_file) -> None:
+    tuner = load_autotuner("ollama", "qwen", 40, 2)
+    tuner.record(_blocks(40), 80.0, _timeout_error())
+    tuner.save()
+
+    reloaded = load_autotuner("ollama", "qwen", 40, 2)
+    assert reloaded.chunk_size == 20
+    assert reloaded.concurrency == 1
+    assert load_autotuner("ollama", "other", 40, 2).chunk_size == 40
+
+
+def test_adaptive_chunks_follow_tuned_size() -> None:
+    tuner = ChunkAutotuner("ollama", "qwen", ModelProfile(2, 1), timeout=100)
+    chunks = iter_adaptive_chunks(list(range(7)), tuner)
+    assert next(chunks) == [0, 1]
+    tuner.profile.chunk_size = 4
+    assert list(chunks) == [[2, 3, 4, 5], [6]]
+
+
+@pytest.mark.asyncio
+async def test_slot_limits_in_flight_chunks() -> None:
+    tuner = ChunkAutotuner("openai", "gpt", ModelProfile(5, 2), timeout=100)
+    active = peak = 0
+
+    async def work():
+        nonlocal active, peak
+        async with tuner.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+
+
+def test_prepare_params_attaches_tuner(tune_file, monkeypatch) -> None:
+    monkeypatch.setattr(translate_llm.settings, "llm_autotune_enabled", True)
+    params = translate_llm._prepare_params(
+        "openai", {"single_request": False}, "gpt-4o-mini", None, True
+    )
+    assert params["autotune"].model == "gpt-4o-mini"
+    assert params["chunk_size"] == params["autotune"].chunk_size
+
+    fixed = translate_llm._prepare_params(
+        "openai", {"single_request": False, "chunk_size": 1}, "gpt", None, True
+    )
+    assert "autotune" not in fixed
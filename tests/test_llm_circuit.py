@@ -0,0 +1,100 @@
+import httpx
+import pytest
+
+from backend.services import llm_circuit
+from backend.services.llm_circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    is_endpoint_failure,
+)
+from backend.services.translate_chunk_dispatch import dispatch_translate
+
+def _connect_error() -> Exception:
+    request = httpx.Request("POST", "http://ollama:11434/api/generate")
+    try:
+        raise httpx.ConnectError("refused", request=request)
+    except httpx.ConnectError as exc:
+        try:
+            raise ValueError("無法連線至 Ollama") from exc
+        except ValueError as wrapped:
+            return wrapped
+
+
+def test_is_endpoint_failure_walks_cause_chain() -> None:
+    assert is_endpoint_failure(_connect_error())
+    assert not is_endpoint_failure(ValueError("bad json"))
+
+
+def test_breaker_opens_then_half_opens(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(llm_circuit.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("ollama", "http://ollama", 2, reset_timeout=10)
+
+    breaker.record_failure(ValueError("bad output"))
+    assert breaker.state == CLOSED
+
+    breaker.record_failure(_connect_error())
+    breaker.record_failure(_connect_error())
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    now[0] += 10
+    assert breaker.state == HALF_OPEN
+    breaker.before_request()
+    # Only one probe is allowed while half-open.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_failure(_connect_error())
+    assert breaker.state == OPEN
+
+    now[0] += 10
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+class _DownTranslator:
+    base_url = "http://circuit-test:11434"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def translate(self, *args, **kwargs):
+        self.calls += 1
+        raise _connect_error()
+
+
+def test_dispatch_fails_fast_when_circuit_open(monkeypatch) -> None:
+    monkeypatch.setattr(llm_circuit.settings, "llm_circuit_failure_threshold", 2)
+    llm_circuit.reset_circuits()
+    translator = _DownTranslator()
+    args = ([{"source_text": "x"}], "en", None, [], [], None, True)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="無法連線"):
+            dispatch_translate(translator, "openai", *args)
+    with pytest.raises(CircuitOpenError):
+        dispatch_translate(translator, "openai", *args)
+
+    assert translator.calls == 2
+    states = llm_circuit.get_circuit_states()
+    assert states[0]["state"] == OPEN
+    assert states[0]["base_url"] == "http://circuit-test:11434"
+    llm_circuit.reset_circuits()
+
+
+def test_multi_host_ollama_pool_has_no_breaker() -> None:
+    llm_circuit.reset_circuits()
+    pool = _DownTranslator()
+    pool.base_url = "http://gpu1:11434,http://gpu2:11434"
+
+    # The pool's own host health decides instead.
+    assert llm_circuit.breaker_for("ollama", pool) is None
+    assert llm_circuit.breaker_for("ollama", _DownTranslator()) is not None
+    assert llm_circuit.breaker_for("openai", pool) is not None
+    llm_circuit.reset_circuits()
@@ -0,0 +1,52 @@
+from backend.services.llm_context import DocumentContextIndex, build_context
+
+def _deck(slides: int, per_slide: int = 3) -> list[dict]:
+    return [
+        {
+            "slide_index": slide,
+            "shape_id": shape,
+            "source_text": f"Slide {slide} text {shape}",
+            "x": 0,
+            "y": 0,
+        }
+        for slide in range(slides)
+        for shape in range(per_slide)
+    ]
+
+
+def test_neighbor_context_uses_titles_and_summaries() -> None:
+    blocks = _deck(5)
+    context = build_context("neighbor", blocks, [blocks[6]])
+
+    assert context["current_slides"] == [2]
+    assert context["total_slides"] == 5
+    assert [entry["slide"] for entry in context["context_slides"]] == [1, 2, 3]
+    entry = context["context_slides"][1]
+    assert entry["title"] == "Slide 2 text 0"
+    assert entry["summary"] == "Slide 2 text 0 / Slide 2 text 1 / Slide 2 text 2"
+
+
+def test_context_index_memoizes_per_slide_set() -> None:
+    blocks = _deck(4)
+    index = DocumentContextIndex(blocks)
+    first = build_context("title-only", blocks, [blocks[0], blocks[3]], index=index)
+    second = build_context("title-only", blocks, [blocks[4], blocks[1]], index=index)
+
+    assert first is second
+    assert first["context_slides"] == [
+        {"slide": 0, "title": "Slide 0 text 0"},
+        {"slide": 1, "title": "Slide 1 text 0"},
+    ]
+
+
+def test_context_is_token_capped_keeping_current_slide() -> None:
+    blocks = _deck(3, per_slide=40)
+    index = DocumentContextIndex(blocks, max_tokens=80)
+    context = index.build("neighbor", [1])
+
+    assert [entry["slide"] for entry in context["context_slides"]] == [1]
+    assert len(context["context_slides"][0]["summary"]) <= 240
+
+
+def test_none_strategy_returns_none() -> None:
+    assert build_context("none", _deck(1), _deck(1)) is None
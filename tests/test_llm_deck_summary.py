@@ -0,0 +1,106 @@
+import json
+
+from backend.services import llm_deck_summary
+from backend.services.llm_context import build_context
+from backend.services.llm_deck_summary import (
+    clear_deck_summary_cache,
+    extract_deck_summary,
+    get_deck_summary,
+)
+
+TEXTS = {
+    0: ["Kubernetes Migration Plan", "Platform team, Q3"],
+    1: ["Why Kubernetes", "Cluster costs are rising"],
+    2: ["Rollout", "Migrate each cluster to Kubernetes"],
+}
+
+
+class _SummaryClient:
+    def __init__(self, response: str) -> None:
+        self.response = response
+        self.calls = 0
+
+    def complete(self, prompt: str) -> str:
+        self.calls += 1
+        return self.response
+
+
+def test_extractive_summary_has_topic_and_recurring_terms() -> None:
+    summary = extract_deck_summary(TEXTS)
+    assert summary["topic"] == "Kubernetes Migration Plan"
+    assert summary["key_terms"][:2] == ["Kubernetes", "Cluster"]
+    assert "Rollout" not in summary["key_terms"]
+
+
+def test_llm_summary_is_cached_by_content_hash() -> None:
+    clear_deck_summary_cache()
+    client = _SummaryClient(
+        json.dumps(
+            {"topic": "K8s migration", "audience": "Engineers", "key_terms": ["pod"]}
+        )
+    )
+    first = get_deck_summary(TEXTS, client=client, method="llm")
+    second = get_deck_summary(dict(TEXTS), client=client, method="llm")
+
+    assert first == {
+        "topic": "K8s migration",
+        "audience": "Engineers",
+        "key_terms": ["pod"],
+    }
+    assert second is first
+    assert client.calls == 1
+    clear_deck_summary_cache()
+
+
+def test_llm_failure_falls_back_to_extractive_without_caching() -> None:
+    clear_deck_summary_cache()
+    client = _SummaryClient("not json")
+    summary = get_deck_summary(TEXTS, client=client, method="llm")
+    get_deck_summary(TEXTS, client=client, method="llm")
+
+    assert summary["topic"] == "Kubernetes Migration Plan"
+    assert client.calls == 2
+    clear_deck_summary_cache()
+
+
+def test_summary_is_capped_and_shared_by_every_chunk(monkeypatch) -> None:
+    clear_deck_summary_cache()
+    monkeypatch.setattr(llm_deck_summary.settings, "llm_context_summary_tokens", 12)
+    blocks = [
+        {"slide_index": slide, "source_text": text}
+        for slide, texts in TEXTS.items()
+        for text in texts
+    ]
+    first = build_context("summary", blocks, blocks[:2])
+    last = build_context("summary", blocks, blocks[-2:])
+
+    assert first["deck_summary"] == last["deck_summary"]
+    assert "key_terms" not in first["deck_summary"]
+    assert last["current_slides"] == [2]
+    clear_deck_summary_cache()
+
+
+def test_cjk_key_terms_are_recurring_words() -> None:
+    summary = extract_deck_summary(
+        {
+            0: ["雲端遷移計畫", "平台團隊的目標"],
+            1: ["為何選擇雲端遷移", "叢集成本上升"],
+            2: ["雲端遷移步驟", "每個叢集逐步遷移"],
+        }
+    )
+    assert summary["key_terms"] == ["雲端遷移", "叢集"]
+
+
+def test_llm_summary_cache_is_per_provider_and_model() -> None:
+    clear_deck_summary_cache()
+    response = json.dumps({"topic": "K8s migration", "key_terms": []})
+    first = _SummaryClient(response)
+    second = _SummaryClient(response)
+
+    get_deck_summary(TEXTS, client=first, method="llm", provider="ollama", model="a")
+    get_deck_summary(TEXTS, client=second, method="llm", provider="ollama", model="b")
+    get_deck_summary(TEXTS, client=second, method="llm", provider="openai", model="b")
+    get_deck_summary(TEXTS, client=first, method="llm", provider="ollama", model="a")
+
+    assert (first.calls, second.calls) == (1, 2)
+    clear_deck_summary_cache()
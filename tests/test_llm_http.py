@@ -0,0 +1,55 @@
+import httpx
+import pytest
+
+from backend.services import llm_client_ollama, llm_http
+from backend.services.llm_client_ollama import OllamaTranslator
+
+def test_sync_client_shared_per_provider_host() -> None:
+    first = llm_http.get_sync_client("openai", "https://api.example.com/v1")
+    second = llm_http.get_sync_client("openai", "https://API.example.com/v2/")
+    other_provider = llm_http.get_sync_client("gemini", "https://api.example.com")
+    other_host = llm_http.get_sync_client("openai", "https://other.example.com")
+
+    assert first is second
+    assert first is not other_provider
+    assert first is not other_host
+
+
+@pytest.mark.asyncio
+async def test_async_client_shared_and_closed_on_shutdown() -> None:
+    first = llm_http.get_async_client("ollama", "http://localhost:11434")
+    second = llm_http.get_async_client("ollama", "http://localhost:11434/api")
+    assert first is second
+
+    await llm_http.close_http_clients()
+    assert first.is_closed
+
+    reopened = llm_http.get_async_client("ollama", "http://localhost:11434")
+    assert reopened is not first
+    await llm_http.close_http_clients()
+
+
+def test_ollama_translators_reuse_pooled_client(monkeypatch) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"response": "ok"})
+
+    pooled = httpx.Client(transport=httpx.MockTransport(handler))
+    lookups = []
+
+    def fake_get_sync_client(provider: str, base_url: str) -> httpx.Client:
+        lookups.append((provider, base_url))
+        return pooled
+
+    monkeypatch.setattr(llm_client_ollama, "get_sync_client", fake_get_sync_client)
+
+    for _ in range(2):
+        translator = OllamaTranslator("qwen", "http://localhost:11434")
+        assert translator.translate_plain("hello") == "ok"
+
+    assert len(requests) == 2
+    assert lookups == [("ollama", "http://localhost:11434")] * 2
+    assert not pooled.is_closed
+    pooled.close()
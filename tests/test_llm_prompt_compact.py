@@ -0,0 +1,105 @@
+import json
+
+from backend.services import token_tracker
+from backend.services.llm_prompt import build_prompt, select_chunk_terms
+from backend.services.translate_partial import collect_valid_texts
+
+CONTRACT = {"blocks": [{"slide_index": 1, "shape_id": 1, "source_text": ""}]}
+
+
+def _payload(prompt: str) -> dict:
+    start = prompt.index('{"target_language"')
+    stable, chunk = prompt[start:].split("\n")
+    return {**json.loads(stable), **json.loads(chunk)}
+
+
+def _block(text: str, **extra) -> dict:
+    return {
+        "slide_index": 3,
+        "shape_id": 7,
+        "block_type": "textbox",
+        "source_text": text,
+        "client_id": "c-1",
+        "x": 10,
+        "y": 20,
+        "width": 300,
+        "height": 40,
+        **extra,
+    }
+
+
+def test_select_chunk_terms_keeps_only_terms_in_chunk() -> None:
+    terms = [("Cloud", "雲端"), ("cloud server", "雲端伺服器"), ("GPU", "圖形處理器")]
+    assert select_chunk_terms(terms, ["Deploy the Cloud Server now"]) == [
+        ("cloud server", "雲端伺服器")
+    ]
+    assert select_chunk_terms(terms, ["gpu and cloud"]) == [
+        ("Cloud", "雲端"),
+        ("GPU", "圖形處理器"),
+    ]
+
+
+def test_compact_prompt_sends_id_and_text_only(monkeypatch) -> None:
+    monkeypatch.setattr("backend.services.llm_prompt.COMPACTION_SAMPLE_EVERY", 1)
+    recorded = []
+    monkeypatch.setattr(
+        "backend.services.llm_prompt.record_prompt_compaction",
+        lambda full, compact: recorded.append((full, compact)),
+    )
+    terms = [(f"term{i}", f"詞{i}") for i in range(200)] + [("Revenue", "營收")]
+
+    prompt = build_prompt(
+        [_block("Revenue grew", alignment_source="營收成長")],
+        "zh-TW",
+        CONTRACT,
+        None,
+        preferred_terms=terms,
+        compact=True,
+    )
+
+    payload = _payload(prompt)
+    assert payload["blocks"] == [
+        {"id": 0, "text": "Revenue grew", "alignment_source": "營收成長"}
+    ]
+    assert payload["preferred_terms"] == [["Revenue", "營收"]]
+    assert "contract_schema_example" not in payload
+    full, compact = recorded[0]
+    assert compact < full / 2
+
+
+def test_compact_prompt_builds_full_payload_only_when_sampled(monkeypatch) -> None:
+    import itertools
+
+    from backend.services import llm_prompt
+
+    built = []
+    monkeypatch.setattr(llm_prompt, "_COMPACTION_COUNTER", itertools.count())
+    monkeypatch.setattr(llm_prompt, "COMPACTION_SAMPLE_EVERY", 3)
+    monkeypatch.setattr(
+        llm_prompt, "_full_payload", lambda *args: built.append(1) or "{}"
+    )
+    monkeypatch.setattr(llm_prompt, "record_prompt_compaction", lambda *args: None)
+
+    for _ in range(6):
+        build_prompt([_block("Revenue grew")], "zh-TW", CONTRACT, None, compact=True)
+
+    assert len(built) == 2
+
+
+def test_collect_valid_texts_matches_compact_ids() -> None:
+    blocks = [{"source_text": "a"}, {"source_text": "b"}]
+    result = {"blocks": [{"id": 1, "translated_text": "B"}]}
+    assert collect_valid_texts(result, blocks) == [None, "B"]
+
+
+def test_prompt_compaction_stats_report_savings(monkeypatch) -> None:
+    monkeypatch.setattr(
+        token_tracker,
+        "_COMPACTION_STATS",
+        {"requests": 0, "full_tokens": 0, "compact_tokens": 0},
+    )
+    token_tracker.record_prompt_compaction(400, 100)
+    stats = token_tracker.get_prompt_compaction_stats()
+    assert stats["requests"] == 1
+    assert stats["saved_tokens"] == 300
+    assert stats["saved_ratio"] == 0.75
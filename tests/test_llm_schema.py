@@ -0,0 +1,135 @@
+import json
+
+import httpx
+
+from backend.services import llm_client_gemini, llm_client_ollama, llm_schema
+from backend.services.llm_client_gemini import GeminiTranslator
+from backend.services.llm_client_ollama import OllamaTranslator
+from backend.services.llm_schema import (
+    build_translation_schema,
+    get_structured_output_stats,
+    load_structured_response,
+    parse_structured_blocks,
+    reset_structured_output_stats,
+    to_gemini_schema,
+)
+from backend.services.translate_chunk_dispatch import translate_ollama
+
+BLOCKS = [
+    {"slide_index": 0, "shape_id": 1, "block_type": "textbox", "source_text": "Hello"},
+    {"slide_index": 0, "shape_id": 2, "block_type": "textbox", "source_text": "World"},
+]
+
+
+def test_schema_pins_block_count_and_ids() -> None:
+    schema = build_translation_schema(3)
+    blocks = schema["properties"]["blocks"]
+    assert blocks["minItems"] == blocks["maxItems"] == 3
+    assert blocks["items"]["properties"]["id"]["maximum"] == 2
+
+    gemini = to_gemini_schema(schema)
+    assert gemini["type"] == "OBJECT"
+    item = gemini["properties"]["blocks"]["items"]
+    assert item["properties"]["id"] == {"type": "INTEGER"}
+    assert item["required"] == ["id", "translated_text"]
+
+
+def test_parse_structured_blocks_requires_exact_shape() -> None:
+    data = {
+        "blocks": [
+            {"id": 1, "translated_text": "世界"},
+            {"id": 0, "translated_text": "你好"},
+        ]
+    }
+    assert parse_structured_blocks(data, 2) == ["你好", "世界"]
+    assert parse_structured_blocks(data, 3) is None
+    duplicate = {"blocks": [{"id": 0, "translated_text": "a"}] * 2}
+    assert parse_structured_blocks(duplicate, 2) is None
+
+
+def test_load_structured_response_tracks_success_rate() -> None:
+    reset_structured_output_stats()
+    valid = json.dumps({"blocks": [{"id": 0, "translated_text": "你好"}]})
+    assert load_structured_response(valid, 1, "ollama", "qwen")["blocks"] == [
+        {"id": 0, "translated_text": "你好"}
+    ]
+    fallback = load_structured_response(
+        '```json\n{"blocks": []}\n```', 1, "ollama", "qwen"
+    )
+    assert fallback == {"blocks": []}
+
+    assert get_structured_output_stats() == [
+        {
+            "provider": "ollama",
+            "model": "qwen",
+            "requests": 2,
+            "valid": 1,
+            "success_rate": 0.5,
+        }
+    ]
+
+
+def test_ollama_structured_mode_sends_schema_and_skips_batch(monkeypatch) -> None:
+    monkeypatch.setattr(llm_schema, "_STATS", {})
+    monkeypatch.setattr(llm_client_ollama.settings, "llm_structured_output", True)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.read())
+        seen.append((request.url.path, body))
+        content = json.dumps(
+            {
+                "blocks": [
+                    {"id": 0, "translated_text": "你好"},
+                    {"id": 1, "translated_text": "世界"},
+                ]
+            }
+        )
+        return httpx.Response(200, json={"message": {"content": content}})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        llm_client_ollama, "get_sync_client", lambda provider, base_url: client
+    )
+    translator = OllamaTranslator("qwen", "http://schema-host:11434")
+
+    result = translate_ollama(
+        translator, BLOCKS, "zh-TW", None, None, None, None, False
+    )
+
+    assert [path for path, _ in seen] == ["/api/chat"]
+    assert seen[0][1]["format"]["properties"]["blocks"]["maxItems"] == 2
+    assert [block["translated_text"] for block in result["blocks"]] == [
+        "你好",
+        "世界",
+    ]
+    assert get_structured_output_stats()[0]["success_rate"] == 1.0
+    client.close()
+
+
+def test_gemini_structured_mode_sends_response_schema(monkeypatch) -> None:
+    monkeypatch.setattr(llm_schema, "_STATS", {})
+    monkeypatch.setattr(llm_client_gemini.settings, "llm_structured_output", True)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.read()))
+        text = json.dumps({"blocks": [{"id": 0, "translated_text": "你好"}]})
+        return httpx.Response(
+            200,
+            json={"candidates": [{"content": {"parts": [{"text": text}]}}]},
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        llm_client_gemini, "get_sync_client", lambda provider, base_url: client
+    )
+    translator = GeminiTranslator("key", "http://gemini", "gemini-flash")
+
+    result = translator.translate(BLOCKS[:1], "zh-TW")
+
+    config = seen[0]["generationConfig"]
+    assert config["responseSchema"]["properties"]["blocks"]["maxItems"] == 1
+    assert result == {"blocks": [{"id": 0, "translated_text": "你好"}]}
+    assert get_structured_output_stats()[0]["provider"] == "gemini"
+    client.close()
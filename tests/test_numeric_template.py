@@ -0,0 +1,190 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from backend.services import translate_chunk_cache, translate_llm, translate_retry
+from backend.services.llm_contract import build_contract
+from backend.services.numeric_template import (
+    NumericTemplates,
+    fill_template,
+    make_template,
+    slots_intact,
+)
+from backend.services.translation_cache import TranslationCache
+
+def test_make_template_types_slots() -> None:
+    assert make_template("Page 3 of 42") == ("Page __NUM_0__ of __NUM_1__", ["3", "42"])
+    assert make_template("Q3 2025 Revenue: 1,234") == (
+        "Q3 __NUM_0__ Revenue: __NUM_1__",
+        ["2025", "1,234"],
+    )
+    assert make_template("Due 2025-03-31, total US$ 1,200.50") == (
+        "Due __DATE_0__, total __AMT_1__",
+        ["2025-03-31", "US$ 1,200.50"],
+    )
+    assert make_template("第3頁") == ("第__NUM_0__頁", ["3"])
+    # Numbers glued to letters are part of a name, not a value.
+    assert make_template("COVID-19 on 4G") == ("COVID-19 on 4G", [])
+
+
+def test_fill_template_validates_slots() -> None:
+    values = ["3", "42"]
+    assert fill_template("第 __NUM_0__ 頁，共 __NUM_1__ 頁", values) == "第 3 頁，共 42 頁"
+    assert fill_template("共 __NUM_1__ 頁之第 __NUM_0__ 頁", values) == "共 42 頁之第 3 頁"
+    assert fill_template("第 __NUM_0__ 頁", values) is None
+    assert fill_template("__NUM_0__ __NUM_0__ __NUM_1__", values) is None
+    assert fill_template("__NUM_0__ __NUM_1__ __NUM_2__", values) is None
+
+
+def test_templates_are_cached_after_slot_check_and_never_saved_to_tm(
+    monkeypatch,
+) -> None:
+    saved = []
+    monkeypatch.setattr(translate_retry, "save_tm", lambda **kwargs: saved.append(kwargs))
+    chunk = [
+        (0, {"source_text": "Page __NUM_0__ of __NUM_1__"}),
+        (1, {"source_text": "Slide __NUM_0__"}),
+        (2, {"source_text": "Hello"}),
+    ]
+    result = {
+        "blocks": [
+            {"translated_text": "第 __NUM_0__ 頁，共 __NUM_1__ 頁"},
+            {"translated_text": "投影片"},  # lost its slot
+            {"translated_text": "你好"},
+        ]
+    }
+    translated = [None] * 3
+    cache: dict[str, str] = {}
+    translate_retry.apply_translation_results(
+        chunk, [{}, {}, {}], result, translated, cache, None, "zh-TW", True
+    )
+
+    assert sorted(cache.values()) == sorted(["第 __NUM_0__ 頁，共 __NUM_1__ 頁", "你好"])
+    assert [(entry["text"], entry["translated"]) for entry in saved] == [("Hello", "你好")]
+    assert not slots_intact("Slide __NUM_0__", "投影片")
+
+
+def test_templates_share_one_translation() -> None:
+    blocks = [{"source_text": f"Slide {n}"} for n in (1, 2, 3)] + [{"source_text": "Hi"}]
+    templates = NumericTemplates()
+    templated = templates.apply(blocks)
+    pending = templates.dedupe(list(enumerate(templated)))
+    assert [idx for idx, _ in pending] == [0, 3]
+
+    translated = [None] * 4
+    translated[0] = "投影片 __NUM_0__"
+    expanded = templates.fill(pending[:1], translated)
+    assert [idx for idx, _ in expanded] == [0, 1, 2]
+    assert translated[:3] == ["投影片 1", "投影片 2", "投影片 3"]
+    assert templates.take_failed(blocks) == []
+
+
+class _Translator:
+    def __init__(self, drop_slots: bool = False) -> None:
+        self.drop_slots = drop_slots
+        self.calls: list[list[str]] = []
+
+    def translate(self, blocks, target_language, **kwargs):
+        self.calls.append([block["source_text"] for block in blocks])
+        texts = []
+        for block in blocks:
+            text = block["source_text"].replace("Page ", "第 ").replace(" of ", " 頁，共 ")
+            text += " 頁"
+            if self.drop_slots and "__NUM_1__" in text:
+                text = text.replace("__NUM_1__", "")
+            texts.append(text)
+        return build_contract(blocks, target_language, translated_texts=texts)
+
+
+@pytest.mark.parametrize("drop_slots", [False, True])
+def test_translate_blocks_sends_template_once(monkeypatch, drop_slots) -> None:
+    translator = _Translator(drop_slots)
+    monkeypatch.setattr(
+        translate_llm, "_resolve_translator", lambda *args: ("openai", translator)
+    )
+    monkeypatch.setattr(
+        translate_llm, "align_bilingual_blocks", lambda blocks, *args, **kwargs: blocks
+    )
+    blocks = [
+        {"source_text": f"Page {n} of 42", "slide_index": n, "client_id": str(n)}
+        for n in (1, 2, 3)
+    ]
+    result = translate_llm.translate_blocks(
+        blocks,
+        target_language="zh-TW",
+        use_tm=False,
+        mode="real",
+        param_overrides={
+            "refresh": True,
+            "skip_target_language": False,
+            "numeric_templates": True,
+            "context_strategy": "none",
+            "failover_chain": "",
+        },
+    )
+    texts = [block["translated_text"] for block in result["blocks"]]
+    if drop_slots:
+        # The template lost a slot: every block is translated as is.
+        assert translator.calls[0] == ["Page __NUM_0__ of __NUM_1__"]
+        assert translator.calls[-1] == [f"Page {n} of 42" for n in (1, 2, 3)]
+        assert texts == [f"第 {n} 頁，共 42 頁" for n in (1, 2, 3)]
+    else:
+        assert translator.calls == [["Page __NUM_0__ of __NUM_1__"]]
+        assert texts == [f"第 {n} 頁，共 42 頁" for n in (1, 2, 3)]
+
+
+@pytest.mark.asyncio
+async def test_async_progress_covers_shared_blocks() -> None:
+    blocks = [
+        {"source_text": f"Slide {n}", "slide_index": n, "client_id": str(n)}
+        for n in (1, 2, 3)
+    ]
+    events = []
+    result = await translate_llm.translate_blocks_async(
+        blocks,
+        target_language="zh-TW",
+        provider="mock",
+        use_tm=False,
+        on_progress=events.append,
+        param_overrides={"refresh": True, "numeric_templates": True},
+    )
+    assert [block["translated_text"] for block in result["blocks"]] == [
+        "Slide 1",
+        "Slide 2",
+        "Slide 3",
+    ]
+    assert [event["completed_ids"] for event in events] == [["1", "2", "3"]]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_chunk_cache_skips_templates_that_lost_a_slot(
+    tmp_path, monkeypatch, use_async
+) -> None:
+    store = TranslationCache()
+    monkeypatch.setattr(store, "db_path", tmp_path / "cache.db")
+    store._init_db()
+    blocks = [{"source_text": "Slide __NUM_0__"}]
+
+    def dispatch(translator, provider, chunk, target_language, *args, **kwargs):
+        return build_contract(chunk, target_language, translated_texts=["投影片"])
+
+    async def dispatch_async(*args, **kwargs):
+        return dispatch(*args, **kwargs)
+
+    call = (
+        translate_chunk_cache.translate_and_cache_blocks_async
+        if use_async
+        else translate_chunk_cache.translate_and_cache_blocks
+    )
+    result = call(
+        None, "openai", blocks, [0], [None], "zh-TW", None, [], [], None, True,
+        {"model": "gpt"}, dispatch_async if use_async else dispatch,
+    )
+    if use_async:
+        result = asyncio.run(result)
+
+    assert result["blocks"][0]["translated_text"] == "投影片"
+    with sqlite3.connect(store.db_path) as conn:
+        rows = conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+    assert rows == 0
@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.services import llm_client_ollama, ollama_pool
+from backend.services.llm_client_ollama import OllamaTranslator
+from backend.services.ollama_pool import OllamaHostPool, parse_base_urls
+
+def test_parse_base_urls_splits_and_dedupes() -> None:
+    spec = "http://gpu1:11434/, http://gpu2:11434,,http://gpu1:11434"
+    assert parse_base_urls(spec) == ["http://gpu1:11434", "http://gpu2:11434"]
+
+
+def test_pool_routes_to_least_outstanding_healthy_host() -> None:
+    pool = OllamaHostPool(["http://a", "http://b", "http://c"])
+    first, second, third = pool.acquire(), pool.acquire(), pool.acquire()
+    assert {first.base_url, second.base_url, third.base_url} == {
+        "http://a",
+        "http://b",
+        "http://c",
+    }
+
+    pool.release(second)
+    assert pool.acquire() is second
+
+    request = httpx.Request("POST", "http://c/api/chat")
+    pool.release(third, httpx.ConnectError("down", request=request))
+    pool.release(first)
+    pool.release(second)
+    picked = {pool.acquire().base_url for _ in range(4)}
+    assert picked == {"http://a", "http://b"}
+
+
+def test_translator_sends_keep_alive_to_routed_host(monkeypatch) -> None:
+    monkeypatch.setattr(ollama_pool.settings, "ollama_keep_alive", "45m")
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.read()))
+        return httpx.Response(200, json={"response": "ok"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        llm_client_ollama, "get_sync_client", lambda provider, base_url: client
+    )
+
+    translator = OllamaTranslator("qwen", "http://gpu-a:11434,http://gpu-b:11434")
+    translator.translate_plain("hi")
+    translator.translate_plain("hi")
+
+    assert [url for url, _ in seen] == [
+        "http://gpu-a:11434/api/generate",
+        "http://gpu-b:11434/api/generate",
+    ]
+    assert b'"keep_alive":"45m"' in seen[0][1].replace(b" ", b"")
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_maintain_hosts_checks_health_and_warms_model(monkeypatch) -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.url.host, request.url.path))
+        if request.url.host == "down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        ollama_pool, "get_async_client", lambda provider, base_url: client
+    )
+    spec = "http://up:11434,http://down:11434"
+
+    await ollama_pool.maintain_hosts(spec, "qwen")
+
+    pool = ollama_pool.get_host_pool(spec)
+    assert [host.healthy for host in pool.hosts] == [True, False]
+    assert ("up", "/api/generate") in calls
+    assert ("down", "/api/generate") not in calls
+    assert pool.hosts[0].warmed_at > 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_other_pools_are_only_health_checked(monkeypatch) -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.url.host, request.url.path))
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        ollama_pool, "get_async_client", lambda provider, base_url: client
+    )
+    monkeypatch.setattr(ollama_pool.settings, "ollama_base_url", "http://main:11434")
+    monkeypatch.setattr(ollama_pool.settings, "llm_provider", "ollama")
+    monkeypatch.setattr(ollama_pool.settings, "ollama_health_interval", 0)
+    other = ollama_pool.get_host_pool("http://request-only:11434")
+    other.mark(other.hosts[0], False, "refused")
+
+    await ollama_pool.ollama_maintenance_task()
+
+    assert ("main", "/api/generate") in calls
+    assert ("request-only", "/api/tags") in calls
+    assert ("request-only", "/api/generate") not in calls
+    assert other.hosts[0].healthy
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_maintenance_is_cancelled_on_shutdown(monkeypatch) -> None:
+    started = asyncio.Event()
+
+    async def forever():
+        started.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(ollama_pool, "ollama_maintenance_task", forever)
+    monkeypatch.setattr(ollama_pool.settings, "ollama_base_url", "http://main:11434")
+    ollama_pool.start_maintenance()
+    task = ollama_pool._MAINTENANCE
+    ollama_pool.start_maintenance()
+    assert ollama_pool._MAINTENANCE is task
+    await started.wait()
+
+    await ollama_pool.stop_maintenance()
+    assert task.cancelled()
+    assert ollama_pool._MAINTENANCE is None
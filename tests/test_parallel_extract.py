@@ -0,0 +1,67 @@
+import zipfile
+from pathlib import Path
+
+import openpyxl
+
+from backend.services.parallel_extract import _batches, assign_block_ids, run_units
+from backend.services.pptx.extract_stream import _Deck, extract_slide_units
+from backend.services.xlsx.extract_stream import extract_sheet_groups
+
+SAMPLE = Path(__file__).parent / "fixtures" / "sample.pptx"
+
+
+def test_batches_are_contiguous_and_cover_all_units():
+    batches = _batches(10, 4)
+    assert batches == [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]]
+    assert _batches(2, 4) == [[0], [1]]
+
+
+def test_assign_block_ids_counts_per_unit_and_keeps_existing():
+    blocks = [
+        {"slide_index": 0},
+        {"slide_index": 1},
+        {"slide_index": 0, "client_id": "keep"},
+        {"slide_index": 0},
+    ]
+    ids = [block["client_id"] for block in assign_block_ids(blocks, "pdf")]
+    assert ids == ["pdf-0-1", "pdf-1-1", "keep", "pdf-0-3"]
+
+
+def test_run_units_in_process_for_small_documents():
+    calls = []
+
+    def unit_func(source, indices):
+        calls.append(indices)
+        return [[{"unit": index}] for index in indices]
+
+    result = run_units(unit_func, "doc", 3, workers=4, min_units=16)
+    assert calls == [[0, 1, 2]]
+    assert result == [[{"unit": 0}], [{"unit": 1}], [{"unit": 2}]]
+
+
+def test_pptx_slides_in_pool_match_sequential():
+    with zipfile.ZipFile(SAMPLE) as archive:
+        unit_count = _Deck(archive).unit_count
+    sequential = extract_slide_units(str(SAMPLE), list(range(unit_count)))
+    parallel = run_units(
+        extract_slide_units, str(SAMPLE), unit_count, workers=2, min_units=1
+    )
+    assert parallel == sequential
+
+
+def test_xlsx_sheets_in_pool_match_sequential(tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.title = "Sheet0"
+    for sheet_index in range(4):
+        ws = wb.active if sheet_index == 0 else wb.create_sheet(f"Sheet{sheet_index}")
+        for row in range(1, 4):
+            ws.cell(row=row, column=1, value=f"Sheet {sheet_index} row {row}")
+    path = tmp_path / "multi.xlsx"
+    wb.save(path)
+
+    sequential = extract_sheet_groups(str(path), [0, 1, 2, 3])
+    parallel = run_units(extract_sheet_groups, str(path), 4, workers=2, min_units=1)
+    assert parallel == sequential
+    assert [unit[0]["source_text"] for unit in parallel] == [
+        f"Sheet {index} row 1" for index in range(4)
+    ]
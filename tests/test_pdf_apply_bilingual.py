@@ -0,0 +1,35 @@
+import fitz
+
+from backend.contracts import make_block
+from backend.services.pdf.apply import apply_bilingual
+
+def _block(shape_id, source, translated, y):
+    block = make_block(
+        0, shape_id, "pdf_text_block", source, translated,
+        x=70.0, y=y, width=300.0, height=60.0,
+    )
+    block["font_size"] = 12.0
+    return block
+
+
+def test_pdf_bilingual_does_not_repeat_pass_through_blocks(tmp_path):
+    source = tmp_path / "in.pdf"
+    out = tmp_path / "out.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 100), "Quarterly report")
+    page.insert_text((72, 200), "Annual summary")
+    doc.save(source)
+    doc.close()
+
+    blocks = [
+        _block(1, "Quarterly report", "Bao cao quy", 85.0),
+        _block(2, "Annual summary", "Annual summary", 185.0),
+    ]
+    apply_bilingual(str(source), str(out), blocks)
+
+    result = fitz.open(out)
+    text = result[0].get_text()
+    result.close()
+    assert "Bao cao quy" in text
+    assert text.count("Annual summary") == 1
@@ -0,0 +1,99 @@
+import io
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+from backend.services.pptx.extract import extract_blocks
+from backend.services.pptx.extract_stream import extract_blocks_stream
+
+SAMPLE = Path(__file__).parent / "fixtures" / "sample.pptx"
+
+
+def _build_deck() -> io.BytesIO:
+    presentation = Presentation()
+    # Title and content placeholders inherit their position from the layout.
+    slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+    slide.shapes.title.text = "Quarterly review"
+    slide.placeholders[1].text = "Revenue grew\vacross regions\nCosts stayed flat"
+
+    group = slide.shapes.add_group_shape()
+    inner = group.shapes.add_textbox(Inches(1), Inches(5), Inches(3), Inches(1))
+    inner.text = "Grouped caption text"
+
+    table = slide.shapes.add_table(2, 2, Inches(5), Inches(5), Inches(4), Inches(1)).table
+    table.cell(0, 0).text = "Region name"
+    table.cell(1, 1).text = "Northern plant"
+    slide.notes_slide.notes_text_frame.text = "Speaker notes here"
+
+    blank = presentation.slides.add_slide(presentation.slide_layouts[6])
+    blank.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text = "Second slide"
+
+    stream = io.BytesIO()
+    presentation.save(stream)
+    stream.seek(0)
+    return stream
+
+
+def _assert_parity(source) -> None:
+    expected = extract_blocks(source, engine="python-pptx")
+    if hasattr(source, "seek"):
+        source.seek(0)
+    actual = extract_blocks_stream(source)
+    assert actual["slide_width"] == expected["slide_width"]
+    assert actual["slide_height"] == expected["slide_height"]
+    assert actual["blocks"] == expected["blocks"]
+
+
+def test_stream_engine_matches_python_pptx_on_sample() -> None:
+    _assert_parity(str(SAMPLE))
+
+
+def test_stream_engine_matches_python_pptx_on_generated_deck() -> None:
+    deck = _build_deck()
+    _assert_parity(deck)
+    deck.seek(0)
+    blocks = extract_blocks_stream(deck)["blocks"]
+    title = blocks[0]
+    # Inherited from the layout placeholder, not 0.
+    assert title["source_text"] == "Quarterly review" and title["width"] > 0
+    assert "Revenue grew\vacross regions" in blocks[1]["source_text"]
+    assert [b["block_type"] for b in blocks if b["slide_index"] == 0] == [
+        "textbox",
+        "textbox",
+        "textbox",
+        "table_cell",
+        "table_cell",
+        "notes",
+    ]
+
+
+def test_stream_engine_reads_chart_text() -> None:
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    chart_data = CategoryChartData()
+    chart_data.categories = ["North region", "South region"]
+    chart_data.add_series("Revenue forecast", (1.5, 2.5))
+    slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED,
+        Inches(1),
+        Inches(1),
+        Inches(6),
+        Inches(4),
+        chart_data,
+    )
+    stream = io.BytesIO()
+    presentation.save(stream)
+    stream.seek(0)
+
+    blocks = [b for b in extract_blocks_stream(stream)["blocks"] if b["slide_index"] == 0]
+    assert len(blocks) == 1
+    assert blocks[0]["block_type"] == "complex_graphic"
+    assert blocks[0]["x"] == 72.0
+    assert set(blocks[0]["source_text"].split("\n")) == {
+        "Revenue forecast",
+        "North region",
+        "South region",
+    }
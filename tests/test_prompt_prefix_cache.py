@@ -0,0 +1,76 @@
+import json
+
+from backend.services import llm_client_openai
+from backend.services.llm_client_base import TranslationConfig
+from backend.services.llm_client_openai import OpenAITranslator
+from backend.services.llm_prompt import build_prompt
+from backend.services.token_tracker import estimate_cost
+
+CONTRACT = {"blocks": [{"slide_index": 1, "source_text": ""}]}
+TERMS = [("Revenue", "營收"), ("Margin", "毛利")]
+
+
+def _prompt(text: str, slide: int, compact: bool = False) -> str:
+    context = {
+        "strategy": "summary",
+        "deck_summary": {"topic": "Q3 results"},
+        "current_slides": [slide],
+    }
+    return build_prompt(
+        [{"slide_index": slide, "source_text": text}],
+        "zh-TW",
+        CONTRACT,
+        context,
+        preferred_terms=TERMS,
+        compact=compact,
+    )
+
+
+def test_chunks_share_everything_but_the_last_payload_line() -> None:
+    first = _prompt("Revenue grew", 1)
+    second = _prompt("Costs fell", 7)
+
+    first_prefix, first_chunk = first.rsplit("\n", 1)
+    second_prefix, second_chunk = second.rsplit("\n", 1)
+    assert first_prefix == second_prefix
+    assert '"deck_summary"' in first_prefix
+    assert '"preferred_terms"' in first_prefix
+    assert json.loads(first_chunk)["blocks"][0]["source_text"] == "Revenue grew"
+    assert json.loads(second_chunk)["context"] == {
+        "strategy": "summary",
+        "current_slides": [7],
+    }
+
+
+def test_compact_prompt_keeps_stable_prefix() -> None:
+    first = _prompt("Revenue grew", 1, compact=True)
+    second = _prompt("Costs fell", 2, compact=True)
+    assert first.rsplit("\n", 1)[0] == second.rsplit("\n", 1)[0]
+
+
+def test_cached_tokens_lower_estimated_cost() -> None:
+    full = estimate_cost("gpt-4o", 1_000_000, 0)
+    cached = estimate_cost("gpt-4o", 1_000_000, 0, cached_tokens=800_000)
+    assert cached == 1.5
+    assert full == 2.5
+
+
+def test_openai_usage_records_cached_tokens(monkeypatch) -> None:
+    recorded = {}
+    monkeypatch.setattr(
+        llm_client_openai, "record_usage", lambda **kwargs: recorded.update(kwargs)
+    )
+    translator = OpenAITranslator(
+        TranslationConfig(model="gpt-4o-mini", api_key="x", base_url="http://x")
+    )
+    translator._record_usage(
+        {
+            "usage": {
+                "prompt_tokens": 1200,
+                "completion_tokens": 80,
+                "prompt_tokens_details": {"cached_tokens": 1024},
+            }
+        }
+    )
+    assert recorded["cached_tokens"] == 1024
+    assert recorded["prompt_tokens"] == 1200
@@ -0,0 +1,66 @@
+import pytest
+
+from backend.services import token_estimator
+from backend.services.llm_utils import chunked_by_tokens
+from backend.services.token_estimator import TokenEstimator, script_counts
+from backend.services.token_tracker import estimate_tokens
+from backend.services.translate_llm import _plan_chunks
+
+@pytest.fixture
+def estimator(tmp_path, monkeypatch):
+    instance = TokenEstimator(tmp_path / "token_calibration.json")
+    monkeypatch.setattr(token_estimator, "_ESTIMATOR", instance)
+    return instance
+
+
+def test_script_counts_split_cjk_and_vietnamese() -> None:
+    counts = script_counts(["abc 你好", "Tiếng Việt", ""])
+    assert counts[0].tolist() == [4, 0, 2, 0, 1]
+    assert counts[1][:3].tolist() == [8, 2, 0]  # ế and ệ
+    assert counts[2].sum() == 0
+
+
+def test_default_rates_weight_cjk_above_flat_estimate(estimator) -> None:
+    text = "這是一份關於半導體製程的季度報告" * 4
+    assert estimator.estimate_text(text) > 2 * estimate_tokens(text)
+    assert estimator.estimate(["hello world", ""]).tolist() == [3, 0]
+
+
+def test_observations_calibrate_rates_per_model(estimator) -> None:
+    # A tokenizer that spends 2 tokens per CJK char and 1 per 3 ASCII chars.
+    samples = ["季度報告 quarterly report " * n for n in range(1, 40)]
+    for text in samples:
+        counts = script_counts([text])[0]
+        estimator.observe("qwen", text, int(counts[2] * 2 + counts[0] / 3))
+
+    text = "營收成長 revenue growth" * 10
+    counts = script_counts([text])[0]
+    actual = counts[2] * 2 + counts[0] / 3
+    assert estimator.estimate_text(text, "qwen") == pytest.approx(actual, rel=0.1)
+    assert estimator.estimate_text(text, "gpt") < actual * 0.8
+    assert estimator.snapshot()["qwen"]["samples"] == 39
+
+    estimator.save()
+    reloaded = TokenEstimator(estimator.path)
+    assert reloaded.estimate_text(text, "qwen") == estimator.estimate_text(
+        text, "qwen"
+    )
+
+
+def test_chunked_by_tokens_closes_chunks_at_budget() -> None:
+    items = [(i, {}) for i in range(5)]
+    chunks = list(chunked_by_tokens(items, 3, [40, 40, 40, 200, 10], 100))
+    assert [[i for i, _ in chunk] for chunk in chunks] == [[0, 1], [2], [3], [4]]
+
+
+def test_plan_chunks_uses_token_budget(estimator) -> None:
+    pending = [
+        (0, {"source_text": "短" * 60}),
+        (1, {"source_text": "短" * 60}),
+        (2, {"source_text": "short"}),
+    ]
+    params = {"chunk_max_tokens": 100, "model": None}
+    assert [len(chunk) for chunk in _plan_chunks(pending, 40, params)] == [1, 2]
+    params["chunk_max_tokens"] = 0
+    assert [len(chunk) for chunk in _plan_chunks(pending, 40, params)] == [3]
+
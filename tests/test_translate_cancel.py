@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from backend.services.translate_cancel import (
+    CancellationToken,
+    TranslationCancelled,
+    cancel_job,
+    get_job,
+    register_job,
+    unregister_job,
+)
+from backend.services.translate_llm import translate_blocks_async
+
+@pytest.mark.asyncio
+async def test_token_run_aborts_in_flight_work():
+    token = CancellationToken()
+    started = asyncio.Event()
+    finished = []
+
+    async def slow_request():
+        started.set()
+        await asyncio.sleep(10)
+        finished.append(True)
+
+    async def cancel_soon():
+        await started.wait()
+        token.cancel("client_disconnected")
+
+    canceller = asyncio.create_task(cancel_soon())
+    with pytest.raises(TranslationCancelled):
+        await token.run(slow_request())
+    await canceller
+
+    assert finished == []
+    assert token.reason == "client_disconnected"
+
+
+@pytest.mark.asyncio
+async def test_token_run_returns_result_when_not_cancelled():
+    token = CancellationToken()
+
+    async def quick():
+        return 42
+
+    assert await token.run(quick()) == 42
+
+
+@pytest.mark.asyncio
+async def test_translate_blocks_async_stops_after_cancel():
+    blocks = [
+        {"source_text": f"CancelBlock{i}", "slide_index": i} for i in range(4)
+    ]
+    token = CancellationToken()
+    progress_calls = []
+
+    async def on_progress(data):
+        progress_calls.append(data)
+        token.cancel("user")
+
+    with pytest.raises(TranslationCancelled):
+        await translate_blocks_async(
+            blocks,
+            target_language="zh-TW",
+            provider="mock",
+            use_tm=False,
+            on_progress=on_progress,
+            param_overrides={
+                "chunk_size": 1,
+                "single_request": False,
+                "chunk_delay": 0.05,
+            },
+            cancel_token=token,
+        )
+
+    # Only the first chunk completed; the remaining ones were aborted.
+    assert len(progress_calls) == 1
+
+
+def test_cancel_job_registry():
+    job = register_job()
+    try:
+        assert get_job(job.job_id) is job
+        assert cancel_job(job.job_id) is True
+        assert job.token.cancelled
+        assert job.token.reason == "user"
+    finally:
+        unregister_job(job.job_id)
+
+    assert get_job(job.job_id) is None
+    assert cancel_job(job.job_id) is False
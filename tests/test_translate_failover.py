@@ -0,0 +1,205 @@
+import asyncio
+
+import pytest
+
+from backend.services.llm_contract import build_contract
+from backend.services.translate_chunk import translate_chunk_async
+from backend.services.translate_failover import (
+    FailoverChain,
+    FailoverLink,
+    LatencyTracker,
+    parse_failover_chain,
+)
+
+class _FakeTranslator:
+    def __init__(self, prefix: str, delay: float = 0.0, fail: bool = False):
+        self.prefix = prefix
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def translate_async(self, blocks, target_language, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ValueError("primary down")
+        blocks = list(blocks)
+        return build_contract(
+            blocks,
+            target_language,
+            [f"{self.prefix}:{b['source_text']}" for b in blocks],
+        )
+
+
+def _params(chain: FailoverChain) -> dict:
+    return {
+        "max_retries": 0,
+        "backoff": 0,
+        "max_backoff": 0,
+        "model": "failover-test",
+        "refresh": True,
+        "failover": chain,
+    }
+
+
+async def _run(primary, chain):
+    return await translate_chunk_async(
+        primary,
+        "openai",
+        [{"source_text": "FailoverBlockA"}],
+        "en",
+        None,
+        [],
+        [],
+        None,
+        True,
+        _params(chain),
+        chunk_index=1,
+        fallback_on_error=False,
+        mode="real",
+    )
+
+
+def test_parse_failover_chain() -> None:
+    assert parse_failover_chain("Ollama:120, openai:60,gemini") == [
+        ("ollama", 120.0),
+        ("openai", 60.0),
+        ("gemini", None),
+    ]
+    with pytest.raises(ValueError):
+        parse_failover_chain("openai:soon")
+
+
+@pytest.mark.asyncio
+async def test_failover_used_after_retries_exhausted() -> None:
+    primary = _FakeTranslator("primary", fail=True)
+    secondary = _FakeTranslator("secondary")
+    chain = FailoverChain(
+        primary="openai",
+        links=[FailoverLink("gemini", secondary, timeout=5)],
+    )
+
+    result = await _run(primary, chain)
+
+    assert primary.calls == 1
+    assert result["blocks"][0]["translated_text"] == "secondary:FailoverBlockA"
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_takes_first_valid_answer(monkeypatch) -> None:
+    from backend.services import translate_failover
+
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record("openai", 0.01)
+    monkeypatch.setattr(translate_failover, "LATENCY", tracker)
+
+    primary = _FakeTranslator("primary", delay=2.0)
+    secondary = _FakeTranslator("secondary")
+    chain = FailoverChain(
+        primary="openai",
+        links=[FailoverLink("gemini", secondary)],
+        hedge=True,
+    )
+
+    result = await asyncio.wait_for(_run(primary, chain), timeout=1.0)
+
+    assert result["blocks"][0]["translated_text"] == "secondary:FailoverBlockA"
+
+
+@pytest.mark.asyncio
+async def test_hedge_ignores_invalid_contract(monkeypatch) -> None:
+    from backend.services import translate_failover
+
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record("openai", 0.01)
+    monkeypatch.setattr(translate_failover, "LATENCY", tracker)
+
+    class _EmptyTranslator(_FakeTranslator):
+        async def translate_async(self, blocks, target_language, **kwargs):
+            self.calls += 1
+            return {"blocks": []}
+
+    primary = _FakeTranslator("primary", delay=0.2)
+    secondary = _EmptyTranslator("secondary")
+    chain = FailoverChain(
+        primary="openai",
+        links=[FailoverLink("gemini", secondary)],
+        hedge=True,
+    )
+    monkeypatch.setattr(
+        translate_failover,
+        "dispatch_translate_async",
+        lambda translator, provider, blocks, target, *args, mode: (
+            translator.translate_async(blocks, target)
+        ),
+    )
+
+    result = await asyncio.wait_for(_run(primary, chain), timeout=2.0)
+
+    assert secondary.calls == 1
+    assert result["blocks"][0]["translated_text"] == "primary:FailoverBlockA"
+
+
+def test_sync_primary_timeout_fails_over(monkeypatch) -> None:
+    import time
+
+    from backend.services import translate_failover
+    from backend.services.translate_chunk import translate_chunk
+
+    def fake_dispatch(translator, provider, blocks, target, *args, mode):
+        if provider == "openai":
+            time.sleep(1.0)
+        return build_contract(
+            blocks, target, [f"{provider}:{b['source_text']}" for b in blocks]
+        )
+
+    monkeypatch.setattr(translate_failover, "dispatch_translate", fake_dispatch)
+    chain = FailoverChain(
+        primary="openai",
+        primary_timeout=0.05,
+        links=[FailoverLink("gemini", object(), timeout=5)],
+    )
+
+    started = time.perf_counter()
+    result = translate_chunk(
+        object(),
+        "openai",
+        [{"source_text": "FailoverSyncBlock"}],
+        "en",
+        None,
+        [],
+        [],
+        None,
+        True,
+        _params(chain),
+        chunk_index=1,
+        fallback_on_error=False,
+        mode="real",
+    )
+
+    assert time.perf_counter() - started < 0.9
+    assert result["blocks"][0]["translated_text"] == "gemini:FailoverSyncBlock"
+
+
+@pytest.mark.asyncio
+async def test_unhedged_primary_result_is_validated(monkeypatch) -> None:
+    from backend.services import translate_failover
+
+    # No latency samples yet: the primary is awaited without a hedge.
+    monkeypatch.setattr(translate_failover, "LATENCY", LatencyTracker(min_samples=5))
+
+    async def empty_dispatch(translator, provider, blocks, target, *args, mode):
+        return {"blocks": []}
+
+    monkeypatch.setattr(translate_failover, "dispatch_translate_async", empty_dispatch)
+    chain = FailoverChain(
+        primary="openai",
+        links=[FailoverLink("gemini", _FakeTranslator("secondary"))],
+        hedge=True,
+    )
+    dispatch = translate_failover.make_hedged_dispatch_async(chain)
+
+    with pytest.raises(ValueError, match="block count mismatch"):
+        await dispatch(
+            object(), "openai", [{"source_text": "x"}], "en", None, [], [], None, True
+        )
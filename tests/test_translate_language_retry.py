@@ -0,0 +1,79 @@
+import pytest
+
+from backend.services.llm_contract import build_contract
+from backend.services.translate_retry import (
+    find_language_mismatches,
+    retry_for_language,
+)
+
+ENGLISH = "The quarterly revenue report is ready for review"
+TAGALOG = "Katatuldugan ng PPT na kinutom na may awtorized kasambayanihan"
+VIETNAMESE = "Báo cáo doanh thu hàng quý đã sẵn sàng để xem xét"
+
+
+class _RetryTranslator:
+    def __init__(self, texts: dict[str, str]) -> None:
+        self.texts = texts
+        self.requests: list[list[str]] = []
+
+    def translate(self, blocks, target_language, **kwargs):
+        blocks = list(blocks)
+        sources = [b["source_text"] for b in blocks]
+        self.requests.append(sources)
+        return build_contract(
+            blocks, target_language, [self.texts[s] for s in sources]
+        )
+
+
+def _blocks(*texts: str) -> list[dict]:
+    return [{"source_text": text} for text in texts]
+
+
+def test_find_language_mismatches_skips_auto_target() -> None:
+    assert find_language_mismatches([ENGLISH, VIETNAMESE], "vi") == [0]
+    assert find_language_mismatches([ENGLISH], "auto") == []
+
+
+def test_retry_for_language_resends_only_mismatched_blocks() -> None:
+    blocks = _blocks("a", "b", "c")
+    result = build_contract(blocks, "vi", [VIETNAMESE, TAGALOG, VIETNAMESE])
+    translator = _RetryTranslator({"b": VIETNAMESE + " nữa"})
+
+    merged = retry_for_language(
+        translator, "openai", blocks, "vi", None, [], [], result
+    )
+
+    assert translator.requests == [["b"]]
+    assert [b["translated_text"] for b in merged["blocks"]] == [
+        VIETNAMESE,
+        VIETNAMESE + " nữa",
+        VIETNAMESE,
+    ]
+
+
+def test_retry_for_language_raises_when_chunk_stays_mismatched() -> None:
+    blocks = _blocks("a", "b")
+    result = build_contract(blocks, "vi", [TAGALOG, TAGALOG])
+    translator = _RetryTranslator({"a": TAGALOG, "b": ENGLISH})
+
+    with pytest.raises(ValueError, match="不符合目標語言"):
+        retry_for_language(translator, "openai", blocks, "vi", None, [], [], result)
+    assert translator.requests == [["a", "b"]]
+
+
+def test_language_retry_ignores_neutral_and_stray_blocks() -> None:
+    from backend.services.translate_retry import language_retry_indices
+
+    # Brand names kept verbatim are not mismatches.
+    blocks = _blocks("Microsoft Teams", "SKU-123", "x")
+    texts = ["Microsoft Teams", "SKU-123", VIETNAMESE]
+    assert language_retry_indices(blocks, texts, "vi") == []
+
+    # One stray English label in a mostly Vietnamese chunk is not worth
+    # a strict request.
+    blocks = _blocks(*"abcdefgh")
+    texts = [VIETNAMESE] * 7 + [ENGLISH]
+    assert language_retry_indices(blocks, texts, "vi") == []
+
+    texts = [VIETNAMESE] * 6 + [ENGLISH, TAGALOG]
+    assert language_retry_indices(blocks, texts, "vi") == [6, 7]
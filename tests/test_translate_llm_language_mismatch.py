@@ -20,6 +20,7 @@ def test_translate_blocks_raises_when_language_mismatch_persists(monkeypatch) ->
         preferred_terms=None,
         placeholder_tokens=None,
         language_hint=None,
+        mode="direct",
     ):
         blocks_list = list(blocks)
         return build_contract(
@@ -56,6 +57,9 @@ def test_translate_blocks_raises_when_language_mismatch_persists(monkeypatch) ->
     mock_settings.llm_retry_backoff = 0.8
     mock_settings.llm_retry_max_backoff = 8.0
     mock_settings.llm_chunk_size = 40
+    mock_settings.llm_chunk_max_tokens = 0
+    mock_settings.llm_skip_target_language = False
+    mock_settings.llm_numeric_templates = False
     mock_settings.llm_single_request = True
     mock_settings.llm_chunk_delay = 0.0
     mock_settings.llm_context_strategy = "none"
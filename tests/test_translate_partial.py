@@ -0,0 +1,106 @@
+import pytest
+
+from backend.services.llm_contract import build_contract
+from backend.services.llm_utils import safe_json_loads
+from backend.services.translate_chunk_dispatch import (
+    translate_ollama,
+    translate_standard,
+)
+from backend.services.translate_partial import PartialTranslationError
+from backend.services.translate_prompt import parse_ollama_batch_partial
+
+class _RecordingTranslator:
+    def __init__(self, batch_output: str = "", bad_text: str | None = None):
+        self.batch_output = batch_output
+        self.bad_text = bad_text
+        self.requests: list[list[str]] = []
+
+    def translate_plain(self, prompt: str) -> str:
+        return self.batch_output
+
+    def translate(self, blocks, target_language, **kwargs):
+        blocks = list(blocks)
+        texts = [b["source_text"] for b in blocks]
+        self.requests.append(texts)
+        if self.bad_text in texts:
+            raise ValueError("LLM response is not valid JSON")
+        return build_contract(blocks, target_language, [f"T:{t}" for t in texts])
+
+
+def _blocks(*texts: str) -> list[dict]:
+    return [{"source_text": text} for text in texts]
+
+
+def test_parse_ollama_batch_partial_keeps_present_blocks() -> None:
+    response = "<<<BLOCK:0>>>\n你好\n<<<END>>>\n\n<<<BLOCK:2>>>\n世界\n<<<END>>>\n"
+    assert parse_ollama_batch_partial(response, 3) == {0: "你好", 2: "世界"}
+
+
+def test_translate_ollama_rerequests_only_missing_blocks() -> None:
+    translator = _RecordingTranslator(
+        batch_output="<<<BLOCK:0>>>\nA-zh\n<<<END>>>\n<<<BLOCK:2>>>\nC-zh\n<<<END>>>"
+    )
+    result = translate_ollama(
+        translator, _blocks("A", "B", "C"), "zh-TW", None, [], [], None, True
+    )
+
+    assert translator.requests == [["B"]]
+    assert [b["translated_text"] for b in result["blocks"]] == [
+        "A-zh",
+        "T:B",
+        "C-zh",
+    ]
+
+
+def test_translate_standard_bisects_to_failing_block() -> None:
+    translator = _RecordingTranslator(bad_text="D")
+    blocks = _blocks("A", "B", "C", "D")
+
+    with pytest.raises(PartialTranslationError) as excinfo:
+        translate_standard(translator, blocks, "en", None, [], [], None, True)
+
+    assert excinfo.value.failed == [3]
+    assert excinfo.value.texts[:3] == ["T:A", "T:B", "T:C"]
+    assert translator.requests == [
+        ["A", "B", "C", "D"],
+        ["A", "B"],
+        ["C", "D"],
+        ["C"],
+        ["D"],
+    ]
+
+
+def test_safe_json_loads_salvages_truncated_blocks() -> None:
+    content = (
+        '{"blocks": [{"translated_text": "one"}, '
+        '{"translated_text": "two"}, {"translated_text": "th'
+    )
+    result = safe_json_loads(content)
+    assert [b["translated_text"] for b in result["blocks"]] == ["one", "two"]
+
+
+def test_retry_and_fallback_only_send_failed_blocks() -> None:
+    from backend.services.translate_chunk import translate_chunk
+
+    translator = _RecordingTranslator(bad_text="PartialRetryD")
+    blocks = _blocks(
+        "PartialRetryA", "PartialRetryB", "PartialRetryC", "PartialRetryD"
+    )
+    params = {
+        "max_retries": 1,
+        "backoff": 0,
+        "max_backoff": 0,
+        "model": "partial-test",
+        "refresh": True,
+    }
+
+    result = translate_chunk(
+        translator, "openai", blocks, "en", None, [], [], None, True, params,
+        chunk_index=1, fallback_on_error=True, mode="real",
+    )
+
+    # The retry re-requests only the failing block, even with refresh.
+    assert translator.requests[5:] == [["PartialRetryD"]]
+    texts = [b["translated_text"] for b in result["blocks"]]
+    assert texts[:3] == ["T:PartialRetryA", "T:PartialRetryB", "T:PartialRetryC"]
+    assert texts[3] and not texts[3].startswith("T:")
@@ -0,0 +1,74 @@
+import pytest
+
+from backend.services.translate_llm import translate_blocks_async
+from backend.services.translate_passthrough import (
+    split_target_language,
+    target_language_confidence,
+)
+
+ZH_TW = "這是我們的年度營運報告"
+
+
+def test_confidence_requires_target_script_and_variant() -> None:
+    assert target_language_confidence({"source_text": ZH_TW}, "zh-TW") == 1.0
+    assert target_language_confidence({"source_text": ZH_TW}, "zh") == 1.0
+    # Simplified characters must not pass through to a Traditional target.
+    assert target_language_confidence({"source_text": "这是我们的年度运营报告"}, "zh-TW") == 0
+    assert target_language_confidence({"source_text": "Quarterly report"}, "en") == 1.0
+    assert target_language_confidence({"source_text": "Quarterly report"}, "zh-TW") == 0
+    # Bilingual Vietnamese/Chinese blocks stay below the threshold.
+    mixed = {"source_text": "Báo cáo hoạt động 這是報告"}
+    assert target_language_confidence(mixed, "vi") < 0.9
+    assert target_language_confidence({"source_text": "OK"}, "en") == 0
+
+
+def test_split_keeps_aligned_blocks() -> None:
+    pending = [
+        (0, {"source_text": ZH_TW}),
+        (1, {"source_text": ZH_TW, "alignment_role": "target"}),
+        (2, {"source_text": "Revenue grew this year"}),
+    ]
+    keep, skipped = split_target_language(pending, "zh-TW", 0.9)
+    assert [idx for idx, _ in skipped] == [0]
+    assert [idx for idx, _ in keep] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_translate_reports_and_marks_pass_through() -> None:
+    blocks = [
+        {"source_text": ZH_TW, "slide_index": 0, "client_id": "a"},
+        {"source_text": "PassThroughEnglish sentence", "slide_index": 0, "client_id": "b"},
+    ]
+    events = []
+
+    async def on_progress(data):
+        events.append(data)
+
+    result = await translate_blocks_async(
+        blocks,
+        target_language="zh-TW",
+        provider="mock",
+        use_tm=False,
+        on_progress=on_progress,
+        param_overrides={
+            "chunk_size": 1,
+            "single_request": False,
+            "skip_target_language": True,
+        },
+    )
+
+    assert result["skipped_target_language"] == 1
+    assert result["blocks"][0]["pass_through"] is True
+    assert result["blocks"][0]["translated_text"] == ZH_TW
+    assert events[0]["skipped_target_language"] == 1
+    assert events[0]["completed_ids"] == ["a"]
+    assert [event["completed_ids"] for event in events[1:]] == [["b"]]
+
+    result = await translate_blocks_async(
+        blocks,
+        target_language="zh-TW",
+        provider="mock",
+        use_tm=False,
+        param_overrides={"skip_target_language": False},
+    )
+    assert result["skipped_target_language"] == 0
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from backend.services.translate_llm import _chunk_pending
+from backend.services.translate_priority import (
+    ChunkScheduler,
+    PriorityHint,
+    parse_priority_hint,
+    run_prioritized,
+    update_priority_hint,
+)
+
+def _pending(slides: int) -> list[tuple[int, dict]]:
+    return [
+        (i, {"slide_index": i, "client_id": f"c{i}", "source_text": f"t{i}"})
+        for i in range(slides)
+    ]
+
+
+def test_parse_priority_hint_ranks_client_ids_before_slides() -> None:
+    hint = parse_priority_hint('{"slides": [5, 3], "client_ids": ["c9"]}')
+    assert hint.slide_range == (3, 5)
+    assert hint.block_rank(9, {"client_id": "c9"}) < hint.block_rank(
+        3, {"slide_index": 3}
+    )
+    assert not hint.is_prioritized(0, {"slide_index": 0})
+
+    with pytest.raises(ValueError):
+        parse_priority_hint('{"slides": "3-5"}')
+
+
+def test_scheduler_reranks_pending_chunks_on_update() -> None:
+    chunks = [[item] for item in _pending(6)]
+    hint = PriorityHint(slide_range=(4, 5))
+    scheduler = ChunkScheduler(chunks, hint)
+
+    assert scheduler.pop() == 4
+    update_priority_hint(hint, '{"client_ids": ["c2"]}')
+    assert [scheduler.pop() for _ in range(5)] == [2, 0, 1, 3, 5]
+    assert scheduler.pop() is None
+
+
+def test_run_prioritized_starts_visible_chunks_first() -> None:
+    chunks = [[item] for item in _pending(4)]
+    started: list[int] = []
+
+    async def work(i: int) -> None:
+        started.append(i)
+        await asyncio.sleep(0)
+
+    async def run() -> None:
+        tasks = [work(i) for i in range(4)]
+        await run_prioritized(chunks, tasks, PriorityHint(slide_range=(2, 3)), 1)
+
+    asyncio.run(run())
+    assert started == [2, 3, 0, 1]
+
+
+def test_chunk_pending_splits_single_request_by_priority() -> None:
+    pending = _pending(5)
+    params = {"single_request": True}
+    chunks = _chunk_pending(pending, 5, params, PriorityHint(slide_range=(3, 4)))
+
+    assert [[i for i, _ in chunk] for chunk in chunks] == [[3, 4], [0, 1, 2]]
+    assert len(_chunk_pending(pending, 5, params, PriorityHint())) == 1
+
+
+def test_jobs_without_hint_keep_plain_dispatch() -> None:
+    from backend.services.translate_cancel import register_job, unregister_job
+
+    job = register_job()
+    try:
+        assert job.priority is None
+    finally:
+        unregister_job(job.job_id)
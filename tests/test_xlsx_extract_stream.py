@@ -0,0 +1,113 @@
+import zipfile
+
+import openpyxl
+
+from backend.services.xlsx.apply import apply_translations
+from backend.services.xlsx.extract import extract_blocks
+
+def _build_workbook(path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Summary"
+    ws["A1"] = "Quarterly report"
+    ws["B1"] = "Status"
+    ws["A2"] = "Status"
+    ws["C2"] = 12345  # numbers are never translated
+    ws["D3"] = "Hidden column note"
+    ws.column_dimensions["D"].hidden = True
+    ws["A4"] = "Hidden row note"
+    ws.row_dimensions[4].hidden = True
+
+    data = wb.create_sheet("Data")
+    for row in range(1, 6):
+        data.cell(row=row, column=1, value="Status")
+        data.cell(row=row, column=2, value=f"Item {row} description")
+
+    secret = wb.create_sheet("Secret")
+    secret["A1"] = "Internal only"
+    secret.sheet_state = "hidden"
+    wb.save(path)
+
+
+def _cells(blocks):
+    """(sheet, address, text) for every cell the blocks fill."""
+    result = set()
+    for block in blocks:
+        for sheet_name, address in block.get("cells") or [
+            [block["sheet_name"], block["cell_address"]]
+        ]:
+            result.add((sheet_name, address, block["source_text"]))
+    return result
+
+
+def test_stream_covers_the_same_cells_as_openpyxl(tmp_path):
+    path = tmp_path / "book.xlsx"
+    _build_workbook(path)
+
+    stream = extract_blocks(str(path), engine="stream")
+    full = extract_blocks(str(path), engine="openpyxl")
+
+    assert _cells(stream["blocks"]) == _cells(full["blocks"])
+    assert stream["sheet_count"] == full["sheet_count"] == 3
+    hidden = {b["source_text"]: b["is_hidden"] for b in stream["blocks"]}
+    assert hidden["Hidden column note"] is True
+    assert hidden["Hidden row note"] is True
+    assert hidden["Internal only"] is True
+    assert hidden["Quarterly report"] is False
+
+
+def test_stream_emits_one_block_per_distinct_text(tmp_path):
+    path = tmp_path / "book.xlsx"
+    _build_workbook(path)
+
+    blocks = extract_blocks(str(path), engine="stream")["blocks"]
+    texts = [b["source_text"] for b in blocks]
+    assert len(texts) == len(set(texts))
+
+    status = next(b for b in blocks if b["source_text"] == "Status")
+    assert status["sheet_name"] == "Summary"
+    assert status["cell_address"] == "B1"
+    assert status["cells"][:2] == [["Summary", "B1"], ["Summary", "A2"]]
+    assert len(status["cells"]) == 7
+    assert status["client_id"] == "xlsx-0-2"
+
+
+def test_apply_fills_every_cell_of_a_grouped_block(tmp_path):
+    path = tmp_path / "book.xlsx"
+    out = tmp_path / "out.xlsx"
+    _build_workbook(path)
+
+    blocks = extract_blocks(str(path), engine="stream")["blocks"]
+    for block in blocks:
+        block["translated_text"] = f"T:{block['source_text']}"
+    apply_translations(str(path), str(out), blocks)
+
+    wb = openpyxl.load_workbook(out)
+    assert wb["Summary"]["B1"].value == "T:Status"
+    assert wb["Summary"]["A2"].value == "T:Status"
+    assert [wb["Data"].cell(row=r, column=1).value for r in range(1, 6)] == [
+        "T:Status"
+    ] * 5
+    assert wb["Summary"]["C2"].value == 12345
+
+
+def test_stream_does_not_expand_xml_entities(tmp_path):
+    plain = tmp_path / "plain.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active["A1"] = "Hello PLACEHOLDER"
+    wb.save(plain)
+
+    path = tmp_path / "book.xlsx"
+    doctype = '<!DOCTYPE worksheet [<!ENTITY xxe "expanded entity">]>'
+    with zipfile.ZipFile(plain) as src, zipfile.ZipFile(path, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                xml = data.decode("utf-8")
+                start = xml.index("<worksheet")
+                xml = xml[:start] + doctype + xml[start:]
+                data = xml.replace("PLACEHOLDER", "&xxe;").encode("utf-8")
+            dst.writestr(item, data)
+
+    blocks = extract_blocks(str(path), engine="stream")["blocks"]
+    assert [b["source_text"] for b in blocks] == ["Hello"]
@@ -1,4 +1,10 @@
-from backend.services.extract_utils import is_numeric_only, is_technical_terms_only
+from backend.services import extract_utils
+from backend.services.extract_utils import (
+    classify_blocks,
+    is_garbage_text,
+    is_numeric_only,
+    is_technical_terms_only,
+)
 
 def test_is_numeric_only_happy_path():
     assert is_numeric_only("123.45") is True
@@ -30,3 +36,33 @@ def test_is_technical_terms_only_edge_cases():
 
     # Common words should not be technical terms (filtered by sentence_indicators)
     assert is_technical_terms_only("the") is False
+
+def test_classify_blocks_matches_filter_chain():
+    texts = [
+        "", "123.45", "API_KEY", "AppId", "the", "Hi",
+        "This is a normal sentence.", "你好世界", "3f2a9c1e-4b7d-4e0a-9b1c-2d3e4f5a6b7c",
+        "0x1234567890abcdef", "Chi phí hoạt động", "ID-999 #00661",
+        "營收 $$$ %%% ### 1234567890 !!!", "Revenue, Cost",
+    ]
+    expected = [
+        is_numeric_only(t) or is_technical_terms_only(t) or is_garbage_text(t)
+        for t in texts
+    ]
+    reasons = classify_blocks(texts)
+    assert [reason is not None for reason in reasons] == expected
+    assert reasons[:3] == ["empty", "numeric", "technical"]
+    assert reasons[8] == "garbage"
+
+def test_classify_blocks_memoizes_repeated_values(monkeypatch):
+    calls = []
+    original = extract_utils._classify
+
+    def counting(text, index):
+        calls.append(text)
+        return original(text, index)
+
+    monkeypatch.setattr(extract_utils, "_classify", counting)
+    assert classify_blocks(["Revenue", "USD", "Revenue", None, ""]) == [
+        None, "technical", None, "empty", "empty"
+    ]
+    assert calls == ["Revenue", "USD", ""]